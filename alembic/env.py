@@ -13,7 +13,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 # 설정 및 모델 import
 from app.core.config import settings
 from app.db.base import Base
-from app.db.models import Department, Manager, User, TermEmployee
+from app.db.models import Department, Manager, User, TermEmployee, TermEmployeeSummary
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,71 @@
+"""add term employee normalized name and chosung columns
+
+Revision ID: 0f2c9a0ae0dd
+Revises: 40b41eeca15a
+Create Date: 2026-10-19 11:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.hangul import normalize_name, to_chosung
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f2c9a0ae0dd'
+down_revision: Union[str, Sequence[str], None] = '40b41eeca15a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("term_employees", sa.Column("name_normalized", sa.String(length=255), nullable=True))
+    op.add_column("term_employees", sa.Column("name_chosung", sa.String(length=255), nullable=True))
+
+    # 기존 데이터 채우기
+    term_employees = sa.table(
+        "term_employees",
+        sa.column("term_employee_id", sa.BigInteger),
+        sa.column("name", sa.String),
+        sa.column("name_normalized", sa.String),
+        sa.column("name_chosung", sa.String),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(term_employees.c.term_employee_id, term_employees.c.name)).all()
+    if rows:
+        bind.execute(
+            term_employees.update()
+            .where(term_employees.c.term_employee_id == sa.bindparam("employee_id"))
+            .values(
+                name_normalized=sa.bindparam("normalized"),
+                name_chosung=sa.bindparam("chosung"),
+            ),
+            [
+                {"employee_id": employee_id, "normalized": normalize_name(name), "chosung": to_chosung(name)}
+                for employee_id, name in rows
+            ],
+        )
+
+    op.create_index(
+        "ix_term_employees_name_normalized",
+        "term_employees",
+        ["name_normalized"],
+        postgresql_ops={"name_normalized": "varchar_pattern_ops"},
+    )
+    op.create_index(
+        "ix_term_employees_name_chosung",
+        "term_employees",
+        ["name_chosung"],
+        postgresql_ops={"name_chosung": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_term_employees_name_chosung", table_name="term_employees")
+    op.drop_index("ix_term_employees_name_normalized", table_name="term_employees")
+    op.drop_column("term_employees", "name_chosung")
+    op.drop_column("term_employees", "name_normalized")
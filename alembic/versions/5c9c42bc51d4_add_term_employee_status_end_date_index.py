@@ -0,0 +1,33 @@
+"""add term employee status and end date index
+
+Revision ID: 5c9c42bc51d4
+Revises: 80e1aa5bec49
+Create Date: 2026-10-19 14:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c9c42bc51d4'
+down_revision: Union[str, Sequence[str], None] = '80e1aa5bec49'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 계약 만료 배치: status IN (...) AND employment_end_date < today
+    op.create_index(
+        "ix_term_employees_status_end_date",
+        "term_employees",
+        ["status", "employment_end_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_term_employees_status_end_date", table_name="term_employees")
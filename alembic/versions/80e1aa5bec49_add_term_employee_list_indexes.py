@@ -0,0 +1,39 @@
+"""add term employee list filter and keyset indexes
+
+Revision ID: 80e1aa5bec49
+Revises: 0f2c9a0ae0dd
+Create Date: 2026-10-19 12:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '80e1aa5bec49'
+down_revision: Union[str, Sequence[str], None] = '0f2c9a0ae0dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 컬럼) - 목록 필터 및 (정렬 키, ID) 키셋 페이지네이션용
+INDEXES = [
+    ("ix_term_employees_department_status_end", ["department_id", "status", "employment_end_date"]),
+    ("ix_term_employees_start_date_id", ["employment_start_date", "term_employee_id"]),
+    ("ix_term_employees_end_date_id", ["employment_end_date", "term_employee_id"]),
+    ("ix_term_employees_name_id", ["name", "term_employee_id"]),
+    ("ix_term_employees_position", ["position"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in INDEXES:
+        op.create_index(name, "term_employees", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="term_employees")
@@ -0,0 +1,39 @@
+"""add term employee summaries table
+
+Revision ID: b75395c66b42
+Revises: 5c9c42bc51d4
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b75395c66b42'
+down_revision: Union[str, Sequence[str], None] = '5c9c42bc51d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 집계 값은 애플리케이션 시작 시 계약 만료 배치가 전체 재계산으로 채움
+    op.create_table(
+        "term_employee_summaries",
+        sa.Column("department_id", sa.BigInteger(), nullable=False),
+        sa.Column("active_count", sa.Integer(), nullable=False),
+        sa.Column("on_leave_count", sa.Integer(), nullable=False),
+        sa.Column("expiring_count", sa.Integer(), nullable=False),
+        sa.Column("base_date", sa.Date(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["department_id"], ["departments.department_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("department_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("term_employee_summaries")
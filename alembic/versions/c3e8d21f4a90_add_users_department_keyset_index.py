@@ -0,0 +1,29 @@
+"""add users department keyset index
+
+Revision ID: c3e8d21f4a90
+Revises: b75395c66b42
+Create Date: 2026-10-19 16:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8d21f4a90'
+down_revision: Union[str, Sequence[str], None] = 'b75395c66b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 부서별 사용자 계정 목록 (부서 조건 + ID 순) 키셋 페이지네이션용
+    op.create_index("ix_users_department_id_user_id", "users", ["department_id", "user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_department_id_user_id", table_name="users")
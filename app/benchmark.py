@@ -0,0 +1,99 @@
+"""
+비밀번호 해싱 벤치마크 스크립트
+
+배포 서버에서 해싱 스킴/비용 프로필별 1회 해싱 지연 시간을 측정하여
+로그인 처리 용량을 산정하는 데 사용합니다.
+
+사용법:
+    python -m app.benchmark
+    python -m app.benchmark --iterations 20 --workers 4
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.services.password_service import ARGON2_PROFILES, build_crypt_context, get_argon2_params
+
+SAMPLE_PASSWORD = "benchmark-password-1234"
+
+
+def measure(context: CryptContext, iterations: int) -> List[float]:
+    """해싱 1회당 소요 시간 측정 (초)"""
+    # 백엔드 로딩 시간 제외
+    context.hash(SAMPLE_PASSWORD)
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        context.hash(SAMPLE_PASSWORD)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def candidates() -> List[Tuple[str, CryptContext]]:
+    """측정 대상 (현재 설정 + 모든 비용 프로필)"""
+    current = f"current ({settings.password_hash_scheme})"
+    result = [(current, build_crypt_context(settings.password_hash_scheme))]
+    result.append((
+        f"bcrypt (rounds={settings.bcrypt_rounds})",
+        build_crypt_context("bcrypt"),
+    ))
+    for name, params in ARGON2_PROFILES.items():
+        label = (
+            f"argon2id {name} (m={params['memory_cost']}KiB, "
+            f"t={params['time_cost']}, p={params['parallelism']})"
+        )
+        result.append((label, build_crypt_context("argon2", argon2_params=params)))
+    return result
+
+
+def report(label: str, timings: List[float], workers: int) -> Dict:
+    """측정 결과 요약"""
+    ordered = sorted(timings)
+    mean = statistics.mean(ordered)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "label": label,
+        "mean_ms": mean * 1000,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+        "logins_per_sec": workers / mean,
+    }
+
+
+def main():
+    """벤치마크 메인 함수"""
+    parser = argparse.ArgumentParser(description="비밀번호 해싱 벤치마크")
+    parser.add_argument("--iterations", type=int, default=10, help="스킴별 측정 횟수")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.password_hash_workers,
+        help="해싱 워커 수 (초당 로그인 처리량 추정용)",
+    )
+    args = parser.parse_args()
+
+    print("🔐 비밀번호 해싱 벤치마크")
+    print(f"   현재 스킴: {settings.password_hash_scheme}")
+    print(f"   현재 Argon2 파라미터: {get_argon2_params()} (프로필: {settings.argon2_profile})")
+    print(f"   측정 횟수: {args.iterations}, 워커 수: {args.workers}")
+    print()
+
+    print(f"{'스킴':<60} {'평균':>10} {'p50':>10} {'p95':>10} {'로그인/초':>10}")
+    for label, context in candidates():
+        result = report(label, measure(context, args.iterations), args.workers)
+        print(
+            f"{result['label']:<60} "
+            f"{result['mean_ms']:>8.1f}ms "
+            f"{result['p50_ms']:>8.1f}ms "
+            f"{result['p95_ms']:>8.1f}ms "
+            f"{result['logins_per_sec']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
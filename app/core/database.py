@@ -1,4 +1,5 @@
-from typing import Dict, Optional, TYPE_CHECKING, List
+from bisect import bisect_right, insort
+from typing import Dict, Optional, TYPE_CHECKING, List, Tuple
 from datetime import datetime, timedelta
 import uuid
 
@@ -12,10 +13,19 @@ class InMemoryDB:
         self.active_sessions: Dict[str, str] = {}  # token -> user_email
         self.token_blacklist: Dict[str, datetime] = {}  # token -> blacklist_time
         self.posts: Dict[str, "Post"] = {}  # post_id -> Post
+        # 사용자 목록 정렬 인덱스 (이메일 순, 키셋 페이지네이션용)
+        self.user_emails: List[str] = []
+        self.user_emails_by_provider: Dict[str, List[str]] = {}  # provider -> 이메일 순 목록
 
     def create_user(self, user_data: dict) -> "User":
         from app.models import User
         user = User(**user_data)
+        previous = self.users.get(user.email)
+        if previous is None:
+            insort(self.user_emails, user.email)
+        else:
+            self.user_emails_by_provider[previous.provider].remove(user.email)
+        insort(self.user_emails_by_provider.setdefault(user.provider, []), user.email)
         self.users[user.email] = user
         return user
 
@@ -34,6 +44,33 @@ class InMemoryDB:
 
     def get_all_users(self) -> list["User"]:
         return list(self.users.values())
+
+    def list_users(
+        self,
+        after: Optional[str] = None,
+        limit: int = 50,
+        provider: Optional[str] = None,
+        verified_email: Optional[bool] = None,
+    ) -> Tuple[List["User"], bool]:
+        """
+        사용자 목록 페이지 조회 (이메일 순)
+
+        after 이메일 다음부터 limit명을 반환하며 (사용자 목록, 다음 페이지 존재 여부)를 돌려줍니다.
+        제공자 조건은 제공자별 인덱스로 찾으므로 페이지 크기만큼만 확인합니다.
+        """
+        emails = self.user_emails if provider is None else self.user_emails_by_provider.get(provider, [])
+        start = bisect_right(emails, after) if after is not None else 0
+
+        users = []
+        for index in range(start, len(emails)):
+            user = self.users[emails[index]]
+            if verified_email is not None and user.verified_email != verified_email:
+                continue
+            users.append(user)
+            # 다음 페이지 존재 여부 확인을 위해 1명 더 확인
+            if len(users) > limit:
+                break
+        return users[:limit], len(users) > limit
     
     def add_session(self, token: str, email: str):
         self.active_sessions[token] = email
@@ -77,6 +114,7 @@ class InMemoryDB:
             **post_data
         )
         self.posts[post_id] = post
+        self._posts_changed()
         return post
 
     def get_post(self, post_id: str) -> Optional["Post"]:
@@ -105,14 +143,21 @@ class InMemoryDB:
                     setattr(post, key, value)
             post.updated_at = datetime.utcnow().isoformat() + "Z"
             self.posts[post_id] = post
+            self._posts_changed()
         return post
 
     def delete_post(self, post_id: str) -> bool:
         """게시글 삭제"""
         if post_id in self.posts:
             del self.posts[post_id]
+            self._posts_changed()
             return True
         return False
 
+    def _posts_changed(self):
+        """게시글 변경 시 캐시된 목록 응답 무효화"""
+        from app.core.response_cache import response_cache
+        response_cache.invalidate("posts")
+
 # 글로벌 데이터베이스 인스턴스
 db = InMemoryDB()
\ No newline at end of file
@@ -11,6 +11,7 @@ class ErrorMessages:
     TOKEN_INVALID = "Invalid authentication credentials"
     TOKEN_REVOKED = "Token has been revoked"
     UNAUTHORIZED = "인증이 필요합니다."
+    LOGIN_TOO_MANY_ATTEMPTS = "로그인 시도 횟수를 초과했습니다. 잠시 후 다시 시도해주세요."
 
     # 사용자 관련
     USER_NOT_FOUND = "사용자를 찾을 수 없습니다."
@@ -41,6 +42,17 @@ class ErrorMessages:
     # 날짜 형식 관련
     INVALID_DATE_FORMAT = "생년월일 형식이 올바르지 않습니다. (YYYY-MM-DD)"
 
+    # 일괄 등록 관련
+    IMPORT_UNSUPPORTED_FILE = "CSV 또는 XLSX 파일만 업로드할 수 있습니다."
+    IMPORT_INVALID_FILE = "파일을 읽을 수 없습니다."
+    IMPORT_INVALID_ENCODING = "파일 인코딩이 올바르지 않습니다. encoding 값을 확인해주세요."
+    IMPORT_MISSING_COLUMNS = "필수 컬럼이 없습니다."
+    IMPORT_TOO_MANY_ROWS = "한 번에 등록할 수 있는 행 수를 초과했습니다."
+
+    # 페이지네이션 관련
+    INVALID_CURSOR = "페이지 커서가 올바르지 않습니다. 처음부터 다시 조회해주세요."
+    INVALID_FIELDS = "요청한 필드 중 응답에 없는 필드가 있습니다."
+
 
 class SuccessMessages:
     """성공 메시지 상수"""
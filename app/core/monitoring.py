@@ -0,0 +1,193 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+class EventLoopMonitor:
+    """
+    이벤트 루프 지연(lag) 모니터
+
+    별도의 감시 스레드가 주기적으로 이벤트 루프에 콜백을 예약하고,
+    콜백이 실행되기까지 걸린 시간을 루프 지연으로 기록합니다.
+    콜백이 임계값 이상 실행되지 않으면 루프를 막고 있는 스택과
+    현재 처리 중인 요청의 request_id를 함께 수집합니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        block_threshold: float = 0.1,
+        max_reports: int = 20,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.samples = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+        self.blocked_count = 0
+        self.reports: Deque[Dict] = deque(maxlen=max_reports)
+
+    @property
+    def is_running(self) -> bool:
+        """모니터 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """현재 이벤트 루프에 대한 모니터링 시작 (루프 스레드에서 호출)"""
+        if self.is_running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._watch,
+            name="event-loop-monitor",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            f"이벤트 루프 모니터 시작 - interval: {self.interval}s, "
+            f"block_threshold: {self.block_threshold * 1000:.0f}ms"
+        )
+
+    def stop(self):
+        """모니터링 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + self.block_threshold + 1)
+        self._thread = None
+        self._loop = None
+
+    def _watch(self):
+        """감시 스레드 본체"""
+        while not self._stop_event.is_set():
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                break
+
+            executed = threading.Event()
+            scheduled_at = time.perf_counter()
+            executed_at = [scheduled_at]
+
+            def _ack():
+                executed_at[0] = time.perf_counter()
+                executed.set()
+
+            try:
+                loop.call_soon_threadsafe(_ack)
+            except RuntimeError:
+                # 루프가 이미 닫힌 경우
+                break
+
+            if not executed.wait(self.block_threshold):
+                # 루프가 막혀 있음 - 지금 실행 중인 스택을 수집
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = traceback.format_stack(frame) if frame is not None else []
+                request_id = _find_request_id(frame)
+                del frame
+
+                while not executed.wait(self.interval):
+                    if self._stop_event.is_set():
+                        return
+
+                self._record_block(executed_at[0] - scheduled_at, stack, request_id)
+
+            self._record_lag(executed_at[0] - scheduled_at)
+            self._stop_event.wait(self.interval)
+
+    def _record_lag(self, lag: float):
+        """지연 샘플 기록"""
+        with self._lock:
+            self.samples += 1
+            self.last_lag = lag
+            self.total_lag += lag
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def _record_block(self, duration: float, stack: list, request_id: Optional[str]):
+        """블로킹 호출 리포트 기록"""
+        report = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "duration_ms": round(duration * 1000, 2),
+            "request_id": request_id,
+            "stack": [line.rstrip() for line in stack],
+        }
+        with self._lock:
+            self.blocked_count += 1
+            self.reports.append(report)
+
+        location = stack[-1].strip().splitlines()[0] if stack else "unknown"
+        logger.warning(
+            f"[{request_id or '-'}] 이벤트 루프가 {report['duration_ms']}ms 동안 "
+            f"블로킹되었습니다 - {location}"
+        )
+
+    def snapshot(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        with self._lock:
+            avg_lag = self.total_lag / self.samples if self.samples else 0.0
+            return {
+                "running": self.is_running,
+                "samples": self.samples,
+                "lag_ms": {
+                    "last": round(self.last_lag * 1000, 3),
+                    "avg": round(avg_lag * 1000, 3),
+                    "max": round(self.max_lag * 1000, 3),
+                },
+                "block_threshold_ms": round(self.block_threshold * 1000, 2),
+                "blocked_count": self.blocked_count,
+                "recent_blocks": list(self.reports),
+            }
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self.samples = 0
+            self.last_lag = 0.0
+            self.max_lag = 0.0
+            self.total_lag = 0.0
+            self.blocked_count = 0
+            self.reports.clear()
+
+
+def _find_request_id(frame) -> Optional[str]:
+    """
+    블로킹 중인 스택에서 request_id 추출
+
+    RequestIDMiddleware가 ASGI scope의 state에 저장한 request_id를
+    가장 안쪽 프레임부터 거슬러 올라가며 찾습니다.
+    """
+    while frame is not None:
+        scope = frame.f_locals.get("scope")
+        if isinstance(scope, dict):
+            state = scope.get("state")
+            if isinstance(state, dict) and state.get("request_id"):
+                return state["request_id"]
+        frame = frame.f_back
+    return None
+
+
+# 글로벌 이벤트 루프 모니터 인스턴스
+loop_monitor = EventLoopMonitor(
+    interval=settings.loop_monitor_interval_seconds,
+    block_threshold=settings.loop_monitor_block_threshold_ms / 1000,
+    max_reports=settings.loop_monitor_max_reports,
+)
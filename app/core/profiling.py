@@ -0,0 +1,130 @@
+import hmac
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+
+class StackSampler:
+    """
+    샘플링 프로파일러
+
+    별도 스레드에서 대상 스레드의 콜스택을 주기적으로 수집하여
+    flamegraph 도구(flamegraph.pl, speedscope 등)가 읽을 수 있는
+    collapsed stack 형식으로 집계합니다.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_ids: Optional[List[int]] = None):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """샘플링 시작"""
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """샘플링 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.stopped_at = time.perf_counter()
+
+    def _run(self):
+        """샘플링 스레드 본체"""
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    continue
+                self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+            del frames
+
+    @property
+    def duration(self) -> float:
+        """샘플링 시간 (초)"""
+        if self.started_at is None:
+            return 0.0
+        end = self.stopped_at if self.stopped_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def to_collapsed(self) -> str:
+        """collapsed stack 형식 문자열 반환 (한 줄에 `frame;frame;... count`)"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+def _collapse(frame) -> str:
+    """프레임 체인을 바깥쪽부터 `;`로 연결한 문자열로 변환"""
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class ProfileStore:
+    """수집된 프로파일 저장소 (최근 N개 유지)"""
+
+    def __init__(self, max_profiles: int = 50):
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, profile_id: str, sampler: StackSampler, **metadata) -> Dict:
+        """프로파일 저장"""
+        profile = {
+            "profile_id": profile_id,
+            "created_at": datetime.utcnow().isoformat() + "Z",
+            "duration_ms": round(sampler.duration * 1000, 2),
+            "samples": sampler.samples,
+            "interval_ms": round(sampler.interval * 1000, 2),
+            **metadata,
+            "collapsed": sampler.to_collapsed(),
+        }
+        with self._lock:
+            self._profiles[profile_id] = profile
+            self._profiles.move_to_end(profile_id)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        """프로파일 조회"""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict]:
+        """프로파일 목록 (collapsed 본문 제외, 최신순)"""
+        with self._lock:
+            return [
+                {key: value for key, value in profile.items() if key != "collapsed"}
+                for profile in reversed(self._profiles.values())
+            ]
+
+
+def verify_profiling_token(token: Optional[str]) -> bool:
+    """프로파일링 토큰 검증 (설정되지 않은 경우 항상 거부)"""
+    if not settings.profiling_token or not token:
+        return False
+    # 헤더는 Latin-1로 디코딩되므로 비ASCII 문자가 올 수 있음 (str 비교는 TypeError)
+    return hmac.compare_digest(token.encode(), settings.profiling_token.encode())
+
+
+# 글로벌 프로파일 저장소 인스턴스
+profile_store = ProfileStore(max_profiles=settings.profiling_max_profiles)
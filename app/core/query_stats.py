@@ -0,0 +1,217 @@
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import datetime
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+class QueryStats:
+    """쿼리 수/DB 시간 집계 (요청 또는 테스트 구간 단위)"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 반복된 문장 (N+1 의심)"""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값"""
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+# 현재 요청의 쿼리 통계 (QueryStatsMiddleware가 설정)
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+class QueryMonitor:
+    """
+    요청별 SQL 쿼리 계측
+
+    SQLAlchemy 엔진 이벤트로 모든 쿼리의 실행 시간을 재고, 현재 요청의
+    통계에 더합니다. 요청이 끝나면 쿼리 수가 기준을 넘거나 같은 문장이
+    반복된 경우(N+1 의심) request_id와 함께 경고를 남깁니다.
+    """
+
+    def __init__(
+        self,
+        count_threshold: int = 20,
+        repeat_threshold: int = 5,
+        max_reports: int = 20,
+    ):
+        self.count_threshold = count_threshold
+        self.repeat_threshold = repeat_threshold
+        self._installed = False
+        self._lock = threading.Lock()
+        # 요청과 무관하게 모든 쿼리를 받는 수집기 (테스트용)
+        self._captures: List[QueryStats] = []
+
+        # 통계
+        self.requests = 0
+        self.total_queries = 0
+        self.total_duration = 0.0
+        self.max_queries = 0
+        self.warning_count = 0
+        self.reports: Deque[Dict] = deque(maxlen=max_reports)
+
+    def install(self):
+        """모든 엔진에 쿼리 계측 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+        with self._lock:
+            if self._installed:
+                return
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            event.listen(Engine, "handle_error", self._handle_error)
+            self._installed = True
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._finish(conn, statement)
+
+    def _handle_error(self, exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 여기서 시작 시각을 꺼냄
+        # (남겨두면 같은 연결의 다음 쿼리 시간이 어긋나고 스택이 계속 쌓임)
+        conn = exception_context.connection
+        if conn is None or exception_context.statement is None:
+            return
+        self._finish(conn, exception_context.statement)
+
+    def _finish(self, conn, statement: str):
+        """쿼리 종료 (시작 시각을 꺼내 실행 시간 기록, 실패한 쿼리 포함)"""
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, duration)
+        if self._captures:
+            with self._lock:
+                for capture in self._captures:
+                    capture.record(statement, duration)
+
+    def begin(self) -> Token:
+        """요청 시작 (현재 컨텍스트에 새 통계 설정)"""
+        return _current_stats.set(QueryStats())
+
+    def end(self, token: Token, request_id: str, method: str, path: str) -> QueryStats:
+        """요청 종료 (통계 반영 및 경고 기록)"""
+        stats = _current_stats.get()
+        _current_stats.reset(token)
+
+        repeated = stats.repeated(self.repeat_threshold)
+        too_many = stats.count > self.count_threshold
+
+        with self._lock:
+            self.requests += 1
+            self.total_queries += stats.count
+            self.total_duration += stats.duration
+            self.max_queries = max(self.max_queries, stats.count)
+            if repeated or too_many:
+                self.warning_count += 1
+                self.reports.append({
+                    "timestamp": datetime.now().isoformat(),
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "queries": stats.count,
+                    "db_ms": round(stats.duration * 1000, 2),
+                    "repeated": [
+                        {"statement": statement, "count": count}
+                        for statement, count in repeated
+                    ],
+                })
+
+        if too_many:
+            logger.warning(
+                f"[{request_id}] 쿼리 수 과다 - {method} {path}: "
+                f"{stats.count}건, {stats.duration * 1000:.1f}ms"
+            )
+        for statement, count in repeated:
+            logger.warning(
+                f"[{request_id}] N+1 의심 - {method} {path}: "
+                f"같은 쿼리 {count}회 실행 ({' '.join(statement.split())[:200]})"
+            )
+        return stats
+
+    @contextmanager
+    def capture(self) -> Iterator[QueryStats]:
+        """구간 내 모든 쿼리 수집 (요청 컨텍스트와 무관, 테스트용)"""
+        self.install()
+        stats = QueryStats()
+        with self._lock:
+            self._captures.append(stats)
+        try:
+            yield stats
+        finally:
+            with self._lock:
+                self._captures.remove(stats)
+
+    def snapshot(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        with self._lock:
+            average = self.total_queries / self.requests if self.requests else 0.0
+            return {
+                "enabled": self._installed,
+                "requests": self.requests,
+                "total_queries": self.total_queries,
+                "avg_queries_per_request": round(average, 2),
+                "max_queries_per_request": self.max_queries,
+                "total_db_ms": round(self.total_duration * 1000, 2),
+                "warning_count": self.warning_count,
+                "count_threshold": self.count_threshold,
+                "repeat_threshold": self.repeat_threshold,
+                "recent_warnings": list(self.reports),
+            }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@contextmanager
+def assert_max_queries(max_count: int) -> Iterator[QueryStats]:
+    """
+    구간 내 쿼리 수가 max_count 이하인지 확인하는 테스트 도우미
+
+        with assert_max_queries(2):
+            client.get("/term-employees")
+    """
+    with query_monitor.capture() as stats:
+        yield stats
+
+    if stats.count > max_count:
+        statements = "\n".join(
+            f"  {count}x {' '.join(statement.split())}"
+            for statement, count in stats.statements.most_common()
+        )
+        raise AssertionError(
+            f"쿼리 {stats.count}건 실행 (최대 {max_count}건)\n{statements}"
+        )
+
+
+# 글로벌 쿼리 모니터 인스턴스
+query_monitor = QueryMonitor(
+    count_threshold=settings.query_count_warning_threshold,
+    repeat_threshold=settings.query_repeat_warning_threshold,
+    max_reports=settings.query_stats_max_reports,
+)
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.utils.compression import compress
+
+Compute = Callable[[], Awaitable[bytes]]
+
+
+class _Entry:
+    __slots__ = ("body", "created_at", "refreshing", "encoded")
+
+    def __init__(self, body: bytes, created_at: float):
+        self.body = body
+        self.created_at = created_at
+        self.refreshing = False
+        # 압축 방식 -> 압축된 본문
+        self.encoded: Dict[str, bytes] = {}
+
+
+class ResponseCache:
+    """
+    사전 직렬화 응답 캐시
+
+    공개 GET 응답 본문(bytes)을 (네임스페이스, 키)로 저장합니다.
+    - 같은 키를 동시에 계산하지 않도록 한 요청만 계산하고 나머지는 결과를 기다림
+    - TTL이 지난 뒤 stale 기간 안에는 이전 본문을 바로 반환하고 백그라운드에서 갱신
+    - 쓰기 시 네임스페이스 단위로 무효화 (계산 중이던 결과도 저장하지 않음)
+    - 압축본도 항목에 함께 보관해 압축 방식별로 한 번만 압축
+    워커 프로세스마다 별도로 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        stale_ttl: float = 30.0,
+        max_entries: int = 1000,
+        enabled: bool = True,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._background: Set[asyncio.Task] = set()
+
+        # 통계
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.compressions = 0
+        self.compressed_hits = 0
+
+    def invalidate(self, namespace: str):
+        """네임스페이스의 캐시 항목 모두 제거"""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        self.invalidations += 1
+        for key in [key for key in self._entries if key[0] == namespace]:
+            del self._entries[key]
+
+    def _store(self, cache_key: Tuple[str, str], body: bytes, generation: int):
+        if self._generations.get(cache_key[0], 0) != generation:
+            return
+        self._entries[cache_key] = _Entry(body, time.monotonic())
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _compute(self, cache_key: Tuple[str, str], compute: Compute) -> bytes:
+        """single-flight 계산 (진행 중인 계산이 있으면 그 결과를 기다림)"""
+        future = self._inflight.get(cache_key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 계산하던 요청이 취소된 경우에만 직접 다시 계산
+                if not future.cancelled():
+                    raise
+                return await self._compute(cache_key, compute)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        generation = self._generations.get(cache_key[0], 0)
+        try:
+            body = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 "예외 미확인" 경고 방지
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            self._store(cache_key, body, generation)
+            future.set_result(body)
+            return body
+        finally:
+            del self._inflight[cache_key]
+
+    async def _refresh(self, cache_key: Tuple[str, str], entry: _Entry, compute: Compute):
+        try:
+            await self._compute(cache_key, compute)
+        except Exception as e:
+            logger.error(f"응답 캐시 갱신 실패 - {cache_key}: {e}")
+        finally:
+            entry.refreshing = False
+
+    async def get_or_compute(self, namespace: str, key: str, compute: Compute) -> Tuple[bytes, str]:
+        """
+        캐시된 본문 반환 (없으면 계산)
+
+        (본문, 상태)를 반환하며 상태는 HIT, STALE, MISS 중 하나입니다.
+        """
+        if not self.enabled:
+            return await compute(), "MISS"
+
+        cache_key = (namespace, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            age = time.monotonic() - entry.created_at
+            if age < self.ttl:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry.body, "HIT"
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                if not entry.refreshing:
+                    entry.refreshing = True
+                    task = asyncio.create_task(self._refresh(cache_key, entry, compute))
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+                return entry.body, "STALE"
+
+        self.misses += 1
+        return await self._compute(cache_key, compute), "MISS"
+
+    def encoded(self, namespace: str, key: str, body: bytes, encoding: str) -> bytes:
+        """
+        본문의 압축본 반환
+
+        get_or_compute가 돌려준 본문이 아직 캐시 항목의 본문이면 압축본을
+        항목에 보관해 재사용하고, 그 사이 갱신/무효화됐다면 압축만 합니다.
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is None or entry.body is not body:
+            return compress(body, encoding)
+        data = entry.encoded.get(encoding)
+        if data is not None:
+            self.compressed_hits += 1
+            return data
+        data = entry.encoded[encoding] = compress(body, encoding)
+        self.compressions += 1
+        return data
+
+    def stats(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        total = self.hits + self.stale_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "stale_seconds": self.stale_ttl,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.stale_hits) / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "compressions": self.compressions,
+            "compressed_hits": self.compressed_hits,
+        }
+
+
+def normalize_query(**params: Optional[object]) -> str:
+    """캐시 키용 쿼리 문자열 (이름 순 정렬, None 제외)"""
+    return "&".join(f"{name}={value}" for name, value in sorted(params.items()) if value is not None)
+
+
+# 글로벌 응답 캐시 인스턴스
+response_cache = ResponseCache(
+    ttl=settings.response_cache_ttl_seconds,
+    stale_ttl=settings.response_cache_stale_seconds,
+    max_entries=settings.response_cache_max_entries,
+    enabled=settings.response_cache_enabled,
+)
@@ -1,4 +1,4 @@
 from app.db.base import Base
-from app.db.session import engine, async_session, get_db
+from app.db.session import engine, async_session, read_session, get_db, get_read_db
 
-__all__ = ["Base", "engine", "async_session", "get_db"]
+__all__ = ["Base", "engine", "async_session", "read_session", "get_db", "get_read_db"]
@@ -2,5 +2,6 @@ from app.db.models.department import Department
 from app.db.models.manager import Manager
 from app.db.models.user import User
 from app.db.models.term_employee import TermEmployee, EmploymentStatus
+from app.db.models.term_employee_summary import TermEmployeeSummary
 
-__all__ = ["Department", "Manager", "User", "TermEmployee", "EmploymentStatus"]
+__all__ = ["Department", "Manager", "User", "TermEmployee", "EmploymentStatus", "TermEmployeeSummary"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Date, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, BigInteger, String, Date, ForeignKey, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -12,6 +12,10 @@ class EmploymentStatus(str, enum.Enum):
     ON_LEAVE = "on_leave"  # 휴직
 
 
+# 재직 중으로 보는 상태 (재직기간 종료 시 퇴사 처리 대상)
+IN_SERVICE_STATUSES = (EmploymentStatus.ACTIVE, EmploymentStatus.ON_LEAVE)
+
+
 class TermEmployee(Base):
     """기간제 인력 모델"""
 
@@ -19,6 +23,8 @@ class TermEmployee(Base):
 
     term_employee_id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
     name = Column(String(255), nullable=False, index=True)  # 이름
+    name_normalized = Column(String(255), nullable=True)  # 검색용 정규화 이름 (공백 제거, 소문자)
+    name_chosung = Column(String(255), nullable=True)  # 검색용 초성 (예: ㅎㄱㄷ)
     birthdate = Column(Date, nullable=False, index=True)  # 생년월일
     address = Column(String(500), nullable=True)  # 주소
     department_id = Column(BigInteger, ForeignKey("departments.department_id", ondelete="CASCADE"), nullable=False, index=True)
@@ -35,5 +41,34 @@ class TermEmployee(Base):
     # 관계 설정
     department = relationship("Department", backref="term_employees")
 
+    __table_args__ = (
+        # 이름 부분 일치/유사도 검색용 트라이그램 인덱스 (PostgreSQL pg_trgm 전용)
+        Index(
+            "ix_term_employees_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # 자동완성 접두어 검색용 인덱스 (PostgreSQL은 LIKE 'x%'에 pattern_ops 필요)
+        Index(
+            "ix_term_employees_name_normalized",
+            "name_normalized",
+            postgresql_ops={"name_normalized": "varchar_pattern_ops"},
+        ),
+        Index(
+            "ix_term_employees_name_chosung",
+            "name_chosung",
+            postgresql_ops={"name_chosung": "varchar_pattern_ops"},
+        ),
+        # 목록 필터/키셋 페이지네이션용 복합 인덱스
+        Index("ix_term_employees_department_status_end", "department_id", "status", "employment_end_date"),
+        Index("ix_term_employees_start_date_id", "employment_start_date", "term_employee_id"),
+        Index("ix_term_employees_end_date_id", "employment_end_date", "term_employee_id"),
+        Index("ix_term_employees_name_id", "name", "term_employee_id"),
+        Index("ix_term_employees_position", "position"),
+        # 계약 만료 배치용 (상태별 종료일 범위 조회)
+        Index("ix_term_employees_status_end_date", "status", "employment_end_date"),
+    )
+
     def __repr__(self):
         return f"<TermEmployee(id={self.term_employee_id}, name='{self.name}', department_id={self.department_id}, status='{self.status}')>"
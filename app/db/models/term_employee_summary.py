@@ -0,0 +1,19 @@
+from sqlalchemy import Column, BigInteger, Integer, Date, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class TermEmployeeSummary(Base):
+    """부서별 기간제 인력 현황 집계 모델 (대시보드용)"""
+
+    __tablename__ = "term_employee_summaries"
+
+    department_id = Column(BigInteger, ForeignKey("departments.department_id", ondelete="CASCADE"), primary_key=True)
+    active_count = Column(Integer, nullable=False, default=0)  # 재직중
+    on_leave_count = Column(Integer, nullable=False, default=0)  # 휴직
+    expiring_count = Column(Integer, nullable=False, default=0)  # 만료 예정 (재직/휴직 중 종료일이 기준일~기준일+N일)
+    base_date = Column(Date, nullable=False)  # 만료 예정 집계 기준일
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<TermEmployeeSummary(department_id={self.department_id}, active={self.active_count}, on_leave={self.on_leave_count}, expiring={self.expiring_count})>"
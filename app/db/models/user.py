@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, BigInteger, String, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -23,5 +23,10 @@ class User(Base):
     # 관계 설정
     department = relationship("Department", backref="users")
 
+    __table_args__ = (
+        # 부서별 목록 키셋 페이지네이션용 (부서 조건 + ID 순)
+        Index("ix_users_department_id_user_id", "department_id", "user_id"),
+    )
+
     def __repr__(self):
         return f"<User(id={self.user_id}, username='{self.username}', department_id={self.department_id})>"
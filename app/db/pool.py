@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolMetrics:
+    """커넥션 풀 대기 시간/타임아웃/연결 생성 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+        self.connects = 0
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def record_connect(self):
+        with self._lock:
+            self.connects += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            average = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "wait_avg_ms": round(average * 1000, 3),
+                "wait_max_ms": round(self.max_wait * 1000, 3),
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+            }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    체크아웃 대기 시간을 기록하는 비동기 큐 풀
+
+    풀이 가득 차서 커넥션 반환을 기다린 시간까지 포함해 측정합니다.
+    dispose()로 풀을 다시 만들어도 통계는 유지됩니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started)
+
+    def _create_connection(self):
+        self.metrics.record_connect()
+        return super()._create_connection()
+
+
+def pool_stats(pool: Pool) -> Dict:
+    """풀 사용량 게이지 (/metrics 노출용)"""
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"status": pool.status()}
+
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        **pool.metrics.snapshot(),
+    }
@@ -1,33 +1,182 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import itertools
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, pool_stats
+
+
+def engine_options(url: str, pooled: bool = True) -> Dict[str, Any]:
+    """
+    URL별 엔진 옵션 (풀 크기/재연결 정책, asyncpg 드라이버 옵션)
+
+    SQLite는 SQLAlchemy 기본 풀을 그대로 사용합니다.
+    pooled=False면 풀 없이 매번 새로 연결합니다 (LISTEN처럼 오래 점유하는 용도).
+    """
+    options: Dict[str, Any] = {"echo": settings.debug, "future": True}
+    url = make_url(url)
+    if not pooled:
+        options["poolclass"] = NullPool
+    elif url.get_backend_name() == "sqlite":
+        return options
+    else:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+            pool_pre_ping=settings.database_pool_pre_ping,
+        )
+    if url.get_driver_name() == "asyncpg":
+        # PgBouncer 트랜잭션 모드에서는 캐시 크기를 0으로 설정
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+            "statement_cache_size": settings.database_statement_cache_size,
+            "command_timeout": settings.database_command_timeout,
+        }
+    return options
+
 
 # 비동기 엔진 생성
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True
-)
+engine = create_async_engine(settings.database_url, **engine_options(settings.database_url))
+
+# 알림 수신(LISTEN) 전용 엔진
+# 커넥션을 계속 점유하므로 요청용 풀과 분리 (풀 크기/통계에 영향 없음)
+listen_engine = create_async_engine(settings.database_url, **engine_options(settings.database_url, pooled=False))
+
+# 읽기 전용 복제본 엔진 (설정된 경우에만)
+replica_engines = [
+    create_async_engine(url, **engine_options(url))
+    for url in settings.database_replica_urls
+]
+_replica_cycle = itertools.cycle(replica_engines)
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite는 연결마다 켜야 외래 키 제약을 확인 (부서 존재 여부 등을 제약으로 확인하므로 필요)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+for _engine in (engine, *replica_engines):
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+
+
+class RoutingSession(Session):
+    """
+    조회는 복제본, 쓰기는 기본 DB로 보내는 세션 (조회용 세션 전용)
+
+    세션마다 복제본 하나를 골라 끝까지 사용하므로 같은 세션의 조회는 같은
+    스냅샷을 봅니다. 한 번이라도 쓰기(flush, INSERT/UPDATE/DELETE, 잠금 조회
+    SELECT ... FOR UPDATE 등)를 하면 이후 조회도 기본 DB로 보냅니다.
+    복제본이 없으면 항상 기본 DB를 사용합니다.
+    쓰기용 세션(get_db)은 복제 지연으로 오래된 값을 읽고 쓰지 않도록
+    이 세션을 쓰지 않고 항상 기본 DB를 사용합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replica = next(_replica_cycle, None)
+        self._use_primary = self._replica is None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self._use_primary:
+            if (
+                not self._flushing
+                and clause is not None
+                and clause.is_select
+                and getattr(clause, "_for_update_arg", None) is None
+            ):
+                return self._replica.sync_engine
+            # 잠금 조회를 포함해 SELECT 외의 문장은 모두 쓰기로 보고 이후 기본 DB에 고정
+            # (핫 스탠바이 복제본은 FOR UPDATE를 거부)
+            self._use_primary = True
+        return super().get_bind(mapper, clause=clause, **kw)
 
-# 비동기 세션 팩토리
+    @property
+    def uses_primary(self) -> bool:
+        """기본 DB 고정 여부"""
+        return self._use_primary
+
+
+class ReadOnlySession(RoutingSession):
+    """조회 전용 세션 (PostgreSQL에서는 READ ONLY 트랜잭션으로 시작)"""
+
+
+@event.listens_for(ReadOnlySession, "after_begin")
+def _set_transaction_read_only(session, transaction, connection):
+    # 트랜잭션의 첫 문장이어야 하므로 세션이 커넥션을 잡은 직후에 실행
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+# 비동기 세션 팩토리 (쓰기용, 조회도 항상 기본 DB)
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False
 )
 
+# 조회 전용 세션 팩토리
+read_session = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False
+)
+
+
+def _engine_stats(async_engine: AsyncEngine) -> Dict:
+    return {
+        "url": async_engine.url.render_as_string(hide_password=True),
+        **pool_stats(async_engine.pool),
+    }
+
+
+def database_pool_stats() -> Dict:
+    """기본 DB/복제본 커넥션 풀 통계 (/metrics 노출용)"""
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "primary": _engine_stats(engine),
+        "replicas": [_engine_stats(replica) for replica in replica_engines],
+    }
+
 
 async def get_db():
     """
-    데이터베이스 세션 의존성
+    데이터베이스 세션 의존성 (쓰기용)
 
-    FastAPI의 Depends에서 사용
+    FastAPI의 Depends에서 사용합니다. 핸들러가 이미 커밋했다면
+    다시 커밋하지 않으므로 요청당 커밋은 한 번입니다.
+    쓰기 전 확인 조회(중복/이전 값)도 최신이어야 하므로 복제본을 쓰지 않습니다.
     """
     async with async_session() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
+
+
+async def get_read_db():
+    """
+    데이터베이스 세션 의존성 (조회용)
+
+    커밋하지 않고 세션 종료 시 롤백으로 트랜잭션을 끝냅니다.
+    GET 핸들러처럼 데이터를 바꾸지 않는 경로에서 사용합니다.
+    복제본이 설정되어 있으면 조회를 복제본으로 보냅니다.
+    """
+    async with read_session() as session:
+        yield session
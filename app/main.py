@@ -3,16 +3,31 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.utils import get_openapi
 from fastapi.exceptions import RequestValidationError
-from app.routers import auth, users, protected, posts
+from app.routers import auth, users, protected, posts, admin
 from app.core.logging import logger
 from app.core.config import settings
+from app.core.monitoring import loop_monitor
+from app.core.query_stats import query_monitor
+from app.core.response_cache import response_cache
+from app.services.contract_expiry import contract_expiry_job
+from app.services.department_cache import department_cache
+from app.services.principal_cache import principal_cache
+from app.db.session import database_pool_stats
+from app.utils.responses import json_response_class
 from app.core.exceptions import (
     APIException,
     api_exception_handler,
     validation_exception_handler,
     general_exception_handler,
 )
-from app.middleware import RateLimitMiddleware, RequestIDMiddleware, SecurityHeadersMiddleware
+from app.middleware import (
+    CompressionMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    RateLimitMiddleware,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+)
 
 # API 메타데이터
 tags_metadata = [
@@ -32,6 +47,10 @@ tags_metadata = [
         "name": "보호된 엔드포인트",
         "description": "인증된 사용자만 접근 가능한 엔드포인트 예제. **인증 필요**",
     },
+    {
+        "name": "운영 관리",
+        "description": "프로파일링 등 운영 진단용 엔드포인트. **프로파일링 토큰 필요**",
+    },
 ]
 
 app = FastAPI(
@@ -75,6 +94,7 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT",
     },
+    default_response_class=json_response_class(settings.json_response_backend),
 )
 
 # 예외 핸들러 등록
@@ -82,6 +102,13 @@ app.add_exception_handler(APIException, api_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
+# 요청 단위 프로파일링 미들웨어 (Request ID 미들웨어 안쪽에서 실행)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청별 SQL 쿼리 계측 미들웨어 (Request ID 미들웨어 안쪽에서 실행)
+if settings.query_stats_enabled:
+    app.add_middleware(QueryStatsMiddleware)
+
 # Request ID 트래킹 미들웨어 (가장 먼저 실행되어야 함)
 app.add_middleware(RequestIDMiddleware)
 
@@ -95,6 +122,15 @@ app.add_middleware(
     requests_per_hour=1000
 )
 
+# 응답 압축 미들웨어 (허용된 Content-Type + 최소 크기 이상, 스트리밍 응답은 청크 단위 압축)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        encodings=settings.compression_encodings,
+        content_types=settings.compression_content_types,
+    )
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -109,6 +145,7 @@ app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(posts.router)
 app.include_router(protected.router)
+app.include_router(admin.router)
 
 
 @app.on_event("startup")
@@ -118,10 +155,27 @@ async def startup_event():
     logger.info(f"OAuth 인증 서버 v1.0.0 - 환경: {settings.environment}")
     logger.info(f"Debug 모드: {settings.debug}")
 
+    # 이벤트 루프 지연 모니터 시작
+    if settings.loop_monitor_enabled:
+        loop_monitor.start()
+
+    # 계약 만료 배치 시작 (워커 간에는 리더 잠금으로 한 곳만 실행)
+    if settings.contract_expiry_enabled:
+        contract_expiry_job.start()
+
+    # 부서 캐시 적재 및 변경 알림 수신 시작
+    department_cache.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    from app.services.password_service import password_pool
+
+    loop_monitor.stop()
+    await contract_expiry_job.stop()
+    await department_cache.stop()
+    password_pool.shutdown()
     logger.info("FastAPI 애플리케이션이 종료되었습니다.")
 
 
@@ -230,6 +284,8 @@ async def metrics():
     Prometheus, Grafana 등 모니터링 시스템과 연동 가능합니다.
     """
     from app.core.database import db
+    from app.services.password_service import password_pool
+    from app.services.login_throttle import login_throttle
     from datetime import datetime
     import psutil
     import os
@@ -268,7 +324,16 @@ async def metrics():
             "threads": process.num_threads(),
             "connections": len(process.connections())
         },
-        "database": db_stats
+        "database": db_stats,
+        "database_pool": database_pool_stats(),
+        "event_loop": loop_monitor.snapshot(),
+        "queries": query_monitor.snapshot(),
+        "password_hashing": password_pool.stats(),
+        "login_throttle": login_throttle.stats(),
+        "contract_expiry": contract_expiry_job.stats(),
+        "department_cache": department_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "response_cache": response_cache.stats()
     }
 
 
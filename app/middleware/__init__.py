@@ -1,10 +1,17 @@
-from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware, get_client_ip
 from app.middleware.request_id import RequestIDMiddleware, get_request_id
 from app.middleware.security_headers import SecurityHeadersMiddleware
 
 __all__ = [
+    "CompressionMiddleware",
+    "ProfilingMiddleware",
+    "QueryStatsMiddleware",
     "RateLimitMiddleware",
     "RequestIDMiddleware",
     "SecurityHeadersMiddleware",
+    "get_client_ip",
     "get_request_id"
 ]
@@ -0,0 +1,133 @@
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.compression import (
+    StreamCompressor,
+    choose_encoding,
+    compress,
+    is_compressible_type,
+    supported_encodings,
+)
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (gzip, br, zstd)
+
+    Accept-Encoding으로 방식을 협상하고, 허용된 Content-Type이면서
+    최소 크기 이상인 응답만 압축합니다.
+    - 스트리밍 응답은 청크 단위로 압축해 그대로 스트리밍 (크기 기준 미적용)
+    - 이미 Content-Encoding이 있는 응답(캐시된 압축본 등)은 그대로 전달
+    - 압축한 응답의 강한 ETag는 약한 ETag(W/)로 변경
+    BaseHTTPMiddleware 대신 ASGI로 구현해 본문을 모으지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Iterable[str] = ("br", "zstd", "gzip"),
+        content_types: Iterable[str] = ("application/json",),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = supported_encodings(encodings)
+        self.content_types = [content_type.lower() for content_type in content_types]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.content_types)
+        await self.app(scope, receive, responder.send)
+
+
+def _weaken_etag(headers: MutableHeaders):
+    """
+    강한 ETag를 약한 ETag로 변경
+
+    압축하면 바이트가 달라지므로 원본 본문 기준의 강한 ETag를 그대로 쓸 수 없습니다.
+    조건부 요청(If-None-Match)은 약한 비교를 하므로 재검증은 그대로 동작합니다.
+    """
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int, content_types: list):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+        self._start: Optional[Message] = None
+        self._compressor: Optional[StreamCompressor] = None
+        self._passthrough = False
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        status = self._start["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        return is_compressible_type(headers.get("content-type", ""), self.content_types)
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            # 첫 본문을 보고 압축 여부를 정할 때까지 보류
+            self._start = message
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is not None:
+            chunk = self._compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += self._compressor.finish()
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(scope=self._start)
+        if self._start["status"] == 304:
+            # 압축해서 보냈을 표현의 검증 결과이므로 ETag도 같은 약한 값으로 맞춤
+            _weaken_etag(headers)
+        if not self._compressible(headers) or (not more_body and len(body) < self.minimum_size):
+            self._passthrough = True
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        _weaken_etag(headers)
+        if not more_body:
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        # 스트리밍 응답: 전체 길이를 알 수 없으므로 chunked 전송
+        del headers["Content-Length"]
+        self._compressor = StreamCompressor(self.encoding)
+        await self._send(self._start)
+        await self._send({
+            "type": "http.response.body",
+            "body": self._compressor.compress(body) if body else b"",
+            "more_body": True,
+        })
@@ -0,0 +1,54 @@
+import threading
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.profiling import StackSampler, profile_store, verify_profiling_token
+from app.middleware.request_id import get_request_id
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    요청 단위 프로파일링 미들웨어
+
+    인증된 프로파일링 헤더가 포함된 요청에 대해서만 샘플링 프로파일러를
+    실행하고, 결과를 request ID로 저장합니다.
+    같은 이벤트 루프에서 동시에 처리되는 다른 요청의 스택도 함께 샘플링될 수 있습니다.
+    """
+
+    def __init__(self, app, header_name: str = "X-Profile-Token"):
+        super().__init__(app)
+        self.header_name = header_name
+
+    async def dispatch(self, request: Request, call_next):
+        token = request.headers.get(self.header_name)
+        if token is None or not verify_profiling_token(token):
+            return await call_next(request)
+
+        request_id = getattr(request.state, "request_id", None) or get_request_id()
+        sampler = StackSampler(
+            interval=settings.profiling_interval_ms / 1000,
+            thread_ids=[threading.get_ident()],
+        )
+
+        sampler.start()
+        try:
+            response = await call_next(request)
+        finally:
+            sampler.stop()
+            profile_store.save(
+                request_id,
+                sampler,
+                type="request",
+                method=request.method,
+                path=request.url.path,
+            )
+            logger.info(
+                f"[{request_id}] 프로파일 저장 - samples: {sampler.samples}, "
+                f"duration: {sampler.duration * 1000:.1f}ms"
+            )
+
+        response.headers["X-Profile-ID"] = request_id
+        return response
@@ -0,0 +1,33 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.query_stats import query_monitor
+from app.middleware.request_id import get_request_id
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    요청별 SQL 쿼리 계측 미들웨어
+
+    요청 처리 중 실행된 쿼리 수와 DB 시간을 Server-Timing 헤더로 반환하고,
+    기준을 넘는 요청은 request ID와 함께 경고 로그를 남깁니다.
+    스트리밍 응답의 본문 전송 중 실행된 쿼리는 헤더에 포함되지 않습니다.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        query_monitor.install()
+
+    async def dispatch(self, request: Request, call_next):
+        token = query_monitor.begin()
+        try:
+            response = await call_next(request)
+        finally:
+            request_id = getattr(request.state, "request_id", None) or get_request_id()
+            stats = query_monitor.end(token, request_id, request.method, request.url.path)
+
+        server_timing = response.headers.get("Server-Timing")
+        response.headers["Server-Timing"] = (
+            f"{server_timing}, {stats.server_timing()}" if server_timing else stats.server_timing()
+        )
+        return response
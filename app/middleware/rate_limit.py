@@ -2,10 +2,14 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 from datetime import datetime, timedelta
+from functools import lru_cache
+from ipaddress import ip_address, ip_network
 from typing import Dict, Tuple
 from collections import defaultdict
 import asyncio
 
+from app.core.config import settings
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -63,18 +67,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def _get_client_ip(self, request: Request) -> str:
         """클라이언트 IP 주소 추출"""
-        # X-Forwarded-For 헤더 확인 (프록시 뒤에 있을 경우)
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-
-        # X-Real-IP 헤더 확인
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-
-        # 직접 연결된 클라이언트 IP
-        return request.client.host if request.client else "unknown"
+        return get_client_ip(request)
 
     def _check_rate_limit(self, client_ip: str) -> Tuple[bool, int]:
         """
@@ -144,3 +137,44 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 # 빈 기록 제거
                 if not self.request_counts[ip]:
                     del self.request_counts[ip]
+
+
+@lru_cache(maxsize=8)
+def _trusted_networks(proxies: Tuple[str, ...]) -> Tuple:
+    return tuple(ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def _is_trusted(host: str, networks: Tuple) -> bool:
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in networks)
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    클라이언트 IP 주소 추출
+
+    X-Forwarded-For/X-Real-IP는 클라이언트가 임의로 보낼 수 있으므로 직접 연결한 상대가
+    신뢰할 프록시(TRUSTED_PROXIES)일 때만 사용합니다. X-Forwarded-For는 오른쪽(가까운
+    프록시)부터 신뢰할 프록시를 건너뛰고 처음 나오는 주소를 클라이언트로 봅니다.
+    """
+    # 직접 연결된 클라이언트 IP
+    peer = request.client.host if request.client else "unknown"
+    networks = _trusted_networks(tuple(settings.trusted_proxies))
+    if not _is_trusted(peer, networks):
+        return peer
+
+    # X-Forwarded-For 헤더 확인 (신뢰할 프록시 뒤에 있을 경우)
+    forwarded = [part.strip() for part in request.headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+    for address in reversed(forwarded):
+        if not _is_trusted(address, networks):
+            return address
+    if forwarded:
+        # 모든 주소가 신뢰할 프록시이면 가장 앞의 주소
+        return forwarded[0]
+
+    # X-Real-IP 헤더 확인
+    real_ip = request.headers.get("X-Real-IP", "").strip()
+    return real_ip or peer
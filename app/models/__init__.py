@@ -1,9 +1,10 @@
-from app.models.user import User, OAuthProvider, UserResponse, TokenResponse
+from app.models.user import User, OAuthProvider, UserPage, UserResponse, TokenResponse
 from app.models.post import Post
 
 __all__ = [
     "User",
     "OAuthProvider",
+    "UserPage",
     "UserResponse",
     "TokenResponse",
     "Post",
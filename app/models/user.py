@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -39,6 +39,13 @@ class User(BaseModel):
         }
 
 
+class UserPage(BaseModel):
+    """사용자 목록 페이지 (키셋 페이지네이션)"""
+    items: List[User] = Field(..., description="사용자 목록 (이메일 순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+
+
 class TokenResponse(BaseModel):
     """토큰 응답 (액세스 + 리프레시)"""
     access_token: str = Field(..., description="JWT 액세스 토큰 (짧은 만료 시간)", example="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...")
@@ -1,35 +1,69 @@
 # ruff: noqa: S1192
 """계정 관리 라우터 (관리자 전용)"""
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.db.models.user import User
-from app.db.models.department import Department
-from app.schemas.user_auth import UserCreate, UserResponse, UserInfoUpdate
+from app.schemas.user_auth import UserCreate, UserAccountPage, UserResponse, UserInfoUpdate
 from app.services.manager_service import ManagerService
 from app.services.password_service import PasswordService
+from app.services.principal_cache import principal_cache
 from app.core.messages import ErrorMessages
+from app.utils.pagination import cursor_value, decode_cursor, encode_cursor
+from app.utils.responses import typed_json_response
 
 router = APIRouter(prefix="/accounts", tags=["계정 관리 (관리자 전용)"])
 
 
 @router.get(
     "/users",
-    response_model=List[UserResponse],
+    response_model=UserAccountPage,
     summary="사용자 계정 목록 조회",
-    description="관리자가 모든 사용자 계정 목록을 조회합니다."
+    description=(
+        "관리자가 사용자 계정 목록을 ID 순으로 조회합니다. 부서/첫 로그인 여부로 필터링할 수 있으며, "
+        "응답의 next_cursor를 cursor로 넘겨 다음 페이지를 조회합니다."
+    )
 )
 async def get_users(
+    department_id: Optional[int] = Query(None, description="부서 ID"),
+    is_first_login: Optional[bool] = Query(None, description="첫 로그인 여부 (비밀번호 미변경 계정)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200, description="페이지 크기"),
     username: str = Depends(ManagerService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """사용자 계정 목록 조회 (관리자 전용)"""
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+    conditions = []
+    if department_id is not None:
+        conditions.append(User.department_id == department_id)
+    if is_first_login is not None:
+        conditions.append(User.is_first_login == is_first_login)
+
+    # 커서 이후 항목만 조회 (ID 순)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, size=1)
+        last_id = cursor_value(last_id, int)
+        conditions.append(User.user_id > last_id)
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    result = await db.execute(
+        select(User)
+        .where(*conditions)
+        .order_by(User.user_id)
+        .limit(limit + 1)
+    )
+    users = list(result.scalars().all())
+
+    has_more = len(users) > limit
+    users = users[:limit]
+    next_cursor = encode_cursor([users[-1].user_id]) if has_more else None
+
+    page = UserAccountPage(items=users, next_cursor=next_cursor, has_more=has_more)
+    return typed_json_response(UserAccountPage, page)
 
 
 @router.get(
@@ -41,7 +75,7 @@ async def get_users(
 async def get_user(
     user_id: int,
     username: str = Depends(ManagerService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """특정 사용자 계정 조회 (관리자 전용)"""
     result = await db.execute(
@@ -52,7 +86,7 @@ async def get_user(
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="ErrorMessages.USER_NOT_FOUND"
+            detail=ErrorMessages.USER_NOT_FOUND
         )
 
     return user
@@ -71,31 +105,36 @@ async def create_user(
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 계정 생성 (관리자 전용)"""
-    # 중복 username 확인
-    result = await db.execute(
-        select(User).where(User.username == user_data.username)
-    )
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
+    # 중복 아이디는 해싱 전에 거부 (동시 생성 경쟁만 유니크 제약으로 확인)
+    exists = await db.scalar(select(User.user_id).where(User.username == user_data.username))
+    if exists is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ErrorMessages.USER_ALREADY_EXISTS"
+            detail=ErrorMessages.USER_ALREADY_EXISTS
         )
 
     # 비밀번호 해싱
-    hashed_password = PasswordService.hash_password(user_data.password)
-
-    # 사용자 생성 (첫 로그인 상태로)
-    new_user = User(
-        username=user_data.username,
-        password_hash=hashed_password,
-        is_first_login=True  # 첫 로그인 상태
-    )
+    hashed_password = await PasswordService.hash_password_async(user_data.password)
+
+    # 사용자 생성 (첫 로그인 상태로, 확인 이후 동시에 생성한 경우는 유니크 제약으로 확인)
+    try:
+        result = await db.execute(
+            insert(User)
+            .values(
+                username=user_data.username,
+                password_hash=hashed_password,
+                is_first_login=True  # 첫 로그인 상태
+            )
+            .returning(User)
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorMessages.USER_ALREADY_EXISTS
+        )
+    new_user = result.scalar_one()
 
-    db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
 
     return new_user
 
@@ -113,43 +152,35 @@ async def update_user(
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 계정 수정 (관리자 전용)"""
-    # 사용자 조회
-    result = await db.execute(
-        select(User).where(User.user_id == user_id)
-    )
+    update_data = user_data.model_dump(exclude_none=True)
+
+    # UPDATE ... RETURNING 한 번으로 수정 (부서 존재 여부는 외래키 제약으로 확인)
+    statement = select(User).where(User.user_id == user_id)
+    if update_data:
+        statement = (
+            update(User)
+            .where(User.user_id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+    try:
+        result = await db.execute(statement)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorMessages.INVALID_DEPARTMENT
+        )
     user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="ErrorMessages.USER_NOT_FOUND"
-        )
-
-    # 부서 변경 시 존재 여부 확인
-    if user_data.department_id is not None:
-        dept_result = await db.execute(
-            select(Department).where(Department.department_id == user_data.department_id)
+            detail=ErrorMessages.USER_NOT_FOUND
         )
-        department = dept_result.scalar_one_or_none()
-
-        if not department:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="ErrorMessages.INVALID_DEPARTMENT"
-            )
-
-    # 정보 업데이트
-    if user_data.manager_name is not None:
-        user.manager_name = user_data.manager_name
-    if user_data.manager_number is not None:
-        user.manager_number = user_data.manager_number
-    if user_data.department_id is not None:
-        user.department_id = user_data.department_id
 
     await db.commit()
-    await db.refresh(user)
 
-    return user
+    return principal_cache.store("user", user.username, UserResponse.model_validate(user).model_dump())
 
 
 @router.delete(
@@ -164,19 +195,18 @@ async def delete_user(
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 계정 삭제 (관리자 전용)"""
-    # 사용자 조회
     result = await db.execute(
-        select(User).where(User.user_id == user_id)
+        delete(User).where(User.user_id == user_id).returning(User.username)
     )
-    user = result.scalar_one_or_none()
+    deleted_username = result.scalar_one_or_none()
 
-    if not user:
+    if deleted_username is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="ErrorMessages.USER_NOT_FOUND"
+            detail=ErrorMessages.USER_NOT_FOUND
         )
 
-    await db.delete(user)
     await db.commit()
+    principal_cache.invalidate("user", deleted_username)
 
     return None
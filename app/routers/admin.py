@@ -0,0 +1,93 @@
+import asyncio
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.profiling import StackSampler, profile_store, verify_profiling_token
+
+router = APIRouter(prefix="/admin", tags=["운영 관리"])
+
+# 프로세스 전체 샘플링은 한 번에 하나만 실행
+_process_sampling_lock = asyncio.Lock()
+
+
+def require_profiling_token(x_profile_token: Optional[str] = Header(None)) -> str:
+    """프로파일링 토큰 검증 의존성"""
+    if not verify_profiling_token(x_profile_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="프로파일링 권한이 없습니다."
+        )
+    return x_profile_token
+
+
+@router.post(
+    "/profiling/sample",
+    summary="프로세스 전체 샘플링 프로파일",
+    description="""
+    지정한 시간 동안 프로세스의 모든 스레드를 샘플링하여 프로파일을 저장합니다.
+
+    **인증 필요**: `X-Profile-Token` 헤더에 프로파일링 토큰을 포함해야 합니다.
+    """,
+)
+async def sample_process(
+    duration: float = Query(5.0, gt=0, le=settings.profiling_max_duration_seconds, description="샘플링 시간 (초)"),
+    token: str = Depends(require_profiling_token)
+):
+    """프로세스 전체 샘플링"""
+    if _process_sampling_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 프로파일링이 진행 중입니다."
+        )
+
+    async with _process_sampling_lock:
+        profile_id = f"process_{uuid.uuid4().hex[:12]}"
+        sampler = StackSampler(interval=settings.profiling_interval_ms / 1000)
+
+        sampler.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            sampler.stop()
+
+        profile = profile_store.save(profile_id, sampler, type="process")
+
+    logger.info(f"프로세스 프로파일 저장 - {profile_id}, samples: {sampler.samples}")
+    return {key: value for key, value in profile.items() if key != "collapsed"}
+
+
+@router.get(
+    "/profiles",
+    summary="저장된 프로파일 목록",
+    description="저장된 프로파일 목록을 최신순으로 조회합니다. **인증 필요**",
+)
+async def get_profiles(token: str = Depends(require_profiling_token)):
+    """프로파일 목록 조회"""
+    return profile_store.list()
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_class=PlainTextResponse,
+    summary="프로파일 조회 (collapsed stack)",
+    description="""
+    프로파일을 collapsed stack 형식으로 반환합니다.
+
+    `flamegraph.pl` 또는 speedscope에 그대로 입력할 수 있습니다.
+    요청 단위 프로파일의 ID는 해당 요청의 `X-Request-ID`입니다.
+    """,
+)
+async def get_profile(profile_id: str, token: str = Depends(require_profiling_token)):
+    """프로파일 조회"""
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로파일을 찾을 수 없습니다."
+        )
+    return PlainTextResponse(profile["collapsed"])
@@ -1,9 +1,10 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.db.models.department import Department
 from app.schemas.department import (
     DepartmentCreate,
@@ -11,7 +12,10 @@ from app.schemas.department import (
     DepartmentResponse,
     DepartmentListItem
 )
+from app.services.department_cache import department_cache
+from app.services.principal_cache import principal_cache
 from app.services.user_service import UserService
+from app.utils.http_cache import conditional_response, make_collection_etag, make_etag, row_version
 from app.services.manager_service import ManagerService
 
 router = APIRouter(prefix="/departments", tags=["부서"])
@@ -24,11 +28,24 @@ router = APIRouter(prefix="/departments", tags=["부서"])
     description="모든 부서 목록을 조회합니다. (사용자/관리자 모두 접근 가능)"
 )
 async def get_departments(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """부서 목록 조회"""
-    result = await db.execute(select(Department))
-    departments = result.scalars().all()
+    """부서 목록 조회 (If-None-Match 지원)"""
+    departments = await department_cache.all(db)
+
+    # 삭제는 최종 수정 시각에 드러나지 않으므로 목록은 ETag로만 비교
+    not_modified = conditional_response(
+        request,
+        response,
+        etag=make_collection_etag(
+            (department["department_id"], row_version(department)) for department in departments
+        ),
+    )
+    if not_modified:
+        return not_modified
+
     return departments
 
 
@@ -40,13 +57,12 @@ async def get_departments(
 )
 async def get_department(
     department_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """부서 상세 조회"""
-    result = await db.execute(
-        select(Department).where(Department.department_id == department_id)
-    )
-    department = result.scalar_one_or_none()
+    """부서 상세 조회 (If-None-Match/If-Modified-Since 지원)"""
+    department = await department_cache.get(db, department_id)
 
     if not department:
         raise HTTPException(
@@ -54,6 +70,15 @@ async def get_department(
             detail="부서를 찾을 수 없습니다."
         )
 
+    not_modified = conditional_response(
+        request,
+        response,
+        etag=make_etag("department", *row_version(department)),
+        last_modified=department["updated_at"],
+    )
+    if not_modified:
+        return not_modified
+
     return department
 
 
@@ -70,27 +95,26 @@ async def create_department(
     db: AsyncSession = Depends(get_db)
 ):
     """부서 생성 (관리자 전용)"""
-    # 중복 부서명 확인
-    result = await db.execute(
-        select(Department).where(Department.department_name == department_data.department_name)
-    )
-    existing_department = result.scalar_one_or_none()
-
-    if existing_department:
+    # INSERT ... RETURNING 한 번으로 생성 (부서명 중복은 유니크 제약으로 확인)
+    try:
+        result = await db.execute(
+            insert(Department)
+            .values(
+                department_name=department_data.department_name,
+                description=department_data.description
+            )
+            .returning(Department)
+        )
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 존재하는 부서명입니다."
         )
+    new_department = result.scalar_one()
 
-    # 부서 생성
-    new_department = Department(
-        department_name=department_data.department_name,
-        description=department_data.description
-    )
-
-    db.add(new_department)
+    await department_cache.publish(db)
     await db.commit()
-    await db.refresh(new_department)
+    department_cache.invalidate()
 
     return new_department
 
@@ -108,10 +132,28 @@ async def update_department(
     db: AsyncSession = Depends(get_db)
 ):
     """부서 정보 수정 (관리자 전용)"""
-    # 부서 조회
-    result = await db.execute(
-        select(Department).where(Department.department_id == department_id)
-    )
+    update_data = {}
+    if department_data.department_name is not None:
+        update_data["department_name"] = department_data.department_name
+    if department_data.description is not None:
+        update_data["description"] = department_data.description
+
+    # UPDATE ... RETURNING 한 번으로 수정 (대상이 없으면 404)
+    statement = select(Department).where(Department.department_id == department_id)
+    if update_data:
+        statement = (
+            update(Department)
+            .where(Department.department_id == department_id)
+            .values(**update_data)
+            .returning(Department)
+        )
+    try:
+        result = await db.execute(statement)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 존재하는 부서명입니다."
+        )
     department = result.scalar_one_or_none()
 
     if not department:
@@ -120,30 +162,9 @@ async def update_department(
             detail="부서를 찾을 수 없습니다."
         )
 
-    # 부서명 중복 확인 (변경하는 경우)
-    if department_data.department_name is not None:
-        dup_result = await db.execute(
-            select(Department).where(
-                Department.department_name == department_data.department_name,
-                Department.department_id != department_id
-            )
-        )
-        existing_department = dup_result.scalar_one_or_none()
-
-        if existing_department:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 존재하는 부서명입니다."
-            )
-
-    # 정보 업데이트
-    if department_data.department_name is not None:
-        department.department_name = department_data.department_name
-    if department_data.description is not None:
-        department.description = department_data.description
-
+    await department_cache.publish(db)
     await db.commit()
-    await db.refresh(department)
+    department_cache.invalidate()
 
     return department
 
@@ -160,19 +181,21 @@ async def delete_department(
     db: AsyncSession = Depends(get_db)
 ):
     """부서 삭제 (관리자 전용)"""
-    # 부서 조회
+    # 삭제된 행이 없으면 404 (소속 기간제 인력은 외래키 CASCADE로 함께 삭제)
     result = await db.execute(
-        select(Department).where(Department.department_id == department_id)
+        delete(Department).where(Department.department_id == department_id)
     )
-    department = result.scalar_one_or_none()
 
-    if not department:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="부서를 찾을 수 없습니다."
         )
 
-    await db.delete(department)
+    await department_cache.publish(db)
     await db.commit()
+    department_cache.invalidate()
+    # 소속 사용자의 부서는 외래키 SET NULL로 비워지므로 사용자 스냅샷도 무효화
+    principal_cache.clear("user")
 
     return None
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.db.models.manager import Manager
 from app.schemas.manager import (
     ManagerCreate,
@@ -12,6 +13,9 @@ from app.schemas.manager import (
 )
 from app.services.manager_service import ManagerService
 from app.services.password_service import PasswordService
+from app.services.principal_cache import principal_cache
+from app.services.login_throttle import login_throttle
+from app.middleware.rate_limit import get_client_ip
 
 router = APIRouter(prefix="/manager", tags=["관리자"])
 
@@ -28,31 +32,36 @@ async def manager_signup(
     db: AsyncSession = Depends(get_db)
 ):
     """관리자 회원가입"""
-    # 중복 username 확인
-    result = await db.execute(
-        select(Manager).where(Manager.username == manager_data.username)
-    )
-    existing_manager = result.scalar_one_or_none()
-
-    if existing_manager:
+    # 중복 아이디는 해싱 전에 거부 (동시 가입 경쟁만 유니크 제약으로 확인)
+    exists = await db.scalar(select(Manager.manager_id).where(Manager.username == manager_data.username))
+    if exists is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 존재하는 아이디입니다."
         )
 
     # 비밀번호 해싱
-    hashed_password = PasswordService.hash_password(manager_data.password)
-
-    # 관리자 생성
-    new_manager = Manager(
-        username=manager_data.username,
-        password_hash=hashed_password,
-        email=manager_data.email
-    )
+    hashed_password = await PasswordService.hash_password_async(manager_data.password)
+
+    # 관리자 생성 (확인 이후 동시에 가입한 경우는 유니크 제약으로 확인)
+    try:
+        result = await db.execute(
+            insert(Manager)
+            .values(
+                username=manager_data.username,
+                password_hash=hashed_password,
+                email=manager_data.email
+            )
+            .returning(Manager)
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 존재하는 아이디입니다."
+        )
+    new_manager = result.scalar_one()
 
-    db.add(new_manager)
     await db.commit()
-    await db.refresh(new_manager)
 
     return new_manager
 
@@ -65,9 +74,14 @@ async def manager_signup(
 )
 async def manager_login(
     login_data: ManagerLogin,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """관리자 로그인"""
+    # 잠긴 아이디/IP는 DB 조회와 비밀번호 검증 전에 거부
+    client_ip = get_client_ip(request)
+    await login_throttle.check("manager", login_data.username, client_ip)
+
     # 관리자 조회
     result = await db.execute(
         select(Manager).where(Manager.username == login_data.username)
@@ -75,18 +89,29 @@ async def manager_login(
     manager = result.scalar_one_or_none()
 
     if not manager:
+        await login_throttle.register_failure("manager", login_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 또는 비밀번호가 올바르지 않습니다."
         )
 
     # 비밀번호 검증
-    if not PasswordService.verify_password(login_data.password, manager.password_hash):
+    verified, new_hash = await PasswordService.verify_and_update_password_async(
+        login_data.password, manager.password_hash
+    )
+    if not verified:
+        await login_throttle.register_failure("manager", login_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 또는 비밀번호가 올바르지 않습니다."
         )
 
+    # 해싱 설정(스킴, 비용)이 바뀐 경우 새 해시로 교체 (get_db에서 커밋)
+    if new_hash:
+        manager.password_hash = new_hash
+
+    await login_throttle.register_success("manager", login_data.username, client_ip)
+
     # 토큰 생성
     tokens = ManagerService.create_tokens(manager.username)
 
@@ -106,9 +131,15 @@ async def manager_login(
 )
 async def get_current_manager(
     username: str = Depends(ManagerService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """현재 로그인한 관리자 정보 조회"""
+    # 같은 관리자의 반복 조회는 캐시된 스냅샷 사용
+    cached = principal_cache.get("manager", username)
+    if cached is not None:
+        return cached
+
+    generation = principal_cache.generation
     result = await db.execute(
         select(Manager).where(Manager.username == username)
     )
@@ -120,4 +151,4 @@ async def get_current_manager(
             detail="관리자를 찾을 수 없습니다."
         )
 
-    return manager
+    return principal_cache.put("manager", username, ManagerResponse.model_validate(manager).model_dump(), generation)
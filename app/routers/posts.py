@@ -1,13 +1,20 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from typing import List, Optional
 
-from app.models import User
+from app.models import Post as StoredPost, User
 from app.schemas import Post, PostCreate, PostUpdate
 from app.services import AuthService
 from app.core.database import db
+from app.core.response_cache import normalize_query, response_cache
+from app.utils.compression import response_encoding
+from app.utils.fieldsets import parse_fields
+from app.utils.http_cache import conditional_response, make_etag
+from app.utils.responses import json_adapter, typed_json_response
 
 router = APIRouter(prefix="/posts", tags=["게시글"])
 
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (콤마로 구분, 예: id,title)"
+
 
 @router.post(
     "/",
@@ -99,10 +106,29 @@ async def create_post(
         200: {"description": "게시글 목록 조회 성공"}
     }
 )
-async def get_posts(skip: int = 0, limit: int = 100) -> List[Post]:
-    """게시글 목록 조회 (최신순)"""
-    posts = db.get_all_posts(skip=skip, limit=limit)
-    return posts
+async def get_posts(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """게시글 목록 조회 (최신순, 직렬화된 응답 캐시 사용)"""
+    selected = parse_fields(fields, Post)
+    include = {"__all__": set(selected)} if selected else None
+
+    async def render() -> bytes:
+        return json_adapter(List[StoredPost]).dump_json(db.get_all_posts(skip=skip, limit=limit), include=include)
+
+    key = normalize_query(skip=skip, limit=limit, fields=",".join(selected) if selected else None)
+    body, cache_status = await response_cache.get_or_compute("posts", key, render)
+    headers = {"X-Cache": cache_status}
+
+    # 압축본도 캐시에서 재사용 (미들웨어는 Content-Encoding이 있으면 다시 압축하지 않음)
+    encoding = response_encoding(request.headers.get("accept-encoding", ""), len(body))
+    if encoding:
+        body = response_cache.encoded("posts", key, body, encoding)
+        headers.update({"Content-Encoding": encoding, "Vary": "Accept-Encoding"})
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -122,11 +148,15 @@ async def get_posts(skip: int = 0, limit: int = 100) -> List[Post]:
 async def get_my_posts(
     current_user: User = Depends(AuthService.get_current_user),
     skip: int = 0,
-    limit: int = 100
-) -> List[Post]:
+    limit: int = 100,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
     """내가 작성한 게시글 조회"""
+    selected = parse_fields(fields, Post)
     posts = db.get_posts_by_author(current_user.email, skip=skip, limit=limit)
-    return posts
+    return typed_json_response(
+        List[StoredPost], posts, include={"__all__": set(selected)} if selected else None
+    )
 
 
 @router.get(
@@ -138,17 +168,29 @@ async def get_my_posts(
     """,
     responses={
         200: {"description": "게시글 조회 성공"},
+        304: {"description": "변경 없음 (If-None-Match/If-Modified-Since)"},
         404: {"description": "게시글을 찾을 수 없음"}
     }
 )
-async def get_post(post_id: str) -> Post:
-    """게시글 상세 조회"""
+async def get_post(post_id: str, request: Request, response: Response) -> Post:
+    """게시글 상세 조회 (If-None-Match/If-Modified-Since 지원)"""
     post = db.get_post(post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다."
         )
+
+    # 변경이 없으면 직렬화 없이 304
+    not_modified = conditional_response(
+        request,
+        response,
+        etag=make_etag("post", post.id, post.updated_at),
+        last_modified=post.updated_at,
+    )
+    if not_modified:
+        return not_modified
+
     return post
 
 
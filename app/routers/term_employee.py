@@ -1,74 +1,255 @@
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from datetime import date
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple, Type
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import delete, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
+from pydantic import BaseModel, create_model
 
-from app.db.session import get_db
-from app.db.models.term_employee import TermEmployee
-from app.db.models.department import Department
+from app.db.session import get_db, get_read_db
+from app.db.models.term_employee import TermEmployee, EmploymentStatus
 from app.schemas.term_employee import (
     TermEmployeeCreate,
     TermEmployeeUpdate,
     TermEmployeeSearch,
     TermEmployeeListItem,
-    TermEmployeeResponse
+    TermEmployeePage,
+    TermEmployeeResponse,
+    TermEmployeeImportResult,
+    TermEmployeeDashboard
 )
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.core.messages import ErrorMessages
 from app.services.user_service import UserService
+from app.services.term_employee_export import TermEmployeeExportService
+from app.services.term_employee_import import TermEmployeeImportService
+from app.services.term_employee_search import TermEmployeeSearchService, SearchMode, name_index
+from app.services.term_employee_summary import TermEmployeeSummaryService
+from app.utils.http_cache import conditional_response, make_etag, row_version
+from app.utils.fieldsets import parse_fields, partial_model
+from app.utils.pagination import cursor_value, decode_cursor, encode_cursor
+from app.utils.responses import typed_json_response
 
 router = APIRouter(prefix="/term-employees", tags=["기간제 인력"])
 
+FIELDS_DESCRIPTION = "응답 항목에 포함할 필드 (콤마로 구분, 예: term_employee_id,name)"
+
+
+def list_load_options(selected: Optional[Tuple[str, ...]], *extra: str) -> List:
+    """목록 응답에 필요한 컬럼만 조회하는 옵션 (주소/비고 등 상세 컬럼 제외)"""
+    names = selected if selected is not None else tuple(TermEmployeeListItem.model_fields)
+    return [load_only(*(getattr(TermEmployee, name) for name in dict.fromkeys(names + extra)))]
+
+
+def list_item_model(selected: Optional[Tuple[str, ...]]) -> Type[BaseModel]:
+    """요청한 필드에 맞는 목록 아이템 응답 모델"""
+    return TermEmployeeListItem if selected is None else partial_model(TermEmployeeListItem, selected)
+
+
+@lru_cache(maxsize=None)
+def list_page_model(item_model: Type[BaseModel]) -> Type[BaseModel]:
+    """목록 아이템 모델에 맞는 페이지 응답 모델"""
+    if item_model is TermEmployeeListItem:
+        return TermEmployeePage
+    return create_model(
+        f"{TermEmployeePage.__name__}Fields", __base__=TermEmployeePage, items=(List[item_model], ...)
+    )
+
 
 @router.get(
     "/search",
     response_model=List[TermEmployeeListItem],
     summary="기간제 인력 검색",
-    description="이름(필수)과 생년월일(선택)로 기간제 인력을 검색합니다."
+    description=(
+        "이름(필수)과 생년월일(선택)로 기간제 인력을 검색합니다. "
+        "초성(예: ㅎㄱㄷ)이나 공백/전각이 섞인 이름도 검색할 수 있습니다."
+    )
 )
 async def search_term_employees(
-    name: str = Query(..., description="이름 (필수)"),
+    name: str = Query(..., min_length=1, description="이름 또는 초성 (필수)"),
     birthdate: Optional[str] = Query(None, description="생년월일 (선택, YYYY-MM-DD 형식)"),
+    mode: SearchMode = Query("auto", description="검색 방식 (auto, similar: 유사도, prefix: 접두어/초성 자동완성)"),
+    limit: int = Query(100, ge=1, le=500, description="최대 결과 수"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     username: str = Depends(UserService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """기간제 인력 검색"""
-    # 기본 검색 조건 (이름)
-    conditions = [TermEmployee.name.like(f"%{name}%")]
+    selected = parse_fields(fields, TermEmployeeListItem)
 
-    # 생년월일 조건 추가
+    # 생년월일 조건
+    birthdate_obj = None
     if birthdate:
         from datetime import datetime
         try:
             birthdate_obj = datetime.strptime(birthdate, "%Y-%m-%d").date()
-            conditions.append(TermEmployee.birthdate == birthdate_obj)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="생년월일 형식이 올바르지 않습니다. (YYYY-MM-DD)"
             )
 
-    # 검색 실행
-    result = await db.execute(
-        select(TermEmployee).where(and_(*conditions))
+    # 인덱스 검색 (유사도 또는 접두어/초성)
+    employees = await TermEmployeeSearchService.search(
+        db, name, mode=mode, birthdate=birthdate_obj, limit=limit, options=list_load_options(selected)
+    )
+
+    return typed_json_response(List[list_item_model(selected)], employees, from_attributes=True)
+
+
+def term_employee_filters(
+    department_id: Optional[int] = Query(None, description="부서 ID"),
+    employee_status: Optional[EmploymentStatus] = Query(None, alias="status", description="고용 상태"),
+    position: Optional[str] = Query(None, description="직종"),
+    employed_from: Optional[date] = Query(None, description="재직기간 조회 시작일 (이 날짜 이후까지 재직)"),
+    employed_to: Optional[date] = Query(None, description="재직기간 조회 종료일 (이 날짜 이전부터 재직)"),
+) -> List:
+    """목록/내보내기 공통 필터 조건"""
+    conditions = []
+    if department_id is not None:
+        conditions.append(TermEmployee.department_id == department_id)
+    if employee_status is not None:
+        conditions.append(TermEmployee.status == employee_status)
+    if position:
+        conditions.append(TermEmployee.position == position)
+    if employed_from:
+        conditions.append(TermEmployee.employment_end_date >= employed_from)
+    if employed_to:
+        conditions.append(TermEmployee.employment_start_date <= employed_to)
+    return conditions
+
+
+@router.get(
+    "/export",
+    summary="기간제 인력 내보내기",
+    description=(
+        "목록 조회와 같은 필터로 기간제 인력 전체를 CSV 또는 NDJSON으로 내려받습니다. "
+        "행을 DB 커서로 읽으면서 바로 전송하므로 건수와 관계없이 메모리 사용량이 일정합니다."
+    ),
+    response_class=StreamingResponse,
+)
+async def export_term_employees(
+    conditions: List = Depends(term_employee_filters),
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format", description="파일 형식"),
+    username: str = Depends(UserService.verify_token),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """기간제 인력 내보내기"""
+    # 스트리밍이 끝날 때까지 세션이 유지됨 (의존성 정리는 응답 전송 후 실행)
+    rows = TermEmployeeExportService.stream_rows(db, conditions)
+    if export_format == "csv":
+        body, media_type = TermEmployeeExportService.to_csv(rows), "text/csv"
+    else:
+        body, media_type = TermEmployeeExportService.to_ndjson(rows), "application/x-ndjson"
+
+    filename = f"term_employees_{date.today():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/dashboard",
+    response_model=TermEmployeeDashboard,
+    summary="부서별 기간제 인력 현황",
+    description=(
+        "부서별 재직/휴직 인원과 만료 예정(기준일부터 N일 이내 종료) 인원을 조회합니다. "
+        "등록/수정/삭제 및 계약 만료 배치 시 갱신되는 집계 테이블에서 읽습니다."
+    )
+)
+async def get_term_employee_dashboard(
+    username: str = Depends(UserService.verify_token),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """부서별 기간제 인력 현황"""
+    departments = await TermEmployeeSummaryService.get_dashboard(db)
+    return TermEmployeeDashboard(
+        expiring_within_days=settings.term_employee_expiring_within_days,
+        total_active=sum(item["active_count"] for item in departments),
+        total_on_leave=sum(item["on_leave_count"] for item in departments),
+        total_expiring=sum(item["expiring_count"] for item in departments),
+        departments=departments,
     )
-    employees = result.scalars().all()
 
-    return employees
+
+# 목록 정렬 기준 컬럼
+LIST_SORT_COLUMNS = {
+    "term_employee_id": TermEmployee.term_employee_id,
+    "name": TermEmployee.name,
+    "employment_start_date": TermEmployee.employment_start_date,
+    "employment_end_date": TermEmployee.employment_end_date,
+}
 
 
 @router.get(
     "",
-    response_model=List[TermEmployeeListItem],
+    response_model=TermEmployeePage,
     summary="기간제 인력 목록 조회",
-    description="모든 기간제 인력 목록을 조회합니다."
+    description=(
+        "기간제 인력 목록을 조회합니다. 부서/상태/직종/재직기간으로 필터링할 수 있으며, "
+        "응답의 next_cursor를 cursor로 넘겨 다음 페이지를 조회합니다."
+    )
 )
 async def get_term_employees(
+    conditions: List = Depends(term_employee_filters),
+    sort_by: Literal["term_employee_id", "name", "employment_start_date", "employment_end_date"] = Query(
+        "term_employee_id", description="정렬 기준"
+    ),
+    order: Literal["asc", "desc"] = Query("asc", description="정렬 방향"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200, description="페이지 크기"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     username: str = Depends(UserService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """기간제 인력 목록 조회"""
-    result = await db.execute(select(TermEmployee))
-    employees = result.scalars().all()
-    return employees
+    selected = parse_fields(fields, TermEmployeeListItem)
+    sort_column = LIST_SORT_COLUMNS[sort_by]
+    descending = order == "desc"
+
+    # 커서 이후 항목만 조회 (정렬 키 + ID)
+    if cursor:
+        cursor_sort_by, cursor_order, last_value, last_id = decode_cursor(cursor, size=4)
+        if cursor_sort_by != sort_by or cursor_order != order:
+            raise BadRequestException(detail=ErrorMessages.INVALID_CURSOR, error_code="INVALID_CURSOR")
+        last_value = cursor_value(last_value, sort_column.type.python_type)
+        last_id = cursor_value(last_id, int)
+
+        keyset = tuple_(sort_column, TermEmployee.term_employee_id)
+        boundary = tuple_(last_value, last_id)
+        conditions.append(keyset < boundary if descending else keyset > boundary)
+
+    ordering = [sort_column, TermEmployee.term_employee_id]
+    if descending:
+        ordering = [column.desc() for column in ordering]
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    result = await db.execute(
+        select(TermEmployee)
+        .options(*list_load_options(selected, sort_by))
+        .where(*conditions)
+        .order_by(*ordering)
+        .limit(limit + 1)
+    )
+    employees = list(result.scalars().all())
+
+    has_more = len(employees) > limit
+    employees = employees[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = employees[-1]
+        next_cursor = encode_cursor([sort_by, order, getattr(last, sort_by), last.term_employee_id])
+
+    page_model = list_page_model(list_item_model(selected))
+    page = page_model(items=employees, next_cursor=next_cursor, has_more=has_more)
+    return typed_json_response(page_model, page)
 
 
 @router.get(
@@ -79,10 +260,12 @@ async def get_term_employees(
 )
 async def get_term_employee(
     employee_id: int,
+    request: Request,
+    response: Response,
     username: str = Depends(UserService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """기간제 인력 상세 조회"""
+    """기간제 인력 상세 조회 (If-None-Match/If-Modified-Since 지원)"""
     result = await db.execute(
         select(TermEmployee).where(TermEmployee.term_employee_id == employee_id)
     )
@@ -94,6 +277,17 @@ async def get_term_employee(
             detail="기간제 인력을 찾을 수 없습니다."
         )
 
+    # 변경이 없으면 직렬화 없이 304 (개인정보이므로 공유 캐시 저장 금지)
+    not_modified = conditional_response(
+        request,
+        response,
+        etag=make_etag("term_employee", *row_version(employee)),
+        last_modified=employee.updated_at,
+        cache_control="private, no-cache",
+    )
+    if not_modified:
+        return not_modified
+
     return employee
 
 
@@ -110,40 +304,59 @@ async def create_term_employee(
     db: AsyncSession = Depends(get_db)
 ):
     """기간제 인력 등록"""
-    # 부서 존재 여부 확인
-    dept_result = await db.execute(
-        select(Department).where(Department.department_id == employee_data.department_id)
-    )
-    department = dept_result.scalar_one_or_none()
-
-    if not department:
+    # INSERT ... RETURNING 한 번으로 생성 (부서 존재 여부는 외래키로 확인)
+    try:
+        result = await db.execute(
+            insert(TermEmployee)
+            .values(
+                **employee_data.model_dump(),
+                **TermEmployeeSearchService.name_keys(employee_data.name),
+            )
+            .returning(TermEmployee)
+        )
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="존재하지 않는 부서입니다."
         )
+    new_employee = result.scalar_one()
 
-    # 기간제 인력 생성
-    new_employee = TermEmployee(
-        name=employee_data.name,
-        birthdate=employee_data.birthdate,
-        address=employee_data.address,
-        department_id=employee_data.department_id,
-        employment_start_date=employee_data.employment_start_date,
-        employment_end_date=employee_data.employment_end_date,
-        status=employee_data.status,
-        position=employee_data.position,
-        manager_name=employee_data.manager_name,
-        manager_number=employee_data.manager_number,
-        notes=employee_data.notes
-    )
-
-    db.add(new_employee)
+    await TermEmployeeSummaryService.refresh(db, [new_employee.department_id])
     await db.commit()
-    await db.refresh(new_employee)
+
+    name_index.upsert(new_employee.term_employee_id, new_employee.name)
 
     return new_employee
 
 
+@router.post(
+    "/import",
+    response_model=TermEmployeeImportResult,
+    summary="기간제 인력 일괄 등록",
+    description=(
+        "CSV 또는 XLSX 파일로 기간제 인력을 일괄 등록합니다. 첫 행은 헤더이며 필드명(name) 또는 "
+        "항목명(이름)을 사용할 수 있습니다. 오류가 있는 행은 건너뛰고 행 번호와 함께 반환합니다."
+    )
+)
+async def import_term_employees(
+    file: UploadFile = File(..., description="CSV 또는 XLSX 파일"),
+    encoding: Literal["utf-8", "cp949"] = Query("utf-8", description="CSV 파일 인코딩"),
+    dry_run: bool = Query(False, description="검증만 수행하고 등록하지 않음"),
+    username: str = Depends(UserService.verify_token),
+    db: AsyncSession = Depends(get_db)
+):
+    """기간제 인력 일괄 등록"""
+    rows = TermEmployeeImportService.open_rows(file, encoding)
+    result = await TermEmployeeImportService.import_rows(db, rows, dry_run=dry_run)
+
+    if result["imported"] and not dry_run:
+        await db.commit()
+        # 인프로세스 이름 인덱스는 다음 검색 시 다시 로드
+        name_index.clear()
+
+    return result
+
+
 @router.put(
     "/{employee_id}",
     response_model=TermEmployeeResponse,
@@ -157,10 +370,35 @@ async def update_term_employee(
     db: AsyncSession = Depends(get_db)
 ):
     """기간제 인력 정보 수정"""
-    # 기간제 인력 조회
-    result = await db.execute(
-        select(TermEmployee).where(TermEmployee.term_employee_id == employee_id)
-    )
+    update_data = employee_data.dict(exclude_unset=True)
+    if update_data.get("name"):
+        update_data.update(TermEmployeeSearchService.name_keys(update_data["name"]))
+
+    # 부서 이동 시에만 이전 부서 조회 (집계 갱신용)
+    previous_department_id = None
+    if "department_id" in update_data:
+        previous_department_id = await db.scalar(
+            select(TermEmployee.department_id).where(TermEmployee.term_employee_id == employee_id)
+        )
+
+    # UPDATE ... RETURNING 한 번으로 수정 (대상이 없으면 404)
+    statement = select(TermEmployee).where(TermEmployee.term_employee_id == employee_id)
+    if update_data:
+        statement = (
+            update(TermEmployee)
+            .where(TermEmployee.term_employee_id == employee_id)
+            .values(**update_data)
+            .returning(TermEmployee)
+        )
+    try:
+        result = await db.execute(statement)
+    except IntegrityError:
+        if "department_id" not in update_data:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 부서입니다."
+        )
     employee = result.scalar_one_or_none()
 
     if not employee:
@@ -169,26 +407,10 @@ async def update_term_employee(
             detail="기간제 인력을 찾을 수 없습니다."
         )
 
-    # 부서 변경 시 존재 여부 확인
-    if employee_data.department_id is not None:
-        dept_result = await db.execute(
-            select(Department).where(Department.department_id == employee_data.department_id)
-        )
-        department = dept_result.scalar_one_or_none()
-
-        if not department:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="존재하지 않는 부서입니다."
-            )
-
-    # 정보 업데이트
-    update_data = employee_data.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(employee, key, value)
-
+    await TermEmployeeSummaryService.refresh(db, [previous_department_id, employee.department_id])
     await db.commit()
-    await db.refresh(employee)
+
+    name_index.upsert(employee.term_employee_id, employee.name)
 
     return employee
 
@@ -205,19 +427,23 @@ async def delete_term_employee(
     db: AsyncSession = Depends(get_db)
 ):
     """기간제 인력 삭제"""
-    # 기간제 인력 조회
+    # DELETE ... RETURNING 한 번으로 삭제 (대상이 없으면 404)
     result = await db.execute(
-        select(TermEmployee).where(TermEmployee.term_employee_id == employee_id)
+        delete(TermEmployee)
+        .where(TermEmployee.term_employee_id == employee_id)
+        .returning(TermEmployee.department_id)
     )
-    employee = result.scalar_one_or_none()
+    department_id = result.scalar_one_or_none()
 
-    if not employee:
+    if department_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="기간제 인력을 찾을 수 없습니다."
         )
 
-    await db.delete(employee)
+    await TermEmployeeSummaryService.refresh(db, [department_id])
     await db.commit()
 
+    name_index.remove(employee_id)
+
     return None
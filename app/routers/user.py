@@ -1,10 +1,10 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.db.models.user import User
-from app.db.models.department import Department
 from app.schemas.user_auth import (
     UserLogin,
     FirstLoginInfoUpdate,
@@ -15,6 +15,10 @@ from app.schemas.user_auth import (
 )
 from app.services.user_service import UserService
 from app.services.password_service import PasswordService
+from app.services.department_cache import department_cache
+from app.services.principal_cache import principal_cache
+from app.services.login_throttle import login_throttle
+from app.middleware.rate_limit import get_client_ip
 
 router = APIRouter(prefix="/user", tags=["사용자"])
 
@@ -27,9 +31,14 @@ router = APIRouter(prefix="/user", tags=["사용자"])
 )
 async def user_login(
     login_data: UserLogin,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 로그인"""
+    # 잠긴 아이디/IP는 DB 조회와 비밀번호 검증 전에 거부
+    client_ip = get_client_ip(request)
+    await login_throttle.check("user", login_data.username, client_ip)
+
     # 사용자 조회
     result = await db.execute(
         select(User).where(User.username == login_data.username)
@@ -37,18 +46,29 @@ async def user_login(
     user = result.scalar_one_or_none()
 
     if not user:
+        await login_throttle.register_failure("user", login_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 또는 비밀번호가 올바르지 않습니다."
         )
 
     # 비밀번호 검증
-    if not PasswordService.verify_password(login_data.password, user.password_hash):
+    verified, new_hash = await PasswordService.verify_and_update_password_async(
+        login_data.password, user.password_hash
+    )
+    if not verified:
+        await login_throttle.register_failure("user", login_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 또는 비밀번호가 올바르지 않습니다."
         )
 
+    # 해싱 설정(스킴, 비용)이 바뀐 경우 새 해시로 교체 (get_db에서 커밋)
+    if new_hash:
+        user.password_hash = new_hash
+
+    await login_throttle.register_success("user", login_data.username, client_ip)
+
     # 토큰 생성
     tokens = UserService.create_tokens(user.username)
 
@@ -73,48 +93,57 @@ async def update_first_login_info(
     db: AsyncSession = Depends(get_db)
 ):
     """첫 로그인 정보 입력"""
-    # 사용자 조회
-    result = await db.execute(
-        select(User).where(User.username == username)
-    )
-    user = result.scalar_one_or_none()
-
-    if not user:
+    # 사용자 상태와 부서(캐시)는 해싱 전에 확인 (거부될 요청에 해싱 비용을 쓰지 않음)
+    is_first_login = await db.scalar(select(User.is_first_login).where(User.username == username))
+    if is_first_login is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다."
         )
-
-    # 첫 로그인이 아닌 경우
-    if not user.is_first_login:
+    if not is_first_login:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 첫 로그인 정보를 입력했습니다."
         )
+    if await department_cache.get(db, info.department_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 부서입니다."
+        )
 
-    # 부서 존재 여부 확인
-    dept_result = await db.execute(
-        select(Department).where(Department.department_id == info.department_id)
-    )
-    department = dept_result.scalar_one_or_none()
-
-    if not department:
+    password_hash = await PasswordService.hash_password_async(info.new_password)
+
+    # 첫 로그인 상태인 경우에만 갱신 (확인 이후 동시에 바뀐 경우는 조건/외래키 제약으로 확인)
+    try:
+        result = await db.execute(
+            update(User)
+            .where(User.username == username, User.is_first_login.is_(True))
+            .values(
+                manager_name=info.manager_name,
+                manager_number=info.manager_number,
+                department_id=info.department_id,
+                password_hash=password_hash,
+                is_first_login=False
+            )
+            .returning(User)
+        )
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="존재하지 않는 부서입니다."
         )
+    user = result.scalar_one_or_none()
 
-    # 정보 업데이트
-    user.manager_name = info.manager_name
-    user.manager_number = info.manager_number
-    user.department_id = info.department_id
-    user.password_hash = PasswordService.hash_password(info.new_password)
-    user.is_first_login = False
+    # 확인 이후 다른 요청이 먼저 입력한 경우
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 첫 로그인 정보를 입력했습니다."
+        )
 
     await db.commit()
-    await db.refresh(user)
 
-    return user
+    return principal_cache.store("user", username, UserResponse.model_validate(user).model_dump())
 
 
 @router.get(
@@ -125,9 +154,15 @@ async def update_first_login_info(
 )
 async def get_current_user(
     username: str = Depends(UserService.verify_token),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """현재 로그인한 사용자 정보 조회"""
+    # 같은 사용자의 반복 조회는 캐시된 스냅샷 사용
+    cached = principal_cache.get("user", username)
+    if cached is not None:
+        return cached
+
+    generation = principal_cache.generation
     result = await db.execute(
         select(User).where(User.username == username)
     )
@@ -139,7 +174,7 @@ async def get_current_user(
             detail="사용자를 찾을 수 없습니다."
         )
 
-    return user
+    return principal_cache.put("user", username, UserResponse.model_validate(user).model_dump(), generation)
 
 
 @router.put(
@@ -154,10 +189,24 @@ async def update_user_info(
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 정보 수정"""
-    # 사용자 조회
-    result = await db.execute(
-        select(User).where(User.username == username)
-    )
+    update_data = info.model_dump(exclude_none=True)
+
+    # UPDATE ... RETURNING 한 번으로 수정 (부서 존재 여부는 외래키 제약으로 확인)
+    statement = select(User).where(User.username == username)
+    if update_data:
+        statement = (
+            update(User)
+            .where(User.username == username)
+            .values(**update_data)
+            .returning(User)
+        )
+    try:
+        result = await db.execute(statement)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 부서입니다."
+        )
     user = result.scalar_one_or_none()
 
     if not user:
@@ -166,31 +215,9 @@ async def update_user_info(
             detail="사용자를 찾을 수 없습니다."
         )
 
-    # 부서 변경 시 존재 여부 확인
-    if info.department_id is not None:
-        dept_result = await db.execute(
-            select(Department).where(Department.department_id == info.department_id)
-        )
-        department = dept_result.scalar_one_or_none()
-
-        if not department:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="존재하지 않는 부서입니다."
-            )
-
-    # 정보 업데이트
-    if info.manager_name is not None:
-        user.manager_name = info.manager_name
-    if info.manager_number is not None:
-        user.manager_number = info.manager_number
-    if info.department_id is not None:
-        user.department_id = info.department_id
-
     await db.commit()
-    await db.refresh(user)
 
-    return user
+    return principal_cache.store("user", username, UserResponse.model_validate(user).model_dump())
 
 
 @router.put(
@@ -218,15 +245,16 @@ async def change_password(
         )
 
     # 현재 비밀번호 확인
-    if not PasswordService.verify_password(password_data.current_password, user.password_hash):
+    if not await PasswordService.verify_password_async(password_data.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다."
         )
 
     # 새 비밀번호로 변경
-    user.password_hash = PasswordService.hash_password(password_data.new_password)
+    user.password_hash = await PasswordService.hash_password_async(password_data.new_password)
 
     await db.commit()
+    principal_cache.invalidate("user", username)
 
     return {"message": "비밀번호가 성공적으로 변경되었습니다."}
@@ -1,43 +1,73 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from typing import Optional
 
 from app.services import AuthService
-from app.models import User
+from app.models import OAuthProvider, User, UserPage
 from app.core.database import db
+from app.utils.fieldsets import parse_fields
+from app.utils.pagination import cursor_value, decode_cursor, encode_cursor
+from app.utils.responses import typed_json_response
 
 router = APIRouter(prefix="/users", tags=["사용자"])
 
 @router.get(
     "/",
-    response_model=List[User],
-    summary="모든 사용자 조회",
-    description="시스템에 등록된 모든 사용자 목록을 조회합니다. **인증 필요**",
+    response_model=UserPage,
+    summary="사용자 목록 조회",
+    description=(
+        "시스템에 등록된 사용자 목록을 이메일 순으로 조회합니다. 제공자/이메일 인증 여부로 "
+        "필터링할 수 있으며, 응답의 next_cursor를 cursor로 넘겨 다음 페이지를 조회합니다. **인증 필요**"
+    ),
     responses={
         200: {
             "description": "사용자 목록 조회 성공",
             "content": {
                 "application/json": {
-                    "example": [
-                        {
-                            "email": "user1@example.com",
-                            "name": "김철수",
-                            "picture": "https://example.com/avatar1.jpg",
-                            "verified_email": True,
-                            "provider": "google",
-                            "provider_id": "google_123456",
-                            "created_at": "2024-01-08T12:00:00Z",
-                            "updated_at": "2024-01-08T12:00:00Z"
-                        }
-                    ]
+                    "example": {
+                        "items": [
+                            {
+                                "email": "user1@example.com",
+                                "name": "김철수",
+                                "picture": "https://example.com/avatar1.jpg",
+                                "verified_email": True,
+                                "provider": "google",
+                                "provider_id": "google_123456",
+                                "created_at": "2024-01-08T12:00:00Z",
+                                "updated_at": "2024-01-08T12:00:00Z"
+                            }
+                        ],
+                        "next_cursor": "WyJ1c2VyMUBleGFtcGxlLmNvbSJd",
+                        "has_more": True
+                    }
                 }
             }
         },
+        400: {"description": "잘못된 커서 또는 필드"},
         401: {"description": "인증 실패"}
     }
 )
-async def get_all_users(current_user: User = Depends(AuthService.get_current_user)):
-    """모든 사용자 조회"""
-    return db.get_all_users()
+async def get_all_users(
+    provider: Optional[OAuthProvider] = Query(None, description="OAuth 제공자"),
+    verified: Optional[bool] = Query(None, description="이메일 인증 여부"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200, description="페이지 크기"),
+    fields: Optional[str] = Query(None, description="응답 항목에 포함할 필드 (콤마로 구분, 예: email,name)"),
+    current_user: User = Depends(AuthService.get_current_user)
+):
+    """사용자 목록 조회"""
+    selected = parse_fields(fields, User)
+
+    after = None
+    if cursor:
+        (after,) = decode_cursor(cursor, size=1)
+        after = cursor_value(after, str)
+
+    users, has_more = db.list_users(after=after, limit=limit, provider=provider, verified_email=verified)
+    next_cursor = encode_cursor([users[-1].email]) if has_more else None
+
+    page = UserPage(items=users, next_cursor=next_cursor, has_more=has_more)
+    include = {"items": {"__all__": set(selected)}, "next_cursor": True, "has_more": True} if selected else None
+    return typed_json_response(UserPage, page, include=include)
 
 
 @router.get(
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from datetime import date, datetime
 from app.db.models.term_employee import EmploymentStatus
@@ -92,6 +92,13 @@ class TermEmployeeListItem(BaseModel):
         from_attributes = True
 
 
+class TermEmployeePage(BaseModel):
+    """기간제 인력 목록 페이지 스키마 (키셋 페이지네이션)"""
+    items: List[TermEmployeeListItem]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+
+
 class TermEmployeeResponse(BaseModel):
     """기간제 인력 상세 응답 스키마"""
     term_employee_id: int
@@ -111,3 +118,39 @@ class TermEmployeeResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TermEmployeeImportError(BaseModel):
+    """일괄 등록 행 오류 스키마"""
+    row: int = Field(..., description="파일 행 번호 (헤더가 1행)")
+    field: Optional[str] = Field(None, description="오류 필드")
+    message: str = Field(..., description="오류 내용")
+
+
+class TermEmployeeImportResult(BaseModel):
+    """일괄 등록 결과 스키마"""
+    total_rows: int = Field(..., description="전체 데이터 행 수")
+    imported: int = Field(..., description="등록된 행 수 (dry_run이면 등록 가능한 행 수)")
+    failed: int = Field(..., description="오류가 있는 행 수")
+    dry_run: bool = Field(..., description="검증만 수행했는지 여부")
+    errors: List[TermEmployeeImportError] = Field(default_factory=list, description="행별 오류 (최대 개수 제한)")
+
+
+class DepartmentEmployeeSummary(BaseModel):
+    """부서별 기간제 인력 현황 스키마"""
+    department_id: int
+    department_name: str
+    active_count: int = Field(..., description="재직 인원")
+    on_leave_count: int = Field(..., description="휴직 인원")
+    expiring_count: int = Field(..., description="만료 예정 인원 (재직/휴직 중)")
+    base_date: Optional[date] = Field(None, description="만료 예정 집계 기준일")
+    updated_at: Optional[datetime] = Field(None, description="집계 갱신 시각")
+
+
+class TermEmployeeDashboard(BaseModel):
+    """기간제 인력 현황 대시보드 스키마"""
+    expiring_within_days: int = Field(..., description="만료 예정 기준 일수")
+    total_active: int
+    total_on_leave: int
+    total_expiring: int
+    departments: List[DepartmentEmployeeSummary]
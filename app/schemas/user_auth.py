@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
@@ -129,6 +129,13 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class UserAccountPage(BaseModel):
+    """사용자 계정 목록 페이지 스키마 (키셋 페이지네이션)"""
+    items: List[UserResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+
+
 class UserTokenResponse(BaseModel):
     """사용자 토큰 응답 스키마"""
     user: UserResponse
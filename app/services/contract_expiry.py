@@ -0,0 +1,177 @@
+import asyncio
+import time
+from contextlib import suppress
+from datetime import date, datetime
+from typing import Dict, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.models.term_employee import IN_SERVICE_STATUSES, EmploymentStatus, TermEmployee
+from app.db.session import engine
+from app.services.term_employee_summary import TermEmployeeSummaryService
+
+# 워커 간 중복 실행 방지용 PostgreSQL advisory lock 키
+LEADER_LOCK_KEY = 7_301_001
+
+
+class ContractExpiryJob:
+    """
+    기간제 인력 계약 만료 배치
+
+    재직기간 종료일이 지난 재직/휴직 인력을 주기적으로 퇴사 상태로 바꿉니다.
+    여러 워커가 떠 있어도 advisory lock을 잡은 한 워커만 실행하며,
+    한 번에 batch_size건씩 나눠 갱신해 행 잠금 시간을 짧게 유지합니다.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        interval: float = 3600.0,
+        batch_size: int = 1000,
+    ):
+        self.engine = engine
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.runs = 0
+        self.skipped_runs = 0
+        self.failed_runs = 0
+        self.total_terminated = 0
+        self.last_terminated = 0
+        self.last_run_at: Optional[str] = None
+        self.last_duration_ms = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        """스케줄러 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def _try_lock(self, conn: AsyncConnection) -> bool:
+        """리더 잠금 획득 (PostgreSQL 외에는 단일 프로세스로 보고 항상 성공)"""
+        if conn.dialect.name != "postgresql":
+            return True
+        acquired = await conn.scalar(select(func.pg_try_advisory_lock(LEADER_LOCK_KEY)))
+        await conn.commit()
+        return bool(acquired)
+
+    async def _unlock(self, conn: AsyncConnection):
+        # 실패한 배치가 남긴 트랜잭션 정리 후 잠금 해제
+        await conn.rollback()
+        if conn.dialect.name != "postgresql":
+            return
+        await conn.execute(select(func.pg_advisory_unlock(LEADER_LOCK_KEY)))
+        await conn.commit()
+
+    async def run_once(self, today: Optional[date] = None) -> Optional[int]:
+        """
+        만료 처리 1회 실행
+
+        갱신한 건수를 반환하며, 다른 워커가 실행 중이면 None을 반환합니다.
+        """
+        today = today or date.today()
+        table = TermEmployee.__table__
+        expired_ids = (
+            select(table.c.term_employee_id)
+            .where(
+                table.c.status.in_(IN_SERVICE_STATUSES),
+                table.c.employment_end_date < today,
+            )
+            .limit(self.batch_size)
+            .scalar_subquery()
+        )
+        statement = (
+            update(table)
+            .where(table.c.term_employee_id.in_(expired_ids))
+            .values(status=EmploymentStatus.TERMINATED, updated_at=func.now())
+        )
+
+        started = time.perf_counter()
+        terminated = 0
+        # 세션 수준 잠금이므로 실행 동안 같은 커넥션을 유지
+        async with self.engine.connect() as conn:
+            if not await self._try_lock(conn):
+                self.skipped_runs += 1
+                return None
+
+            try:
+                while True:
+                    result = await conn.execute(statement)
+                    await conn.commit()
+                    terminated += result.rowcount
+                    if result.rowcount < self.batch_size:
+                        break
+
+                # 부서별 현황 집계 갱신 (만료 예정 기준일도 함께 이동)
+                await TermEmployeeSummaryService.refresh(conn, today=today)
+                await conn.commit()
+            finally:
+                await self._unlock(conn)
+
+        self.runs += 1
+        self.last_terminated = terminated
+        self.total_terminated += terminated
+        self.last_run_at = datetime.now().isoformat()
+        self.last_duration_ms = (time.perf_counter() - started) * 1000
+        self.last_error = None
+
+        logger.info(
+            f"계약 만료 배치 완료 - 기준일 {today}, 퇴사 처리 {terminated}건, "
+            f"{self.last_duration_ms:.1f}ms"
+        )
+        return terminated
+
+    async def _run_forever(self):
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed_runs += 1
+                self.last_error = str(e)
+                logger.error(f"계약 만료 배치 실패: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """주기 실행 시작 (이벤트 루프에서 호출)"""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self):
+        """주기 실행 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        return {
+            "enabled": self.is_running,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "skipped_runs": self.skipped_runs,
+            "failed_runs": self.failed_runs,
+            "total_terminated": self.total_terminated,
+            "last_terminated": self.last_terminated,
+            "last_run_at": self.last_run_at,
+            "last_duration_ms": round(self.last_duration_ms, 2),
+            "last_error": self.last_error,
+        }
+
+
+# 글로벌 계약 만료 배치 인스턴스
+contract_expiry_job = ContractExpiryJob(
+    engine=engine,
+    interval=settings.contract_expiry_interval_seconds,
+    batch_size=settings.contract_expiry_batch_size,
+)
@@ -0,0 +1,182 @@
+import asyncio
+from contextlib import suppress
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.models.department import Department
+from app.db.session import engine, listen_engine
+
+# 부서 변경 알림 채널 (PostgreSQL LISTEN/NOTIFY)
+DEPARTMENT_CHANNEL = "department_changed"
+
+
+class DepartmentCache:
+    """
+    인프로세스 부서 캐시
+
+    부서 목록은 거의 바뀌지 않으므로 워커마다 메모리에 두고 조회합니다.
+    부서를 등록/수정/삭제하면 같은 트랜잭션에서 NOTIFY를 보내고, 각 워커는
+    LISTEN으로 받아 캐시를 비웁니다. 다음 조회 때 기본 DB에서 다시 읽습니다.
+    LISTEN 커넥션은 요청용 풀이 아닌 별도 엔진(listen_engine)에서 엽니다.
+    PostgreSQL(asyncpg)이 아니면 단일 프로세스로 보고 로컬 무효화만 합니다.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        listen_engine: Optional[AsyncEngine] = None,
+        enabled: bool = True,
+        reconnect_interval: float = 5.0,
+    ):
+        self.engine = engine
+        self.listen_engine = listen_engine or engine
+        self.enabled = enabled
+        self.reconnect_interval = reconnect_interval
+        self._departments: Optional[Dict[int, Dict]] = None
+        self._version = 0
+        self._task: Optional[asyncio.Task] = None
+        self.listening = False
+
+        # 통계
+        self.hits = 0
+        self.loads = 0
+        self.invalidations = 0
+        self.notifications = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        """캐시 적재 여부"""
+        return self._departments is not None
+
+    def invalidate(self):
+        """캐시 비우기 (진행 중인 적재 결과도 버림)"""
+        self._version += 1
+        self._departments = None
+        self.invalidations += 1
+
+    async def _load(self, db: AsyncSession) -> Dict[int, Dict]:
+        # 복제 지연으로 오래된 목록을 캐시하지 않도록 기본 DB에서 읽음
+        version = self._version
+        conn = await db.connection()
+        result = await conn.execute(
+            select(*Department.__table__.c).order_by(Department.department_id)
+        )
+        departments = {row["department_id"]: dict(row) for row in result.mappings().all()}
+
+        self.loads += 1
+        if version == self._version:
+            self._departments = departments
+        return departments
+
+    async def _get_all(self, db: AsyncSession) -> Dict[int, Dict]:
+        departments = self._departments
+        if departments is not None and self.enabled:
+            self.hits += 1
+            return departments
+        return await self._load(db)
+
+    async def all(self, db: AsyncSession) -> List[Dict]:
+        """부서 목록 (부서 ID 순)"""
+        return list((await self._get_all(db)).values())
+
+    async def get(self, db: AsyncSession, department_id: int) -> Optional[Dict]:
+        """부서 조회 (없으면 None)"""
+        return (await self._get_all(db)).get(department_id)
+
+    async def existing_ids(self, db: AsyncSession, department_ids: Iterable[int]) -> Set[int]:
+        """존재하는 부서 ID만 반환"""
+        departments = await self._get_all(db)
+        return {department_id for department_id in department_ids if department_id in departments}
+
+    async def publish(self, db: AsyncSession):
+        """
+        부서 변경 알림 (커밋 전에 호출)
+
+        NOTIFY는 커밋 시점에 전달되고 롤백되면 전달되지 않습니다.
+        커밋 후에는 invalidate()로 현재 워커의 캐시도 비워야 합니다.
+        """
+        if db.bind.dialect.name == "postgresql":
+            await db.execute(select(func.pg_notify(DEPARTMENT_CHANNEL, "")))
+
+    def _on_notify(self, connection, pid, channel, payload):
+        self.notifications += 1
+        self.invalidate()
+
+    async def _listen(self):
+        """알림 수신 커넥션 유지 (끊기면 재연결)"""
+        while True:
+            try:
+                async with self.listen_engine.connect() as conn:
+                    raw_connection = await conn.get_raw_connection()
+                    driver_connection = raw_connection.driver_connection
+                    await driver_connection.add_listener(DEPARTMENT_CHANNEL, self._on_notify)
+                    try:
+                        # 수신 시작 전의 변경은 알 수 없으므로 다시 적재
+                        self.invalidate()
+                        await self._warm_up()
+                        self.listening = True
+                        while not driver_connection.is_closed():
+                            await asyncio.sleep(self.reconnect_interval)
+                    finally:
+                        self.listening = False
+                        if not driver_connection.is_closed():
+                            await driver_connection.remove_listener(DEPARTMENT_CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.invalidate()
+                logger.error(f"부서 캐시 알림 수신 실패: {e}")
+            await asyncio.sleep(self.reconnect_interval)
+
+    async def _warm_up(self):
+        try:
+            async with AsyncSession(self.engine) as db:
+                await self._load(db)
+        except Exception as e:
+            logger.error(f"부서 캐시 적재 실패: {e}")
+
+    async def _run(self):
+        if self.engine.dialect.driver == "asyncpg":
+            await self._listen()
+        else:
+            await self._warm_up()
+
+    def start(self):
+        """캐시 적재 및 변경 알림 수신 시작 (이벤트 루프에서 호출)"""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """알림 수신 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        return {
+            "enabled": self.enabled,
+            "loaded": self.is_loaded,
+            "size": len(self._departments or {}),
+            "listening": self.listening,
+            "hits": self.hits,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+            "notifications": self.notifications,
+        }
+
+
+# 글로벌 부서 캐시 인스턴스
+department_cache = DepartmentCache(
+    engine=engine,
+    listen_engine=listen_engine,
+    enabled=settings.department_cache_enabled,
+)
@@ -0,0 +1,231 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.messages import ErrorMessages
+
+
+class InMemoryThrottleBackend:
+    """
+    인메모리 로그인 실패 기록 저장소 (LRU)
+
+    워커 프로세스마다 독립적으로 동작하며, 최대 항목 수를 넘으면
+    가장 오래 사용되지 않은 기록부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        # key -> (failures, expires_at, locked_until)
+        self._records: "OrderedDict[str, Tuple[int, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, now: float) -> Optional[Tuple[int, float, float]]:
+        record = self._records.get(key)
+        if record is None:
+            return None
+        if record[1] <= now and record[2] <= now:
+            del self._records[key]
+            return None
+        self._records.move_to_end(key)
+        return record
+
+    def _put(self, key: str, record: Tuple[int, float, float]):
+        self._records[key] = record
+        self._records.move_to_end(key)
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
+
+    async def get_locked_until(self, key: str) -> float:
+        """잠금 해제 시각 조회 (잠겨있지 않으면 0)"""
+        now = time.time()
+        with self._lock:
+            record = self._get(key, now)
+            return record[2] if record and record[2] > now else 0.0
+
+    async def incr_failures(self, key: str, window: int) -> int:
+        """실패 횟수 증가 후 반환"""
+        now = time.time()
+        with self._lock:
+            record = self._get(key, now)
+            failures = (record[0] if record and record[1] > now else 0) + 1
+            locked_until = record[2] if record else 0.0
+            self._put(key, (failures, now + window, locked_until))
+            return failures
+
+    async def set_locked_until(self, key: str, locked_until: float):
+        """잠금 해제 시각 설정"""
+        now = time.time()
+        with self._lock:
+            record = self._get(key, now)
+            failures, expires_at = (record[0], record[1]) if record else (0, now)
+            self._put(key, (failures, expires_at, locked_until))
+
+    async def reset(self, key: str):
+        """기록 삭제"""
+        with self._lock:
+            self._records.pop(key, None)
+
+    def size(self) -> int:
+        """저장된 기록 수"""
+        with self._lock:
+            return len(self._records)
+
+
+class RedisThrottleBackend:
+    """
+    Redis 로그인 실패 기록 저장소
+
+    여러 워커/인스턴스가 실패 기록을 공유합니다. `redis` 패키지가 필요합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "login_throttle"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "LOGIN_THROTTLE_REDIS_URL을 사용하려면 redis 패키지가 필요합니다. (pip install redis)"
+            ) from e
+
+        self.prefix = prefix
+        self._client = redis.from_url(url, decode_responses=True)
+
+    async def get_locked_until(self, key: str) -> float:
+        """잠금 해제 시각 조회 (잠겨있지 않으면 0)"""
+        value = await self._client.get(f"{self.prefix}:lock:{key}")
+        return float(value) if value else 0.0
+
+    async def incr_failures(self, key: str, window: int) -> int:
+        """실패 횟수 증가 후 반환"""
+        failures_key = f"{self.prefix}:failures:{key}"
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.incr(failures_key)
+            pipe.expire(failures_key, window)
+            failures, _ = await pipe.execute()
+        return int(failures)
+
+    async def set_locked_until(self, key: str, locked_until: float):
+        """잠금 해제 시각 설정"""
+        ttl = max(1, int(locked_until - time.time()) + 1)
+        await self._client.set(f"{self.prefix}:lock:{key}", str(locked_until), ex=ttl)
+
+    async def reset(self, key: str):
+        """기록 삭제"""
+        await self._client.delete(f"{self.prefix}:failures:{key}", f"{self.prefix}:lock:{key}")
+
+    def size(self) -> Optional[int]:
+        """저장된 기록 수 (공유 저장소는 집계하지 않음)"""
+        return None
+
+
+class LoginThrottle:
+    """
+    로그인 무차별 대입 / 크리덴셜 스터핑 차단
+
+    아이디별, IP별 실패 횟수를 기록하고 임계값을 넘으면 지수적으로
+    늘어나는 시간 동안 잠급니다. 잠긴 요청은 DB 조회와 비밀번호 검증
+    전에 거부되므로 공격 트래픽이 해싱 CPU를 소모하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        backend,
+        username_threshold: int = 5,
+        ip_threshold: int = 20,
+        base_lockout: float = 30.0,
+        max_lockout: float = 900.0,
+        window: int = 900,
+        enabled: bool = True,
+    ):
+        self.backend = backend
+        self.enabled = enabled
+        self.username_threshold = username_threshold
+        self.ip_threshold = ip_threshold
+        self.base_lockout = base_lockout
+        self.max_lockout = max_lockout
+        self.window = window
+
+        # 통계
+        self.blocked_attempts = 0
+        self.lockouts = 0
+
+    @staticmethod
+    def _keys(scope: str, username: str, client_ip: str) -> Tuple[str, str]:
+        """아이디/IP 기록 키"""
+        return f"{scope}:user:{username.lower()}", f"{scope}:ip:{client_ip}"
+
+    async def check(self, scope: str, username: str, client_ip: str):
+        """잠금 여부 확인 (잠겨 있으면 429 예외)"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        locked_until = 0.0
+        for key in self._keys(scope, username, client_ip):
+            locked_until = max(locked_until, await self.backend.get_locked_until(key))
+
+        if locked_until > now:
+            self.blocked_attempts += 1
+            retry_after = int(locked_until - now) + 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=ErrorMessages.LOGIN_TOO_MANY_ATTEMPTS,
+                headers={"Retry-After": str(retry_after)},
+            )
+
+    async def register_failure(self, scope: str, username: str, client_ip: str):
+        """로그인 실패 기록 및 필요 시 잠금"""
+        if not self.enabled:
+            return
+
+        user_key, ip_key = self._keys(scope, username, client_ip)
+        for key, threshold in ((user_key, self.username_threshold), (ip_key, self.ip_threshold)):
+            failures = await self.backend.incr_failures(key, self.window)
+            if failures >= threshold:
+                lockout = min(self.max_lockout, self.base_lockout * 2 ** (failures - threshold))
+                await self.backend.set_locked_until(key, time.time() + lockout)
+                self.lockouts += 1
+                logger.warning(
+                    f"로그인 잠금 - {key}, 실패 {failures}회, {lockout:.0f}초"
+                )
+
+    async def register_success(self, scope: str, username: str, client_ip: str):
+        """로그인 성공 시 아이디 기록 초기화 (IP 기록은 유지)"""
+        if not self.enabled:
+            return
+
+        user_key, _ = self._keys(scope, username, client_ip)
+        await self.backend.reset(user_key)
+
+    def stats(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if isinstance(self.backend, RedisThrottleBackend) else "memory",
+            "tracked_keys": self.backend.size(),
+            "lockouts": self.lockouts,
+            "blocked_attempts": self.blocked_attempts,
+        }
+
+
+def _create_backend():
+    """설정에 따른 저장소 생성"""
+    if settings.login_throttle_redis_url:
+        return RedisThrottleBackend(settings.login_throttle_redis_url)
+    return InMemoryThrottleBackend(max_entries=settings.login_throttle_max_entries)
+
+
+# 글로벌 로그인 차단기 인스턴스
+login_throttle = LoginThrottle(
+    backend=_create_backend(),
+    username_threshold=settings.login_throttle_username_threshold,
+    ip_threshold=settings.login_throttle_ip_threshold,
+    base_lockout=settings.login_throttle_base_lockout_seconds,
+    max_lockout=settings.login_throttle_max_lockout_seconds,
+    window=settings.login_throttle_window_seconds,
+    enabled=settings.login_throttle_enabled,
+)
@@ -1,7 +1,178 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# Argon2id 비용 프로필 (memory_cost: KiB, time_cost: 반복 횟수, parallelism: 레인 수)
+ARGON2_PROFILES: Dict[str, Dict[str, int]] = {
+    # OWASP 권장 최소값 - 메모리가 작은 환경용
+    "low_memory": {"memory_cost": 19456, "time_cost": 2, "parallelism": 1},
+    # 일반적인 로그인 서버 기본값
+    "interactive": {"memory_cost": 65536, "time_cost": 3, "parallelism": 4},
+    # 로그인 빈도가 낮고 CPU 여유가 있는 환경용
+    "sensitive": {"memory_cost": 262144, "time_cost": 4, "parallelism": 4},
+}
+
+
+def get_argon2_params() -> Dict[str, int]:
+    """설정된 프로필에 개별 설정값을 덮어쓴 Argon2id 파라미터 반환"""
+    if settings.argon2_profile not in ARGON2_PROFILES:
+        raise ValueError(
+            f"알 수 없는 Argon2 프로필입니다: {settings.argon2_profile} "
+            f"(사용 가능: {', '.join(ARGON2_PROFILES)})"
+        )
+
+    params = dict(ARGON2_PROFILES[settings.argon2_profile])
+    if settings.argon2_memory_cost is not None:
+        params["memory_cost"] = settings.argon2_memory_cost
+    if settings.argon2_time_cost is not None:
+        params["time_cost"] = settings.argon2_time_cost
+    if settings.argon2_parallelism is not None:
+        params["parallelism"] = settings.argon2_parallelism
+    return params
+
+
+def build_crypt_context(
+    scheme: str,
+    argon2_params: Optional[Dict[str, int]] = None,
+    bcrypt_rounds: Optional[int] = None,
+) -> CryptContext:
+    """
+    비밀번호 해싱 컨텍스트 생성
+
+    첫 번째 스킴으로 새 해시를 만들고, 나머지 스킴은 deprecated로 표시되어
+    기존 해시 검증에만 사용됩니다. (로그인 시 needs_update로 재해싱)
+    """
+    argon2_params = argon2_params or get_argon2_params()
+    schemes = ["argon2", "bcrypt"] if scheme == "argon2" else ["bcrypt", "argon2"]
+    return CryptContext(
+        schemes=schemes,
+        deprecated="auto",
+        argon2__type="ID",
+        argon2__memory_cost=argon2_params["memory_cost"],
+        argon2__rounds=argon2_params["time_cost"],
+        argon2__parallelism=argon2_params["parallelism"],
+        bcrypt__rounds=bcrypt_rounds or settings.bcrypt_rounds,
+    )
+
+
 # 비밀번호 해싱 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_crypt_context(settings.password_hash_scheme)
+
+
+class _Job:
+    """대기열 작업 상태 (시작 여부는 워커, 포기 여부는 요청 쪽에서 잠금 안에서 기록)"""
+
+    __slots__ = ("started", "abandoned")
+
+    def __init__(self):
+        self.started = False
+        self.abandoned = False
+
+
+class PasswordHashingPool:
+    """
+    비밀번호 해싱 전용 워커 풀
+
+    비밀번호 해싱/검증을 이벤트 루프 밖의 스레드 풀에서 실행합니다.
+    동시 실행 수는 워커 수로 제한되며, 대기열이 가득 차면 요청을 거부합니다.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 100):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # 통계
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """스레드 풀 (최초 사용 시 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash",
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """워커 풀에서 함수 실행"""
+        with self._lock:
+            if self.max_queue and self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                    headers={"Retry-After": "1"},
+                )
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+        job = _Job()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, self._call, job, func, args)
+        finally:
+            # 워커가 시작하기 전에 취소된 경우(클라이언트 연결 종료 등) 대기열 자리 반환
+            with self._lock:
+                if not job.started:
+                    job.abandoned = True
+                    self.queued -= 1
+
+    def _call(self, job: "_Job", func: Callable[..., T], args: tuple) -> T:
+        """워커 스레드에서 실행되는 래퍼"""
+        with self._lock:
+            if job.abandoned:
+                # 기다리는 요청이 없으므로 해싱하지 않음
+                raise asyncio.CancelledError()
+            job.started = True
+            self.queued -= 1
+            self.active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+
+    def stats(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queue_depth,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self):
+        """스레드 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# 글로벌 비밀번호 해싱 워커 풀
+password_pool = PasswordHashingPool(
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
 
 
 class PasswordService:
@@ -16,3 +187,25 @@ class PasswordService:
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
         return pwd_context.verify(plain_password, hashed_password)
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """비밀번호 해싱 (워커 풀에서 실행)"""
+        return await password_pool.run(pwd_context.hash, password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (워커 풀에서 실행)"""
+        return await password_pool.run(pwd_context.verify, plain_password, hashed_password)
+
+    @staticmethod
+    async def verify_and_update_password_async(
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 및 재해싱 (워커 풀에서 실행)
+
+        검증에 성공했고 해시가 현재 설정과 다르면 새 해시를 함께 반환합니다.
+        """
+        return await password_pool.run(pwd_context.verify_and_update, plain_password, hashed_password)
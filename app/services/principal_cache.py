@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+class PrincipalCache:
+    """
+    인증 주체 스냅샷 캐시 (TTL + LRU)
+
+    토큰의 주체(role, username)를 응답용 스냅샷(비밀번호 해시 제외)에
+    매핑해 같은 사용자의 반복 조회에서 DB 조회를 생략합니다.
+    계정 수정/삭제/비밀번호 변경 시 현재 워커에서 바로 갱신되며,
+    다른 워커에는 TTL이 지나면 반영됩니다.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # (role, username) -> (snapshot, expires_at)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 변경될 때마다 증가 (조회 중 변경된 스냅샷 저장 방지)
+        self.generation = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, role: str, username: str) -> Optional[Dict]:
+        """캐시된 스냅샷 조회 (없거나 만료되면 None)"""
+        key = (role, username)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key: Tuple[str, str], snapshot: Dict):
+        self._entries[key] = (snapshot, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, role: str, username: str, snapshot: Dict, generation: int) -> Dict:
+        """
+        DB에서 읽은 스냅샷 저장
+
+        generation은 조회 전에 읽어 둔 값으로, 그 사이 변경이 있었다면
+        오래된 값일 수 있으므로 저장하지 않습니다.
+        """
+        if self.ttl > 0:
+            with self._lock:
+                if generation == self.generation:
+                    self._put((role, username), snapshot)
+        return snapshot
+
+    def store(self, role: str, username: str, snapshot: Dict) -> Dict:
+        """쓰기 직후의 최신 스냅샷 저장 (커밋 후 호출)"""
+        with self._lock:
+            self.generation += 1
+            if self.ttl > 0:
+                self._put((role, username), snapshot)
+        return snapshot
+
+    def invalidate(self, role: str, username: str):
+        """주체 하나 무효화 (커밋 후 호출)"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            self._entries.pop((role, username), None)
+
+    def clear(self, role: Optional[str] = None):
+        """전체 또는 역할별 무효화"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            if role is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == role]:
+                del self._entries[key]
+
+    def stats(self) -> Dict:
+        """현재 통계 반환 (/metrics 노출용)"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "ttl_seconds": self.ttl,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+# 글로벌 인증 주체 캐시 인스턴스
+principal_cache = PrincipalCache(
+    ttl=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries,
+)
@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.term_employee import TermEmployee
+from app.schemas.term_employee import TermEmployeeResponse
+
+# 내보내기 컬럼 (상세 조회 응답과 동일)
+EXPORT_COLUMNS = list(TermEmployeeResponse.model_fields)
+
+
+def _to_text(value: Any) -> Any:
+    """CSV/JSON 직렬화용 값 변환"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+# 엑셀이 수식으로 해석하는 시작 문자
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _to_csv_cell(value: Any) -> Any:
+    """CSV 셀 값 변환 (수식으로 실행되지 않도록 수식 시작 문자 앞에 ' 추가)"""
+    value = _to_text(value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class TermEmployeeExportService:
+    """기간제 인력 내보내기 서비스"""
+
+    @staticmethod
+    async def stream_rows(db: AsyncSession, conditions: List) -> AsyncIterator[List[Dict]]:
+        """
+        서버 측 커서로 행을 배치 단위로 읽기
+
+        ORM 객체 대신 컬럼 값만 조회하므로 세션 identity map에 쌓이지 않습니다.
+        """
+        batch_size = settings.term_employee_export_batch_size
+        result = await db.stream(
+            select(*(TermEmployee.__table__.c[column] for column in EXPORT_COLUMNS))
+            .where(*conditions)
+            .order_by(TermEmployee.term_employee_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions(batch_size):
+            yield partition
+
+    @staticmethod
+    async def to_csv(batches: AsyncIterator[List[Dict]]) -> AsyncIterator[str]:
+        """CSV 스트림 (엑셀 호환을 위해 BOM 포함, 수식 주입 방지)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        buffer.write("\ufeff")
+        writer.writerow(EXPORT_COLUMNS)
+        async for batch in batches:
+            for row in batch:
+                writer.writerow([_to_csv_cell(row[column]) for column in EXPORT_COLUMNS])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # 결과가 없으면 헤더만 전송
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    async def to_ndjson(batches: AsyncIterator[List[Dict]]) -> AsyncIterator[str]:
+        """NDJSON 스트림 (한 줄에 한 명)"""
+        async for batch in batches:
+            yield "".join(
+                json.dumps({column: _to_text(row[column]) for column in EXPORT_COLUMNS}, ensure_ascii=False) + "\n"
+                for row in batch
+            )
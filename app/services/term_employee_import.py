@@ -0,0 +1,343 @@
+import codecs
+import csv
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.core.logging import logger
+from app.core.messages import ErrorMessages
+from app.db.models.department import Department
+from app.db.models.term_employee import TermEmployee
+from app.schemas.term_employee import TermEmployeeCreate
+from app.services.department_cache import department_cache
+from app.services.term_employee_search import TermEmployeeSearchService
+from app.services.term_employee_summary import TermEmployeeSummaryService
+
+try:
+    from asyncpg.exceptions import ForeignKeyViolationError
+except ImportError:  # asyncpg가 없으면 COPY를 쓰지 않으므로 IntegrityError만 처리
+    ForeignKeyViolationError = IntegrityError
+
+# (행 번호, 원본 값)
+RawRow = Tuple[int, Dict[str, Any]]
+
+# COPY로 적재할 컬럼 (ID, 생성/수정 시각은 DB 기본값 사용)
+COPY_COLUMNS = [
+    "name",
+    "name_normalized",
+    "name_chosung",
+    "birthdate",
+    "address",
+    "department_id",
+    "employment_start_date",
+    "employment_end_date",
+    "status",
+    "position",
+    "manager_name",
+    "manager_number",
+    "notes",
+]
+
+
+def _header_key(header: str) -> str:
+    return "".join(str(header).split()).lower()
+
+
+def _build_header_map() -> Dict[str, str]:
+    """헤더 -> 필드명 매핑 (필드명과 스키마 설명(한글) 모두 허용)"""
+    header_map = {}
+    for field_name, field in TermEmployeeCreate.model_fields.items():
+        header_map[_header_key(field_name)] = field_name
+        if field.description:
+            header_map[_header_key(field.description)] = field_name
+    return header_map
+
+
+HEADER_MAP = _build_header_map()
+REQUIRED_FIELDS = [
+    name for name, field in TermEmployeeCreate.model_fields.items() if field.is_required()
+]
+
+
+def _map_headers(headers: List[Any]) -> List[Optional[str]]:
+    """파일 헤더를 필드명으로 변환 (필수 컬럼이 없으면 400 예외)"""
+    fields = [HEADER_MAP.get(_header_key(header)) if header is not None else None for header in headers]
+    missing = [name for name in REQUIRED_FIELDS if name not in fields]
+    if missing:
+        raise BadRequestException(
+            detail=f"{ErrorMessages.IMPORT_MISSING_COLUMNS} ({', '.join(missing)})",
+            error_code="IMPORT_MISSING_COLUMNS",
+        )
+    return fields
+
+
+def _to_row(fields: List[Optional[str]], values: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    """셀 값을 필드 딕셔너리로 변환 (빈 셀은 기본값 사용, 빈 행은 None)"""
+    row = {}
+    for field_name, value in zip(fields, values):
+        if field_name is None or value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        elif isinstance(value, datetime):
+            value = value.date()
+        row[field_name] = value
+    return row or None
+
+
+def iter_csv_rows(upload: UploadFile, encoding: str) -> Iterator[RawRow]:
+    """CSV 파일을 한 줄씩 읽어 (행 번호, 값) 반환"""
+    upload.file.seek(0)
+    # 업로드 파일은 바이너리이므로 증분 디코더로 줄 단위 변환
+    decoder = codecs.getincrementaldecoder("utf-8-sig" if encoding == "utf-8" else encoding)()
+    lines = (decoder.decode(chunk) for chunk in upload.file)
+    reader = csv.reader(lines)
+
+    try:
+        headers = next(reader, None)
+        if headers is None:
+            return
+        fields = _map_headers(headers)
+        for values in reader:
+            row = _to_row(fields, tuple(values))
+            if row is not None:
+                yield reader.line_num, row
+    except UnicodeDecodeError:
+        raise BadRequestException(detail=ErrorMessages.IMPORT_INVALID_ENCODING, error_code="IMPORT_INVALID_ENCODING")
+    except csv.Error as e:
+        raise BadRequestException(detail=f"{ErrorMessages.IMPORT_INVALID_FILE} ({e})", error_code="IMPORT_INVALID_FILE")
+
+
+def iter_xlsx_rows(upload: UploadFile) -> Iterator[RawRow]:
+    """XLSX 파일 첫 시트를 한 행씩 읽어 (행 번호, 값) 반환 (openpyxl 필요)"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise RuntimeError("XLSX 파일을 가져오려면 openpyxl 패키지가 필요합니다. (pip install openpyxl)") from e
+
+    upload.file.seek(0)
+    try:
+        workbook = load_workbook(upload.file, read_only=True, data_only=True)
+    except Exception as e:
+        raise BadRequestException(detail=f"{ErrorMessages.IMPORT_INVALID_FILE} ({e})", error_code="IMPORT_INVALID_FILE")
+
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        fields = _map_headers(list(headers))
+        for line_num, values in enumerate(rows, start=2):
+            row = _to_row(fields, values)
+            if row is not None:
+                yield line_num, row
+    finally:
+        workbook.close()
+
+
+class TermEmployeeImportService:
+    """기간제 인력 일괄 등록 서비스"""
+
+    @staticmethod
+    def open_rows(upload: UploadFile, encoding: str = "utf-8") -> Iterator[RawRow]:
+        """파일 확장자에 따른 행 반복자 생성"""
+        extension = os.path.splitext(upload.filename or "")[1].lower()
+        if extension == ".csv":
+            return iter_csv_rows(upload, encoding)
+        if extension == ".xlsx":
+            return iter_xlsx_rows(upload)
+        raise BadRequestException(detail=ErrorMessages.IMPORT_UNSUPPORTED_FILE, error_code="IMPORT_UNSUPPORTED_FILE")
+
+    @staticmethod
+    def _read_chunk(rows: Iterator[RawRow], size: int) -> List[RawRow]:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                break
+        return chunk
+
+    @staticmethod
+    def _validate_chunk(chunk: List[RawRow]) -> Tuple[List[Tuple[int, TermEmployeeCreate]], List[Dict]]:
+        """스키마 검증 (유효한 행, 오류 목록)"""
+        valid, errors = [], []
+        for line_num, raw in chunk:
+            try:
+                valid.append((line_num, TermEmployeeCreate.model_validate(raw)))
+            except ValidationError as e:
+                for error in e.errors():
+                    errors.append({
+                        "row": line_num,
+                        "field": str(error["loc"][0]) if error["loc"] else None,
+                        "message": error["msg"],
+                    })
+        return valid, errors
+
+    @staticmethod
+    async def _insert(db: AsyncSession, employees: List[TermEmployeeCreate]):
+        """유효한 행 적재 (asyncpg는 COPY, 그 외는 executemany)"""
+        records = []
+        for employee in employees:
+            record = employee.model_dump()
+            record.update(TermEmployeeSearchService.name_keys(employee.name))
+            records.append(record)
+
+        if db.bind.dialect.driver == "asyncpg":
+            connection = await db.connection()
+            raw_connection = await connection.get_raw_connection()
+            # Enum 컬럼은 이름(ACTIVE 등)으로 저장됨
+            await raw_connection.driver_connection.copy_records_to_table(
+                TermEmployee.__tablename__,
+                columns=COPY_COLUMNS,
+                records=[
+                    tuple(
+                        record[column].name if column == "status" else record[column]
+                        for column in COPY_COLUMNS
+                    )
+                    for record in records
+                ],
+            )
+        else:
+            await db.execute(insert(TermEmployee), records)
+
+    @staticmethod
+    async def _insert_checked(
+        db: AsyncSession,
+        rows: List[Tuple[int, TermEmployeeCreate]],
+        known_departments: Set[int],
+        errors: List[Dict],
+    ) -> List[TermEmployeeCreate]:
+        """
+        세이브포인트 안에서 적재 (적재한 행 반환)
+
+        부서 캐시는 다른 워커의 삭제 알림이 아직 오지 않아 오래되었을 수 있습니다.
+        외래 키 오류가 나면 세이브포인트까지 되돌리고, 청크의 부서 ID를 기본 DB에서
+        다시 확인해 없는 부서의 행은 오류로 보고한 뒤 나머지만 다시 적재합니다.
+        """
+        employees = [employee for _, employee in rows]
+        try:
+            async with db.begin_nested():
+                await TermEmployeeImportService._insert(db, employees)
+            return employees
+        except (IntegrityError, ForeignKeyViolationError):
+            department_cache.invalidate()
+
+        department_ids = {employee.department_id for employee in employees}
+        result = await db.execute(
+            select(Department.department_id).where(Department.department_id.in_(department_ids))
+        )
+        existing = set(result.scalars().all())
+        known_departments.difference_update(department_ids - existing)
+
+        employees = []
+        for line_num, employee in rows:
+            if employee.department_id in existing:
+                employees.append(employee)
+            else:
+                errors.append({
+                    "row": line_num,
+                    "field": "department_id",
+                    "message": ErrorMessages.INVALID_DEPARTMENT,
+                })
+
+        # 부서 외의 원인으로 다시 실패하면 그대로 예외 전파
+        if employees:
+            async with db.begin_nested():
+                await TermEmployeeImportService._insert(db, employees)
+        return employees
+
+    @staticmethod
+    async def import_rows(
+        db: AsyncSession,
+        rows: Iterator[RawRow],
+        dry_run: bool = False,
+    ) -> Dict:
+        """
+        행 단위 검증 후 일괄 적재
+
+        청크 단위로 스키마 검증, 부서 존재 여부 확인(부서 캐시), 적재를 수행합니다.
+        캐시가 오래되어 적재 중 외래 키 오류가 나면 해당 청크만 기본 DB로 다시 확인합니다.
+        dry_run은 적재하지 않으므로 부서 캐시 기준으로만 확인합니다.
+        오류가 있는 행은 건너뛰고 행 번호와 함께 보고합니다. 커밋은 호출자가 합니다.
+        """
+        chunk_size = settings.term_employee_import_chunk_size
+        max_rows = settings.term_employee_import_max_rows
+        max_errors = settings.term_employee_import_max_errors
+
+        known_departments: Set[int] = set()
+        imported_departments: Set[int] = set()
+        errors: List[Dict] = []
+        failed_rows: Set[int] = set()
+        total_rows = 0
+        imported = 0
+
+        while True:
+            # 파일 읽기/검증은 이벤트 루프를 막지 않도록 스레드 풀에서 수행
+            chunk = await run_in_threadpool(TermEmployeeImportService._read_chunk, rows, chunk_size)
+            if not chunk:
+                break
+
+            total_rows += len(chunk)
+            if total_rows > max_rows:
+                raise BadRequestException(
+                    detail=f"{ErrorMessages.IMPORT_TOO_MANY_ROWS} (최대 {max_rows}행)",
+                    error_code="IMPORT_TOO_MANY_ROWS",
+                )
+
+            valid, chunk_errors = await run_in_threadpool(TermEmployeeImportService._validate_chunk, chunk)
+
+            # 처음 보는 부서 ID만 부서 캐시로 확인
+            unknown = {employee.department_id for _, employee in valid} - known_departments
+            if unknown:
+                known_departments.update(await department_cache.existing_ids(db, unknown))
+
+            checked = []
+            for line_num, employee in valid:
+                if employee.department_id in known_departments:
+                    checked.append((line_num, employee))
+                else:
+                    chunk_errors.append({
+                        "row": line_num,
+                        "field": "department_id",
+                        "message": ErrorMessages.INVALID_DEPARTMENT,
+                    })
+
+            if checked and not dry_run:
+                employees = await TermEmployeeImportService._insert_checked(
+                    db, checked, known_departments, chunk_errors
+                )
+                imported_departments.update(employee.department_id for employee in employees)
+                imported += len(employees)
+            else:
+                imported += len(checked)
+
+            chunk_errors.sort(key=lambda error: error["row"])
+            for error in chunk_errors:
+                failed_rows.add(error["row"])
+                if len(errors) < max_errors:
+                    errors.append(error)
+
+        if imported_departments:
+            await TermEmployeeSummaryService.refresh(db, imported_departments)
+
+        if not dry_run:
+            logger.info(f"기간제 인력 일괄 등록 - {imported}건 등록, {len(failed_rows)}건 실패")
+
+        return {
+            "total_rows": total_rows,
+            "imported": imported,
+            "failed": len(failed_rows),
+            "dry_run": dry_run,
+            "errors": errors,
+        }
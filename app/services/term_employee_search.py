@@ -0,0 +1,265 @@
+import re
+import threading
+from datetime import date
+from typing import Dict, List, Literal, Optional, Sequence, Set
+
+from sqlalchemy import select, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.term_employee import TermEmployee
+from app.utils.hangul import is_chosung_query, normalize_name, to_chosung
+
+SearchMode = Literal["auto", "similar", "prefix"]
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    pg_trgm과 같은 방식으로 트라이그램 추출
+
+    단어마다 앞에 공백 두 칸, 뒤에 공백 한 칸을 붙인 뒤 3글자씩 나눕니다.
+    """
+    result: Set[str] = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            result.add(padded[i:i + 3])
+    return result
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """트라이그램 유사도 (pg_trgm similarity와 동일한 정의)"""
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+class NGramIndex:
+    """
+    인프로세스 트라이그램 이름 인덱스
+
+    pg_trgm을 사용할 수 없는 환경(SQLite, 테스트)에서 이름 검색에 사용합니다.
+    최초 검색 시 DB에서 (id, 이름)만 읽어 구성하고, 이후에는 등록/수정/삭제
+    시점에 갱신됩니다. 워커 프로세스마다 별도로 유지됩니다.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._names: Dict[int, str] = {}
+        self._grams: Dict[int, Set[str]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._lock = threading.Lock()
+
+    async def ensure_loaded(self, db: AsyncSession):
+        """인덱스가 비어 있으면 DB에서 구성"""
+        if self.loaded:
+            return
+        result = await db.execute(select(TermEmployee.term_employee_id, TermEmployee.name))
+        with self._lock:
+            for employee_id, name in result.all():
+                self._add(employee_id, name)
+            self.loaded = True
+
+    def _add(self, employee_id: int, name: str):
+        grams = trigrams(name)
+        self._names[employee_id] = name
+        self._grams[employee_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(employee_id)
+
+    def _remove(self, employee_id: int):
+        self._names.pop(employee_id, None)
+        for gram in self._grams.pop(employee_id, ()):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(employee_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def upsert(self, employee_id: int, name: str):
+        """이름 추가/변경 반영 (인덱스가 로드된 경우에만)"""
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(employee_id)
+            self._add(employee_id, name)
+
+    def remove(self, employee_id: int):
+        """삭제 반영"""
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(employee_id)
+
+    def clear(self):
+        """인덱스 초기화 (다음 검색 시 다시 로드)"""
+        with self._lock:
+            self._names.clear()
+            self._grams.clear()
+            self._postings.clear()
+            self.loaded = False
+
+    def search(self, query: str, threshold: float, limit: Optional[int] = None) -> List[int]:
+        """
+        부분 일치 또는 유사도가 임계값 이상인 ID를 유사도 순으로 반환
+        """
+        query_grams = trigrams(query)
+        needle = query.lower()
+
+        with self._lock:
+            candidates: Set[int] = set()
+            for gram in query_grams:
+                candidates |= self._postings.get(gram, set())
+
+            # 트라이그램이 겹치지 않는 짧은 부분 일치 (예: 2글자 이름 일부)
+            if len(needle) < 3:
+                candidates |= {
+                    employee_id for employee_id, name in self._names.items()
+                    if needle in name.lower()
+                }
+
+            scored = []
+            for employee_id in candidates:
+                score = similarity(query_grams, self._grams[employee_id])
+                if score >= threshold or needle in self._names[employee_id].lower():
+                    scored.append((score, self._names[employee_id], employee_id))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [employee_id for _, _, employee_id in scored[:limit]]
+
+
+# 글로벌 이름 인덱스 (pg_trgm 미지원 DB용)
+name_index = NGramIndex()
+
+
+class TermEmployeeSearchService:
+    """기간제 인력 이름 검색 서비스"""
+
+    @staticmethod
+    def name_keys(name: str) -> Dict[str, str]:
+        """이름 검색용 컬럼 값 (등록/수정 시 함께 저장)"""
+        return {
+            "name_normalized": normalize_name(name),
+            "name_chosung": to_chosung(name),
+        }
+
+    @staticmethod
+    def uses_pg_trgm(db: AsyncSession) -> bool:
+        """pg_trgm 검색 경로 사용 여부"""
+        return db.bind.dialect.name == "postgresql"
+
+    @staticmethod
+    async def search_by_name(
+        db: AsyncSession,
+        name: str,
+        birthdate: Optional[date] = None,
+        limit: int = 100,
+        options: Sequence = (),
+    ) -> List[TermEmployee]:
+        """
+        이름 검색 (유사도 순 정렬)
+
+        PostgreSQL에서는 pg_trgm GIN 인덱스를 사용하고,
+        그 외 DB에서는 인프로세스 트라이그램 인덱스를 사용합니다.
+        """
+        threshold = settings.term_employee_search_similarity_threshold
+
+        if TermEmployeeSearchService.uses_pg_trgm(db):
+            # `%` 연산자가 GIN 인덱스를 사용하도록 현재 트랜잭션의 유사도 임계값 설정
+            await db.execute(
+                select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True))
+            )
+
+            score = func.similarity(TermEmployee.name, name)
+            conditions = [
+                or_(
+                    TermEmployee.name.icontains(name, autoescape=True),
+                    TermEmployee.name.op("%")(name),
+                )
+            ]
+            if birthdate:
+                conditions.append(TermEmployee.birthdate == birthdate)
+
+            result = await db.execute(
+                select(TermEmployee)
+                .options(*options)
+                .where(*conditions)
+                .order_by(score.desc(), TermEmployee.name)
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+
+        await name_index.ensure_loaded(db)
+        # 생년월일 조건은 DB에서 거르므로 그 경우 후보를 모두 가져옴
+        ids = name_index.search(name, threshold, None if birthdate else limit)
+        if not ids:
+            return []
+
+        conditions = [TermEmployee.term_employee_id.in_(ids)]
+        if birthdate:
+            conditions.append(TermEmployee.birthdate == birthdate)
+
+        result = await db.execute(select(TermEmployee).options(*options).where(*conditions))
+        rank = {employee_id: i for i, employee_id in enumerate(ids)}
+        employees = sorted(result.scalars().all(), key=lambda e: rank[e.term_employee_id])
+        return employees[:limit]
+
+    @staticmethod
+    async def search_by_prefix(
+        db: AsyncSession,
+        query: str,
+        birthdate: Optional[date] = None,
+        limit: int = 100,
+        options: Sequence = (),
+    ) -> List[TermEmployee]:
+        """
+        자동완성용 접두어 검색
+
+        초성만 입력한 경우(예: "ㅎㄱㄷ") 초성 컬럼에서, 그 외에는 정규화 이름
+        컬럼에서 접두어로 찾습니다. 두 컬럼 모두 인덱스를 사용합니다.
+        """
+        prefix = normalize_name(query)
+        if is_chosung_query(query):
+            column = TermEmployee.name_chosung
+        else:
+            column = TermEmployee.name_normalized
+
+        if not prefix:
+            return []
+
+        conditions = [column.startswith(prefix, autoescape=True)]
+        if birthdate:
+            conditions.append(TermEmployee.birthdate == birthdate)
+
+        result = await db.execute(
+            select(TermEmployee)
+            .options(*options)
+            .where(*conditions)
+            .order_by(column, TermEmployee.name)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        mode: SearchMode = "auto",
+        birthdate: Optional[date] = None,
+        limit: int = 100,
+        options: Sequence = (),
+    ) -> List[TermEmployee]:
+        """
+        검색 모드에 따른 이름 검색
+
+        - similar: 부분 일치/유사도 검색
+        - prefix: 정규화 이름/초성 접두어 검색 (자동완성)
+        - auto: 초성 검색어는 prefix, 그 외에는 similar
+        options는 조회 옵션(예: load_only로 일부 컬럼만 조회)입니다.
+        """
+        if mode == "prefix" or (mode == "auto" and is_chosung_query(query)):
+            return await TermEmployeeSearchService.search_by_prefix(db, query, birthdate, limit, options)
+        return await TermEmployeeSearchService.search_by_name(db, query, birthdate, limit, options)
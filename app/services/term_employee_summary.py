@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+
+from sqlalchemy import Date, case, func, literal, select, true
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.config import settings
+from app.db.models.department import Department
+from app.db.models.term_employee import IN_SERVICE_STATUSES, EmploymentStatus, TermEmployee
+from app.db.models.term_employee_summary import TermEmployeeSummary
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _dialect_name(db: Union[AsyncSession, AsyncConnection]) -> str:
+    return db.bind.dialect.name if isinstance(db, AsyncSession) else db.dialect.name
+
+
+class TermEmployeeSummaryService:
+    """부서별 기간제 인력 현황 집계 서비스"""
+
+    @staticmethod
+    async def refresh(
+        db: Union[AsyncSession, AsyncConnection],
+        department_ids: Optional[Iterable[int]] = None,
+        today: Optional[date] = None,
+    ):
+        """
+        부서별 집계 재계산 (department_ids가 없으면 전체)
+
+        등록/수정/삭제 시에는 해당 부서만, 계약 만료 배치에서는 전체를 다시
+        계산합니다. 재직/휴직 행만 (부서, 상태, 종료일) 인덱스로 집계하므로
+        부서 하나를 갱신하는 비용은 그 부서 인원 수에 비례합니다.
+        커밋은 호출자가 합니다.
+        """
+        if department_ids is not None:
+            department_ids = {department_id for department_id in department_ids if department_id is not None}
+            if not department_ids:
+                return
+
+        # 세션의 대기 중인 변경 사항을 집계에 반영
+        if isinstance(db, AsyncSession):
+            await db.flush()
+
+        today = today or date.today()
+        until = today + timedelta(days=settings.term_employee_expiring_within_days)
+        department = Department.__table__
+        employee = TermEmployee.__table__
+        summary = TermEmployeeSummary.__table__
+
+        # 같은 부서를 동시에 갱신하는 트랜잭션 직렬화 (부서 ID 순으로 잠가 교착 방지)
+        # FOR NO KEY UPDATE는 직원 등록의 외래 키 확인(KEY SHARE)은 막지 않으며,
+        # 잠금을 기다린 뒤 실행되는 집계는 먼저 커밋된 변경을 봅니다 (READ COMMITTED).
+        targets = select(department.c.department_id).order_by(department.c.department_id)
+        if department_ids is not None:
+            targets = targets.where(department.c.department_id.in_(department_ids))
+        await db.execute(targets.with_for_update(key_share=True))
+
+        # 재직/휴직 인원이 없는 부서도 0으로 갱신되도록 부서 기준으로 집계
+        counts = (
+            select(
+                department.c.department_id,
+                _count_if(employee.c.status == EmploymentStatus.ACTIVE).label("active_count"),
+                _count_if(employee.c.status == EmploymentStatus.ON_LEAVE).label("on_leave_count"),
+                _count_if(employee.c.employment_end_date.between(today, until)).label("expiring_count"),
+                literal(today, Date).label("base_date"),
+            )
+            .select_from(
+                department.outerjoin(
+                    employee,
+                    (employee.c.department_id == department.c.department_id)
+                    & employee.c.status.in_(IN_SERVICE_STATUSES),
+                )
+            )
+            # SQLite는 INSERT ... SELECT에 ON CONFLICT를 붙이려면 WHERE 절이 필요
+            .where(true() if department_ids is None else department.c.department_id.in_(department_ids))
+            .group_by(department.c.department_id)
+        )
+
+        # 집계와 저장을 한 문장으로 (이미 있는 행은 갱신)
+        insert = sqlite_insert if _dialect_name(db) == "sqlite" else postgresql_insert
+        columns = ["department_id", "active_count", "on_leave_count", "expiring_count", "base_date"]
+        upsert = insert(summary).from_select(columns, counts)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[summary.c.department_id],
+            set_={
+                **{column: upsert.excluded[column] for column in columns[1:]},
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(upsert)
+
+    @staticmethod
+    async def get_dashboard(db: AsyncSession) -> List[Dict]:
+        """부서별 현황 조회 (집계 행이 없는 부서는 0)"""
+        summary = TermEmployeeSummary.__table__
+        result = await db.execute(
+            select(
+                Department.department_id,
+                Department.department_name,
+                func.coalesce(summary.c.active_count, 0).label("active_count"),
+                func.coalesce(summary.c.on_leave_count, 0).label("on_leave_count"),
+                func.coalesce(summary.c.expiring_count, 0).label("expiring_count"),
+                summary.c.base_date,
+                summary.c.updated_at,
+            )
+            .outerjoin(summary, summary.c.department_id == Department.department_id)
+            .order_by(Department.department_name)
+        )
+        return [dict(row) for row in result.mappings().all()]
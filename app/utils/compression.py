@@ -0,0 +1,136 @@
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli 패키지가 없으면 br 비활성화
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 패키지가 없으면 zstd 비활성화
+    zstandard = None
+
+# 요청마다 압축하므로 압축률보다 속도를 우선한 단계
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+def available_encodings() -> List[str]:
+    """설치된 패키지로 지원 가능한 압축 방식"""
+    encodings = ["gzip"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return encodings
+
+
+def supported_encodings(encodings: Iterable[str]) -> List[str]:
+    """설정된 선호 순서 중 지원 가능한 압축 방식만"""
+    available = available_encodings()
+    return [encoding for encoding in encodings if encoding in available]
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[token] = weight
+    return weights
+
+
+def choose_encoding(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """
+    Accept-Encoding 협상
+
+    클라이언트 가중치(q)가 가장 높은 방식을 고르고, 같으면 서버 선호 순서를 따릅니다.
+    q=0인 방식은 제외하며 "*"는 명시되지 않은 방식에 적용됩니다.
+    """
+    weights = _parse_accept_encoding(accept_encoding)
+    default = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, default)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible_type(content_type: str, allowed: Iterable[str]) -> bool:
+    """Content-Type 허용 목록 확인 ("text/"처럼 /로 끝나면 접두어 일치)"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if not media_type:
+        return False
+    return any(
+        media_type.startswith(entry) if entry.endswith("/") else media_type == entry
+        for entry in allowed
+    )
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 전체 압축"""
+    if encoding == "gzip":
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {encoding}")
+
+
+class StreamCompressor:
+    """
+    스트리밍 본문 압축기
+
+    청크마다 flush해서 받은 만큼은 바로 클라이언트로 전달되게 합니다.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        else:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "gzip":
+            return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def response_encoding(accept_encoding: str, size: int) -> Optional[str]:
+    """
+    직접 압축해 응답할 때 사용할 방식 (압축하지 않으면 None)
+
+    응답 캐시처럼 압축본을 재사용하는 라우트가 미들웨어와 같은 기준을 쓰도록 합니다.
+    """
+    if not settings.compression_enabled or size < settings.compression_minimum_size:
+        return None
+    return choose_encoding(accept_encoding, supported_encodings(settings.compression_encodings))
@@ -0,0 +1,43 @@
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+from app.core.exceptions import BadRequestException
+from app.core.messages import ErrorMessages
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    ?fields= 파싱 (sparse fieldset)
+
+    콤마로 구분된 필드 이름을 응답 모델의 필드 순서대로 반환합니다.
+    지정하지 않으면 None(전체 필드), 모델에 없는 필드가 있으면 400 예외입니다.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        return None
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise BadRequestException(
+            detail=f"{ErrorMessages.INVALID_FIELDS} ({', '.join(sorted(unknown))})",
+            error_code="INVALID_FIELDS",
+        )
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+@lru_cache(maxsize=None)
+def partial_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    요청한 필드만 가진 응답 모델 (필드 조합별로 한 번만 생성)
+
+    ORM 객체에서 변환할 때 선택한 속성만 읽으므로 load_only로 일부 컬럼만
+    조회한 객체도 추가 조회 없이 직렬화할 수 있습니다.
+    """
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=model.model_config,
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields},
+    )
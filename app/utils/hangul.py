@@ -0,0 +1,48 @@
+import re
+import unicodedata
+
+# 초성 19자 (한글 음절 유니코드 배열 순서)
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSUNG_COUNT = 21
+_JONGSUNG_COUNT = 28
+# NFKC는 호환 자모(ㄱ)를 첫가끝 초성(U+1100)으로 바꾸므로 다시 호환 자모로 되돌림
+_CHOSEONG_TO_COMPAT = {0x1100 + i: char for i, char in enumerate(CHOSUNG)}
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_CHOSUNG_QUERY_PATTERN = re.compile(f"^[{CHOSUNG}]+$")
+
+
+def normalize_name(name: str) -> str:
+    """
+    검색용 이름 정규화
+
+    전각/반각 및 조합형 자모를 NFKC로 통일하고, 소문자로 바꾼 뒤
+    공백을 모두 제거합니다. (예: "홍 길동", "ＨＯＮＧ" -> "홍길동", "hong")
+    """
+    normalized = unicodedata.normalize("NFKC", name).lower().translate(_CHOSEONG_TO_COMPAT)
+    return _WHITESPACE_PATTERN.sub("", normalized)
+
+
+def to_chosung(name: str) -> str:
+    """
+    이름을 초성 문자열로 변환 (예: "홍길동" -> "ㅎㄱㄷ")
+
+    한글 음절이 아닌 문자는 정규화된 형태 그대로 유지합니다.
+    """
+    result = []
+    for char in normalize_name(name):
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = (code - _HANGUL_BASE) // (_JUNGSUNG_COUNT * _JONGSUNG_COUNT)
+            result.append(CHOSUNG[index])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_chosung_query(query: str) -> bool:
+    """검색어가 초성으로만 이루어졌는지 여부 (예: "ㅎㄱㄷ")"""
+    return bool(_CHOSUNG_QUERY_PATTERN.match(normalize_name(query)))
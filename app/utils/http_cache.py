@@ -0,0 +1,105 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from fastapi import Request, Response
+from sqlalchemy import inspect
+
+Timestamp = Union[datetime, str]
+
+
+def _to_datetime(value: Timestamp) -> datetime:
+    """datetime 또는 ISO 문자열을 UTC datetime으로 변환 (시간대 없으면 UTC로 간주)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    강한 ETag 생성
+
+    ID와 수정 시각처럼 표현이 바뀌면 함께 바뀌는 값들로 만듭니다.
+    """
+    digest = hashlib.sha1("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def make_collection_etag(items: Iterable[Tuple[Any, Any]]) -> str:
+    """(ID, 버전) 목록으로 ETag 생성 (추가/수정/삭제 모두 반영)"""
+    return make_etag(*(f"{item_id}@{version}" for item_id, version in items))
+
+
+def row_version(row: Any) -> Tuple[Any, ...]:
+    """
+    ETag용 행 버전 (ORM 객체 또는 컬럼 dict의 모든 컬럼 값)
+
+    SQLite의 CURRENT_TIMESTAMP처럼 수정 시각이 초 단위이면 같은 초 안의 두 수정이
+    같은 ETag가 되므로, 수정 시각만이 아니라 행 내용 전체로 ETag를 만듭니다.
+    """
+    if isinstance(row, Mapping):
+        return tuple(row.values())
+    return tuple(getattr(row, attr.key) for attr in inspect(row).mapper.column_attrs)
+
+
+def http_date(value: Timestamp) -> str:
+    """HTTP 날짜 형식 (Last-Modified)"""
+    return format_datetime(_to_datetime(value), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교 (W/ 접두어 무시)
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP 날짜는 초 단위
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[Timestamp] = None,
+    cache_control: str = "no-cache",
+) -> Optional[Response]:
+    """
+    조건부 GET 처리
+
+    응답에 ETag/Last-Modified 헤더를 설정하고, 클라이언트가 가진 표현이
+    최신이면 본문 없는 304 응답을 반환합니다. 변경된 경우 None을 반환하므로
+    핸들러는 직렬화 전에 바로 304를 돌려줄 수 있습니다.
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다.
+    If-Modified-Since는 초 단위라 같은 초 안의 수정은 구분하지 못하므로
+    정확한 재검증이 필요한 클라이언트는 ETag(If-None-Match)를 사용해야 합니다.
+    """
+    headers: Dict[str, str] = {"ETag": etag, "Cache-Control": cache_control}
+    modified_at = _to_datetime(last_modified) if last_modified is not None else None
+    if modified_at is not None:
+        headers["Last-Modified"] = http_date(modified_at)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        unchanged = _etag_matches(if_none_match, etag)
+    elif if_modified_since is not None and modified_at is not None:
+        unchanged = _not_modified_since(if_modified_since, modified_at)
+    else:
+        unchanged = False
+
+    if unchanged:
+        return Response(status_code=304, headers=headers)
+    return None
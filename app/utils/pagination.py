@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import date
+from typing import Any, List
+
+from app.core.exceptions import BadRequestException
+from app.core.messages import ErrorMessages
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    키셋 페이지네이션 커서 생성
+
+    마지막 항목의 정렬 키 값들을 URL-safe base64 문자열로 인코딩합니다.
+    날짜 등 JSON으로 표현할 수 없는 값은 ISO 문자열로 저장됩니다.
+    """
+    payload = json.dumps(
+        [value.isoformat() if hasattr(value, "isoformat") else value for value in values],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 디코딩 (형식이 맞지 않으면 400 예외)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise BadRequestException(detail=ErrorMessages.INVALID_CURSOR, error_code="INVALID_CURSOR")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise BadRequestException(detail=ErrorMessages.INVALID_CURSOR, error_code="INVALID_CURSOR")
+    return values
+
+
+def cursor_value(value: Any, expected_type: type) -> Any:
+    """
+    커서에서 꺼낸 정렬 키 값을 컬럼 타입으로 확인/변환 (맞지 않으면 400 예외)
+
+    조작된 커서 값이 그대로 비교 조건에 들어가 DB 오류(500)가 나지 않도록 합니다.
+    날짜는 ISO 문자열로 저장되므로 date로 변환합니다.
+    """
+    if expected_type is date:
+        try:
+            return date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise BadRequestException(detail=ErrorMessages.INVALID_CURSOR, error_code="INVALID_CURSOR")
+
+    # bool은 int의 하위 타입이므로 별도로 거부
+    if isinstance(value, bool) or not isinstance(value, expected_type):
+        raise BadRequestException(detail=ErrorMessages.INVALID_CURSOR, error_code="INVALID_CURSOR")
+    return value
@@ -0,0 +1,75 @@
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 인코딩 (orjson 우선, 없으면 표준 json과 같은 출력)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson으로 인코딩하는 JSON 응답
+
+    FastAPI가 response_model로 검증/변환한 값을 그대로 받아 인코딩만 바꿉니다.
+    앱 기본 응답 클래스(JSON_RESPONSE_BACKEND) 또는 라우트의 response_class로 사용합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def json_adapter(tp: Any) -> TypeAdapter:
+    """타입별 TypeAdapter (한 번만 만들어 재사용)"""
+    return TypeAdapter(tp)
+
+
+def typed_json_response(
+    tp: Any,
+    content: Any,
+    *,
+    from_attributes: bool = False,
+    include: Optional[Any] = None,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    신뢰할 수 있는 내부 객체를 한 번에 직렬화한 JSON 응답
+
+    response_model 검증과 jsonable_encoder를 거치지 않고 TypeAdapter.dump_json으로
+    바로 바이트를 만듭니다. 이미 해당 타입인 객체(인메모리 모델, 스키마 인스턴스)에만
+    사용하고, ORM 객체는 from_attributes=True로 변환한 뒤 직렬화합니다.
+    include는 dump_json과 같은 형식으로 일부 필드만 직렬화할 때 사용합니다.
+    라우트의 response_model은 문서용으로 그대로 둡니다.
+    """
+    adapter = json_adapter(tp)
+    if from_attributes:
+        content = adapter.validate_python(content, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(content, include=include),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def json_response_class(backend: str) -> type:
+    """설정값에 해당하는 기본 응답 클래스 (orjson, json)"""
+    if backend == "orjson":
+        return FastJSONResponse
+    if backend == "json":
+        return JSONResponse
+    raise ValueError(f"지원하지 않는 JSON 응답 방식입니다: {backend}")
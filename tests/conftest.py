@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+from sqlalchemy import BigInteger, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import NullPool
+
+from app.db.base import Base
+from app.db.models import Department
+from app.db.session import _enable_sqlite_foreign_keys
+
+# departments 픽스처가 등록하는 부서 (ID 1, 2)
+DEPARTMENT_NAMES = ["행정팀", "인사팀"]
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가
+    return "INTEGER"
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    """
+    테이블을 만든 SQLite 비동기 엔진 (외래 키 확인)
+
+    파일 DB와 NullPool을 사용하므로 asyncio.run, TestClient 등 어느 이벤트 루프에서나 쓸 수 있습니다.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+    event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    """db_engine 세션 팩토리"""
+    return async_sessionmaker(db_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def departments(session_factory):
+    """기본 부서 등록 (부서 ID 목록 반환)"""
+    async def seed():
+        async with session_factory() as db:
+            db.add_all([Department(department_name=name) for name in DEPARTMENT_NAMES])
+            await db.commit()
+
+    asyncio.run(seed())
+    return list(range(1, len(DEPARTMENT_NAMES) + 1))
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+from app.core.messages import ErrorMessages
+from app.core.query_stats import assert_max_queries
+from app.db.models import Department
+from app.db.session import get_db
+from app.routers import account, user
+from app.services.department_cache import department_cache
+from app.services.manager_service import ManagerService
+from app.services.password_service import PasswordService
+from app.services.user_service import UserService
+
+FIRST_LOGIN = {"manager_name": "홍길동", "new_password": "password2", "manager_number": "010-0000-0000"}
+
+
+@pytest.fixture
+def hashes(monkeypatch):
+    """해싱 호출 기록 (실제 해싱 대신 빠른 가짜 해시)"""
+    calls = []
+
+    async def fake_hash(password):
+        calls.append(password)
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(PasswordService, "hash_password_async", fake_hash)
+    return calls
+
+
+@pytest.fixture
+def client(session_factory, departments, hashes, monkeypatch):
+    async def get_test_db():
+        async with session_factory() as db:
+            yield db
+            if db.in_transaction():
+                await db.commit()
+
+    app = FastAPI()
+    app.include_router(account.router)
+    app.include_router(user.router)
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[ManagerService.verify_token] = lambda: "manager1"
+    app.dependency_overrides[UserService.verify_token] = lambda: "user1"
+
+    monkeypatch.setattr(department_cache, "enabled", True)
+    department_cache.invalidate()
+    client = TestClient(app)
+    assert client.post("/accounts/users", json={"username": "user1", "password": "password1"}).status_code == 201
+    yield client
+    department_cache.invalidate()
+
+
+def test_duplicate_account_rejected_before_hashing(client, hashes):
+    response = client.post("/accounts/users", json={"username": "user1", "password": "password1"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == ErrorMessages.USER_ALREADY_EXISTS
+    assert len(hashes) == 1
+
+
+def test_first_login_checks_department_with_cache(client, hashes, session_factory):
+    async def load_cache():
+        async with session_factory() as db:
+            await department_cache.all(db)
+
+    asyncio.run(load_cache())
+
+    # 요청별 사용자 상태 조회와 갱신만 실행 (부서는 캐시로 확인)
+    with assert_max_queries(3):
+        unknown = client.put("/user/first-login", json={**FIRST_LOGIN, "department_id": 99})
+        updated = client.put("/user/first-login", json={**FIRST_LOGIN, "department_id": 1})
+
+    assert unknown.status_code == 404
+    assert updated.status_code == 200
+    assert updated.json()["department_id"] == 1
+    assert len(hashes) == 2
+
+
+def test_first_login_department_deleted_behind_cache(client, session_factory):
+    """캐시에 남은 삭제된 부서는 외래 키 제약으로 거부"""
+    async def delete_department_after_caching():
+        async with session_factory() as db:
+            await department_cache.all(db)
+            await db.execute(delete(Department).where(Department.department_id == 2))
+            await db.commit()
+
+    asyncio.run(delete_department_after_caching())
+
+    response = client.put("/user/first-login", json={**FIRST_LOGIN, "department_id": 2})
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == ErrorMessages.INVALID_DEPARTMENT
@@ -0,0 +1,162 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.response_cache import ResponseCache
+from app.middleware import CompressionMiddleware
+from app.utils.compression import StreamCompressor, choose_encoding, compress, is_compressible_type
+
+LARGE = [{"id": i, "name": "홍길동"} for i in range(200)]
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["br", "gzip"])
+
+
+@app.get("/large")
+async def large():
+    return LARGE
+
+
+@app.get("/small")
+async def small():
+    return {"ok": True}
+
+
+@app.get("/text")
+async def text():
+    return PlainTextResponse("x" * 2000)
+
+
+@app.get("/stream")
+async def stream():
+    async def lines():
+        for item in LARGE:
+            yield json.dumps(item) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/json")
+
+
+@app.get("/encoded")
+async def encoded():
+    body = gzip.compress(json.dumps(LARGE).encode())
+    return Response(body, media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+
+@app.get("/etag")
+async def etag(response: Response):
+    response.headers["ETag"] = '"abc"'
+    return LARGE
+
+
+client = TestClient(app)
+
+
+def test_choose_encoding_uses_weights_then_server_order():
+    assert choose_encoding("gzip, br", ["br", "gzip"]) == "br"
+    assert choose_encoding("gzip;q=1, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("identity", ["br", "gzip"]) is None
+    assert choose_encoding("", ["gzip"]) is None
+
+
+def test_content_type_allowlist():
+    allowed = ["application/json", "text/"]
+    assert is_compressible_type("application/json; charset=utf-8", allowed)
+    assert is_compressible_type("text/csv", allowed)
+    assert not is_compressible_type("image/png", allowed)
+    assert not is_compressible_type("", allowed)
+
+
+def test_large_json_is_compressed():
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(json.dumps(LARGE))
+    assert response.json() == LARGE
+
+
+def test_small_or_disallowed_responses_are_not_compressed():
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    text = client.get("/text", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in text.headers
+    assert "content-encoding" not in identity.headers
+
+
+def test_streaming_response_is_compressed_per_chunk():
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert [json.loads(line) for line in response.text.splitlines()] == LARGE
+
+
+def test_already_encoded_response_passes_through():
+    response = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == LARGE
+
+
+def test_compressed_response_weakens_etag():
+    compressed = client.get("/etag", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/etag", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["etag"] == 'W/"abc"'
+    assert identity.headers["etag"] == '"abc"'
+
+
+def test_brotli_negotiated_when_installed():
+    pytest.importorskip("brotli")
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == LARGE
+
+
+@pytest.mark.parametrize("encoding, module_name", [("br", "brotli"), ("zstd", "zstandard"), ("gzip", "zlib")])
+def test_compress_round_trip(encoding, module_name):
+    module = pytest.importorskip(module_name)
+    if encoding == "br":
+        decompress = module.decompress
+    elif encoding == "zstd":
+        # 스트리밍 프레임에는 원본 크기가 없으므로 decompressobj 사용
+        def decompress(data):
+            return module.ZstdDecompressor().decompressobj().decompress(data)
+    else:
+        decompress = gzip.decompress
+    body = json.dumps(LARGE).encode()
+
+    stream = StreamCompressor(encoding)
+    streamed = stream.compress(body[:1000]) + stream.compress(body[1000:]) + stream.finish()
+
+    assert decompress(compress(body, encoding)) == body
+    assert decompress(streamed) == body
+
+
+def test_response_cache_keeps_compressed_variant():
+    async def scenario():
+        cache = ResponseCache()
+
+        async def compute():
+            return json.dumps(LARGE).encode()
+
+        body, _ = await cache.get_or_compute("posts", "", compute)
+        first = cache.encoded("posts", "", body, "gzip")
+        second = cache.encoded("posts", "", body, "gzip")
+        return body, first, second, cache.stats()
+
+    body, first, second, stats = asyncio.run(scenario())
+
+    assert first is second
+    assert gzip.decompress(first) == body
+    assert (stats["compressions"], stats["compressed_hits"]) == (1, 1)
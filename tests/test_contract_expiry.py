@@ -0,0 +1,59 @@
+import asyncio
+from datetime import date
+
+from sqlalchemy import select
+
+from app.db.models import EmploymentStatus, TermEmployee, TermEmployeeSummary
+from app.services.contract_expiry import ContractExpiryJob
+
+
+async def run_expiry(engine, session_factory, statuses_and_end_dates, batch_size):
+    async with session_factory() as db:
+        for i, (employee_status, end_date) in enumerate(statuses_and_end_dates):
+            db.add(TermEmployee(
+                name=f"직원{i}",
+                birthdate=date(1990, 1, 1),
+                department_id=1,
+                employment_start_date=date(2024, 1, 1),
+                employment_end_date=end_date,
+                status=employee_status,
+            ))
+        await db.commit()
+
+    job = ContractExpiryJob(engine=engine, batch_size=batch_size)
+    terminated = await job.run_once(today=date(2024, 7, 1))
+
+    async with session_factory() as db:
+        result = await db.execute(select(TermEmployee.status).order_by(TermEmployee.term_employee_id))
+        summary = await db.get(TermEmployeeSummary, 1)
+        return terminated, list(result.scalars().all()), summary, job.stats()
+
+
+def test_expired_contracts_terminated_in_batches(db_engine, session_factory, departments):
+    """종료일이 지난 재직/휴직 인력만 퇴사 처리"""
+    rows = [
+        (EmploymentStatus.ACTIVE, date(2024, 6, 30)),
+        (EmploymentStatus.ON_LEAVE, date(2024, 3, 31)),
+        (EmploymentStatus.ACTIVE, date(2024, 5, 31)),
+        (EmploymentStatus.ACTIVE, date(2024, 7, 1)),  # 오늘까지 재직
+        (EmploymentStatus.ACTIVE, date(2024, 12, 31)),
+    ]
+
+    terminated, statuses, summary, stats = asyncio.run(run_expiry(db_engine, session_factory, rows, batch_size=2))
+
+    assert terminated == 3
+    assert statuses == [
+        EmploymentStatus.TERMINATED,
+        EmploymentStatus.TERMINATED,
+        EmploymentStatus.TERMINATED,
+        EmploymentStatus.ACTIVE,
+        EmploymentStatus.ACTIVE,
+    ]
+    assert stats["runs"] == 1
+    assert stats["total_terminated"] == 3
+
+    # 부서별 현황 집계도 함께 갱신 (만료 예정: 2024-07-01 ~ 2024-07-31)
+    assert summary.active_count == 2
+    assert summary.on_leave_count == 0
+    assert summary.expiring_count == 1
+    assert summary.base_date == date(2024, 7, 1)
@@ -0,0 +1,178 @@
+import asyncio
+import itertools
+
+import pytest
+from sqlalchemy import column, event, select, table, text
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db import session as db_session
+from app.db.pool import InstrumentedQueuePool, pool_stats
+from app.db.session import ReadOnlySession, RoutingSession, get_db, get_read_db
+
+
+async def count_commits(monkeypatch, dependency, handler):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    commits = []
+    event.listen(engine.sync_engine, "commit", lambda conn: commits.append(conn))
+
+    monkeypatch.setattr(db_session, "async_session", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(db_session, "read_session", async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
+        expire_on_commit=False,
+    ))
+
+    try:
+        generator = dependency()
+        db = await generator.__anext__()
+        await handler(db)
+        # 핸들러 종료 후 의존성 정리 구간 실행
+        with pytest.raises(StopAsyncIteration):
+            await generator.__anext__()
+        return len(commits)
+    finally:
+        await engine.dispose()
+
+
+async def read(db):
+    await db.execute(text("SELECT 1"))
+
+
+async def read_and_commit(db):
+    await db.execute(text("SELECT 1"))
+    await db.commit()
+
+
+def test_read_db_does_not_commit(monkeypatch):
+    assert asyncio.run(count_commits(monkeypatch, get_read_db, read)) == 0
+
+
+def test_write_db_commits_once_when_handler_committed(monkeypatch):
+    assert asyncio.run(count_commits(monkeypatch, get_db, read_and_commit)) == 1
+
+
+def test_write_db_commits_pending_transaction(monkeypatch):
+    assert asyncio.run(count_commits(monkeypatch, get_db, read)) == 1
+
+
+SOURCE_QUERY = select(column("name")).select_from(table("source"))
+
+
+async def with_replica(monkeypatch, scenario):
+    """기본 DB/복제본에 각자 출처를 기록한 뒤 scenario(primary) 실행"""
+    primary = create_async_engine("sqlite+aiosqlite://")
+    replica = create_async_engine("sqlite+aiosqlite://")
+    try:
+        for engine, source in ((primary, "primary"), (replica, "replica")):
+            async with engine.begin() as conn:
+                await conn.execute(text("CREATE TABLE source (name TEXT)"))
+                await conn.execute(text("INSERT INTO source VALUES (:name)"), {"name": source})
+
+        monkeypatch.setattr(db_session, "_replica_cycle", itertools.cycle([replica]))
+        return await scenario(primary)
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+
+
+async def route_reads(primary):
+    session_factory = async_sessionmaker(primary, sync_session_class=RoutingSession)
+
+    async with session_factory() as db:
+        before = (await db.execute(SOURCE_QUERY)).scalars().all()
+        await db.execute(text("INSERT INTO source VALUES ('written')"))
+        after = (await db.execute(SOURCE_QUERY)).scalars().all()
+        return before, after, db.sync_session.uses_primary
+
+
+def test_routing_session_reads_replica_until_write(monkeypatch):
+    before, after, uses_primary = asyncio.run(with_replica(monkeypatch, route_reads))
+
+    assert before == ["replica"]
+    assert after == ["primary", "written"]
+    assert uses_primary
+
+
+def test_routing_session_sends_locking_select_to_primary(monkeypatch):
+    async def scenario(primary):
+        async with async_sessionmaker(primary, sync_session_class=RoutingSession)() as db:
+            locked = (await db.execute(SOURCE_QUERY.with_for_update())).scalars().all()
+            return locked, db.sync_session.uses_primary
+
+    assert asyncio.run(with_replica(monkeypatch, scenario)) == (["primary"], True)
+
+
+def test_write_db_reads_primary(monkeypatch):
+    """쓰기용 세션은 첫 쓰기 전 조회도 기본 DB에서 (복제 지연 값으로 쓰지 않도록)"""
+    async def scenario(primary):
+        monkeypatch.setitem(db_session.async_session.kw, "bind", primary)
+        monkeypatch.setitem(db_session.read_session.kw, "bind", primary)
+        sources = []
+        for dependency in (get_db, get_read_db):
+            generator = dependency()
+            db = await generator.__anext__()
+            sources.append((await db.execute(SOURCE_QUERY)).scalar_one())
+            await generator.aclose()
+        return sources
+
+    assert asyncio.run(with_replica(monkeypatch, scenario)) == ["primary", "replica"]
+
+
+def test_routing_session_without_replicas_uses_primary(monkeypatch):
+    monkeypatch.setattr(db_session, "_replica_cycle", itertools.cycle([]))
+    assert RoutingSession().uses_primary
+
+
+async def exhaust_pool(path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        async with engine.connect():
+            with pytest.raises(TimeoutError):
+                async with engine.connect():
+                    pass
+            return pool_stats(engine.pool)
+    finally:
+        await engine.dispose()
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    stats = asyncio.run(exhaust_pool(tmp_path / "pool.db"))
+
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["connects"] == 1
+    assert stats["wait_max_ms"] >= 50
+
+
+def test_sqlite_connections_enforce_foreign_keys():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        event.listen(engine.sync_engine, "connect", db_session._enable_sqlite_foreign_keys)
+        try:
+            async with engine.connect() as conn:
+                return await conn.scalar(text("PRAGMA foreign_keys"))
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_unpooled_engine_options_keep_driver_options():
+    pooled = db_session.engine_options("postgresql+asyncpg://user@localhost/db")
+    unpooled = db_session.engine_options("postgresql+asyncpg://user@localhost/db", pooled=False)
+
+    assert pooled["poolclass"] is InstrumentedQueuePool
+    assert unpooled["poolclass"] is NullPool
+    assert "pool_size" not in unpooled
+    assert unpooled["connect_args"] == pooled["connect_args"]
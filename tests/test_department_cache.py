@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from app.core.query_stats import assert_max_queries
+from app.db.models import Department
+from app.services.department_cache import DepartmentCache
+
+
+@pytest.fixture
+def run_with_departments(db_engine, session_factory, departments):
+    """기본 부서가 있는 DB에서 scenario(cache, db) 실행"""
+    def run(scenario):
+        async def main():
+            cache = DepartmentCache(engine=db_engine)
+            async with session_factory() as db:
+                return await scenario(cache, db)
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_cached_lookups_skip_database(run_with_departments):
+    async def scenario(cache, db):
+        first = await cache.all(db)
+        with assert_max_queries(0):
+            department = await cache.get(db, 2)
+            existing = await cache.existing_ids(db, {1, 2, 99})
+            missing = await cache.get(db, 99)
+        return first, department, existing, missing, cache.stats()
+
+    first, department, existing, missing, stats = run_with_departments(scenario)
+
+    assert [item["department_name"] for item in first] == ["행정팀", "인사팀"]
+    assert department["department_name"] == "인사팀"
+    assert existing == {1, 2}
+    assert missing is None
+    assert stats["loads"] == 1
+    assert stats["hits"] == 3
+
+
+def test_invalidate_reloads_on_next_lookup(run_with_departments):
+    async def scenario(cache, db):
+        await cache.all(db)
+        db.add(Department(department_name="총무팀"))
+        await db.commit()
+
+        stale = await cache.all(db)
+        cache.invalidate()
+        fresh = await cache.all(db)
+        return len(stale), len(fresh), cache.stats()["loads"]
+
+    stale, fresh, loads = run_with_departments(scenario)
+
+    assert (stale, fresh, loads) == (2, 3, 2)
+
+
+def test_load_discarded_when_invalidated_during_load(run_with_departments):
+    async def scenario(cache, db):
+        original_connection = db.connection
+
+        async def connection_then_invalidate(*args, **kwargs):
+            conn = await original_connection(*args, **kwargs)
+            cache.invalidate()
+            return conn
+
+        db.connection = connection_then_invalidate
+        departments = await cache.all(db)
+        return len(departments), cache.is_loaded
+
+    count, loaded = run_with_departments(scenario)
+
+    assert count == 2
+    assert not loaded
+
+
+def test_listener_connects_through_dedicated_engine(run_with_departments):
+    class FailingListenEngine:
+        connects = 0
+
+        def connect(self):
+            self.connects += 1
+            raise ConnectionError("수신 실패")
+
+    async def scenario(cache, db):
+        checkouts = []
+        event.listen(cache.engine.sync_engine, "checkout", lambda *args: checkouts.append(args))
+        listen_engine = FailingListenEngine()
+        listener = DepartmentCache(engine=cache.engine, listen_engine=listen_engine, reconnect_interval=0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(listener._listen(), 0.1)
+        return listen_engine.connects, len(checkouts)
+
+    connects, checkouts = run_with_departments(scenario)
+
+    assert connects >= 2
+    assert checkouts == 0
@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import BadRequestException
+from app.schemas.term_employee import TermEmployeeListItem
+from app.utils.fieldsets import parse_fields, partial_model
+
+
+def test_parse_fields_keeps_model_order():
+    assert parse_fields("status, name,name", TermEmployeeListItem) == ("name", "status")
+    assert parse_fields(None, TermEmployeeListItem) is None
+    assert parse_fields(" , ", TermEmployeeListItem) is None
+
+
+def test_parse_fields_rejects_unknown_field():
+    with pytest.raises(BadRequestException) as exc_info:
+        parse_fields("name,address", TermEmployeeListItem)
+
+    assert exc_info.value.error_code == "INVALID_FIELDS"
+    assert "address" in exc_info.value.detail
+
+
+def test_partial_model_reads_only_selected_attributes():
+    model = partial_model(TermEmployeeListItem, ("term_employee_id", "name"))
+    # 선택하지 않은 속성은 없어도 됨 (load_only로 조회하지 않은 컬럼)
+    row = SimpleNamespace(term_employee_id=1, name="홍길동")
+
+    assert model.model_validate(row).model_dump() == {"term_employee_id": 1, "name": "홍길동"}
+    assert partial_model(TermEmployeeListItem, ("term_employee_id", "name")) is model
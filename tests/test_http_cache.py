@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+from fastapi import Response
+from starlette.requests import Request
+
+from app.db.models import Department
+from app.utils.http_cache import conditional_response, http_date, make_collection_etag, make_etag, row_version
+
+
+def make_request(headers=None) -> Request:
+    raw_headers = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+def test_etag_is_strong_and_changes_with_version():
+    etag = make_etag("post", "post_1", "2024-01-01T00:00:00Z")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("post", "post_1", "2024-01-01T00:00:00Z")
+    assert etag != make_etag("post", "post_1", "2024-01-01T00:00:01Z")
+
+
+def test_collection_etag_reflects_deletion():
+    items = [(1, "2024-01-01"), (2, "2024-01-02")]
+
+    assert make_collection_etag(items) != make_collection_etag(items[1:])
+
+
+def test_row_version_changes_within_same_second():
+    updated_at = datetime(2024, 1, 1, 9, 0, 0)
+    before = Department(department_id=1, department_name="행정팀", updated_at=updated_at)
+    after = Department(department_id=1, department_name="총무팀", updated_at=updated_at)
+    cached = {"department_id": 1, "department_name": "행정팀", "updated_at": updated_at}
+
+    assert make_etag("department", *row_version(before)) != make_etag("department", *row_version(after))
+    assert "행정팀" in row_version(cached)
+
+
+def test_if_none_match_returns_304_with_headers():
+    etag = make_etag("x")
+    response = Response()
+
+    result = conditional_response(make_request({"If-None-Match": f'"other", W/{etag}'}), response, etag)
+
+    assert result.status_code == 304
+    assert result.headers["ETag"] == etag
+    assert response.headers["ETag"] == etag
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    request = make_request({"If-None-Match": '"other"', "If-Modified-Since": http_date(modified)})
+
+    assert conditional_response(request, Response(), make_etag("x"), modified) is None
+
+
+def test_if_modified_since_compares_seconds():
+    modified = datetime(2024, 1, 1, 0, 0, 0, 500000)
+    response = Response()
+    request = make_request({"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    assert conditional_response(request, response, make_etag("x"), modified).status_code == 304
+    assert response.headers["Last-Modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    request = make_request({"If-Modified-Since": "Sun, 31 Dec 2023 23:59:59 GMT"})
+    assert conditional_response(request, Response(), make_etag("x"), modified) is None
+
+
+def test_invalid_if_modified_since_ignored():
+    request = make_request({"If-Modified-Since": "yesterday"})
+
+    assert conditional_response(request, Response(), make_etag("x"), "2024-01-01T00:00:00Z") is None
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.middleware.rate_limit import get_client_ip
+from app.services.login_throttle import InMemoryThrottleBackend, LoginThrottle
+
+
+def make_throttle(**kwargs) -> LoginThrottle:
+    options = {"username_threshold": 3, "ip_threshold": 5, "base_lockout": 30, "max_lockout": 120}
+    options.update(kwargs)
+    return LoginThrottle(backend=InMemoryThrottleBackend(max_entries=100), **options)
+
+
+def test_username_locked_after_threshold():
+    """아이디별 실패 임계값 초과 시 잠금"""
+    throttle = make_throttle()
+
+    async def run():
+        for _ in range(3):
+            await throttle.check("user", "user123", "1.1.1.1")
+            await throttle.register_failure("user", "user123", "1.1.1.1")
+
+        # 다른 IP에서도 같은 아이디는 잠김
+        with pytest.raises(HTTPException) as exc_info:
+            await throttle.check("user", "USER123", "2.2.2.2")
+        assert exc_info.value.status_code == 429
+        assert 0 < int(exc_info.value.headers["Retry-After"]) <= 31
+
+        # 다른 아이디, 다른 스코프는 영향 없음
+        await throttle.check("user", "other", "2.2.2.2")
+        await throttle.check("manager", "user123", "2.2.2.2")
+
+    asyncio.run(run())
+    assert throttle.stats()["blocked_attempts"] == 1
+
+
+def test_ip_locked_for_credential_stuffing():
+    """여러 아이디로 시도하는 IP 잠금"""
+    throttle = make_throttle()
+
+    async def run():
+        for i in range(5):
+            await throttle.register_failure("user", f"victim{i}", "3.3.3.3")
+
+        with pytest.raises(HTTPException):
+            await throttle.check("user", "fresh-user", "3.3.3.3")
+
+    asyncio.run(run())
+
+
+def test_success_resets_username_failures():
+    """로그인 성공 시 아이디 실패 기록 초기화"""
+    throttle = make_throttle()
+
+    async def run():
+        for _ in range(2):
+            await throttle.register_failure("user", "user123", "1.1.1.1")
+        await throttle.register_success("user", "user123", "1.1.1.1")
+        await throttle.register_failure("user", "user123", "1.1.1.1")
+        await throttle.check("user", "user123", "1.1.1.1")
+
+    asyncio.run(run())
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    """인메모리 저장소 LRU 제거"""
+    backend = InMemoryThrottleBackend(max_entries=2)
+
+    async def run():
+        await backend.incr_failures("a", 60)
+        await backend.incr_failures("b", 60)
+        await backend.incr_failures("a", 60)
+        await backend.incr_failures("c", 60)
+        assert await backend.incr_failures("a", 60) == 3
+        assert await backend.incr_failures("b", 60) == 1
+
+    asyncio.run(run())
+    assert backend.size() == 2
+
+
+def make_request(peer: str, headers=None) -> Request:
+    raw_headers = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": raw_headers, "client": (peer, 50000)})
+
+
+def test_spoofed_forwarded_headers_ignored_without_trusted_proxy(monkeypatch):
+    """신뢰할 프록시가 아닌 상대가 보낸 X-Forwarded-For/X-Real-IP로 다른 IP를 잠그거나 우회할 수 없음"""
+    monkeypatch.setattr(settings, "trusted_proxies", [])
+    spoofed = {"X-Forwarded-For": "9.9.9.9", "X-Real-IP": "8.8.8.8"}
+
+    assert get_client_ip(make_request("1.1.1.1", spoofed)) == "1.1.1.1"
+
+    throttle = make_throttle()
+
+    async def run():
+        # 피해자 IP를 사칭한 실패는 공격자 IP로 기록
+        for _ in range(5):
+            await throttle.register_failure("user", "attacker", get_client_ip(make_request("1.1.1.1", spoofed)))
+        await throttle.check("user", "victim", "9.9.9.9")
+
+    asyncio.run(run())
+
+
+def test_forwarded_for_used_only_from_trusted_proxy(monkeypatch):
+    """신뢰할 프록시 뒤에서는 오른쪽부터 신뢰하지 않는 첫 주소 사용 (앞쪽 조작 값 무시)"""
+    monkeypatch.setattr(settings, "trusted_proxies", ["10.0.0.0/8"])
+    headers = {"X-Forwarded-For": "9.9.9.9, 2.2.2.2, 10.0.0.5"}
+
+    assert get_client_ip(make_request("10.0.0.1", headers)) == "2.2.2.2"
+    assert get_client_ip(make_request("10.0.0.1", {"X-Real-IP": "3.3.3.3"})) == "3.3.3.3"
+    assert get_client_ip(make_request("10.0.0.1")) == "10.0.0.1"
+    assert get_client_ip(make_request("1.1.1.1", headers)) == "1.1.1.1"
@@ -72,6 +72,13 @@ def test_metrics_endpoint():
     assert "service" in data
     assert "system" in data
     assert "database" in data
+    assert "event_loop" in data
+    assert "contract_expiry" in data
+    assert "database_pool" in data
+    assert "queries" in data
+    assert "department_cache" in data
+    assert "principal_cache" in data
+    assert "response_cache" in data
     assert data["service"]["name"] == "FestAPI"
 
 
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.config import settings
+from app.core.monitoring import EventLoopMonitor
+
+client = TestClient(app)
+
+
+def test_event_loop_monitor_detects_blocking_call():
+    """블로킹 호출 감지 및 request_id 수집 테스트"""
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05)
+
+    async def handler(scope):
+        time.sleep(0.2)
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await handler({"type": "http", "state": {"request_id": "req-123"}})
+        await asyncio.sleep(0.05)
+        monitor.stop()
+
+    asyncio.run(run())
+
+    snapshot = monitor.snapshot()
+    assert snapshot["samples"] > 0
+    assert snapshot["blocked_count"] == 1
+    report = snapshot["recent_blocks"][0]
+    assert report["request_id"] == "req-123"
+    assert report["duration_ms"] >= 150
+    assert any("time.sleep" in line for line in report["stack"])
+
+
+def test_request_profiling_with_token(monkeypatch):
+    """프로파일링 헤더로 요청 단위 프로파일 수집 테스트"""
+    monkeypatch.setattr(settings, "profiling_token", "secret-token")
+    headers = {"X-Profile-Token": "secret-token"}
+
+    response = client.get("/test", headers=headers)
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-ID"]
+    assert profile_id == response.headers["X-Request-ID"]
+
+    response = client.get(f"/admin/profiles/{profile_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+
+def test_profiling_requires_token(monkeypatch):
+    """잘못된 토큰으로는 프로파일링이 동작하지 않음"""
+    monkeypatch.setattr(settings, "profiling_token", "secret-token")
+
+    response = client.get("/test", headers={"X-Profile-Token": "wrong"})
+    assert "X-Profile-ID" not in response.headers
+
+    response = client.get("/admin/profiles", headers={"X-Profile-Token": "wrong"})
+    assert response.status_code == 403
+
+    # 비ASCII 헤더 값도 500이 아닌 거부로 처리
+    response = client.get("/admin/profiles", headers={"X-Profile-Token": "토큰".encode()})
+    assert response.status_code == 403
@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+
+from app.core.exceptions import BadRequestException
+from app.utils.pagination import cursor_value, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """커서 인코딩/디코딩"""
+    cursor = encode_cursor(["employment_end_date", "desc", date(2024, 12, 31), 42])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, size=4) == ["employment_end_date", "desc", "2024-12-31", 42]
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", encode_cursor([1, 2])])
+def test_invalid_cursor_rejected(cursor):
+    """형식이 맞지 않는 커서는 400"""
+    with pytest.raises(BadRequestException) as exc_info:
+        decode_cursor(cursor, size=4)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "value, expected_type, result",
+    [("홍길동", str, "홍길동"), (42, int, 42), ("2024-12-31", date, date(2024, 12, 31))],
+)
+def test_cursor_value_matches_column_type(value, expected_type, result):
+    """정렬 컬럼 타입에 맞는 커서 값은 그대로(날짜는 변환해서) 사용"""
+    assert cursor_value(value, expected_type) == result
+
+
+@pytest.mark.parametrize(
+    "value, expected_type",
+    [([1], str), ("x", int), (True, int), (1.5, int), ({"a": 1}, str), ("2024-13-01", date), (None, date)],
+)
+def test_cursor_value_type_mismatch_rejected(value, expected_type):
+    """조작된 커서 값은 DB 오류 대신 400"""
+    with pytest.raises(BadRequestException) as exc_info:
+        cursor_value(value, expected_type)
+    assert exc_info.value.error_code == "INVALID_CURSOR"
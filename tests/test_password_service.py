@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import password_service
+from app.services.password_service import (
+    ARGON2_PROFILES,
+    PasswordHashingPool,
+    PasswordService,
+    build_crypt_context,
+)
+
+
+def test_password_hash_and_verify_async():
+    """워커 풀을 통한 비밀번호 해싱/검증 테스트"""
+
+    async def run():
+        hashed = await PasswordService.hash_password_async("password1234")
+        assert await PasswordService.verify_password_async("password1234", hashed)
+        assert not await PasswordService.verify_password_async("wrong-password", hashed)
+
+    asyncio.run(run())
+
+
+def test_password_pool_rejects_when_queue_full():
+    """대기열이 가득 차면 503으로 거부"""
+    pool = PasswordHashingPool(max_workers=1, max_queue=1)
+
+    async def run():
+        first = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        second = asyncio.ensure_future(pool.run(time.sleep, 0.01))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(time.sleep, 0.01)
+        assert exc_info.value.status_code == 503
+        await asyncio.gather(first, second)
+
+    asyncio.run(run())
+    pool.shutdown()
+
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["active"] == 0
+
+
+def test_password_pool_releases_slots_of_cancelled_jobs():
+    """워커가 시작하기 전에 취소된 작업은 대기열 자리를 반환하고 실행되지 않음"""
+    pool = PasswordHashingPool(max_workers=1, max_queue=3)
+    calls = []
+
+    async def run():
+        running = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        waiting = [asyncio.ensure_future(pool.run(calls.append, i)) for i in range(2)]
+        await asyncio.sleep(0)
+        for task in waiting:
+            task.cancel()
+        await asyncio.gather(*waiting, return_exceptions=True)
+        await running
+        # 취소 후에도 대기열 한도까지 다시 받을 수 있어야 함
+        await asyncio.gather(*(pool.run(time.sleep, 0) for _ in range(3)))
+
+    asyncio.run(run())
+    pool.shutdown()
+
+    stats = pool.stats()
+    assert calls == []
+    assert stats["queue_depth"] == 0
+    assert stats["active"] == 0
+    assert stats["rejected"] == 0
+
+
+def test_verify_and_update_rehashes_legacy_hash(monkeypatch):
+    """해싱 스킴 변경 시 로그인 성공과 함께 재해싱"""
+    legacy_hash = build_crypt_context("bcrypt", bcrypt_rounds=4).hash("password1234")
+    argon2_context = build_crypt_context("argon2", argon2_params=ARGON2_PROFILES["low_memory"])
+    monkeypatch.setattr(password_service, "pwd_context", argon2_context)
+
+    async def run():
+        return await PasswordService.verify_and_update_password_async("password1234", legacy_hash)
+
+    verified, new_hash = asyncio.run(run())
+    assert verified
+    assert new_hash.startswith("$argon2id$")
+    assert not argon2_context.needs_update(new_hash)
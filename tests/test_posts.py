@@ -63,6 +63,31 @@ def test_create_post_with_auth(auth_headers):
     assert "created_at" in data
 
 
+def test_post_list_cache_invalidated_on_create(auth_headers):
+    """게시글 목록 캐시는 작성 시 무효화"""
+    client.get("/posts/?limit=1000")
+    cached = client.get("/posts/?limit=1000")
+    assert cached.headers["X-Cache"] == "HIT"
+
+    created = client.post("/posts/", json={"title": "캐시", "content": "무효화"}, headers=auth_headers).json()
+
+    response = client.get("/posts/?limit=1000")
+    assert response.headers["X-Cache"] == "MISS"
+    assert created["id"] in [post["id"] for post in response.json()]
+
+
+def test_get_posts_with_fields(auth_headers):
+    """필드를 지정한 게시글 목록 조회"""
+    client.post("/posts/", json={"title": "필드", "content": "선택"}, headers=auth_headers)
+
+    response = client.get("/posts/?fields=id,title")
+    assert response.status_code == 200
+    assert all(set(post) == {"id", "title"} for post in response.json())
+
+    response = client.get("/posts/?fields=id,password")
+    assert response.status_code == 400
+
+
 def test_get_post_by_id(auth_headers):
     """게시글 상세 조회"""
     # 먼저 게시글 생성
@@ -109,6 +134,36 @@ def test_update_post(auth_headers):
     assert data["content"] == "Original Content"
 
 
+def test_get_post_conditional(auth_headers):
+    """ETag/Last-Modified 조건부 조회"""
+    post_data = {
+        "title": "Cached Post",
+        "content": "Cached Content"
+    }
+    create_response = client.post("/posts/", json=post_data, headers=auth_headers)
+    post_id = create_response.json()["id"]
+
+    response = client.get(f"/posts/{post_id}")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    assert response.status_code == 200
+
+    # 변경이 없으면 본문 없는 304
+    response = client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get(f"/posts/{post_id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    # 수정 후에는 새 ETag로 200
+    client.put(f"/posts/{post_id}", json={"title": "Changed"}, headers=auth_headers)
+    response = client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
 def test_delete_post(auth_headers):
     """게시글 삭제"""
     # 게시글 생성
@@ -0,0 +1,58 @@
+from app.services import principal_cache as principal_cache_module
+from app.services.principal_cache import PrincipalCache
+
+
+def test_put_and_get_until_ttl_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", lambda: now[0])
+    cache = PrincipalCache(ttl=30)
+
+    assert cache.get("user", "hong") is None
+    cache.put("user", "hong", {"username": "hong"}, cache.generation)
+    assert cache.get("user", "hong") == {"username": "hong"}
+    assert cache.get("manager", "hong") is None
+
+    now[0] += 31
+    assert cache.get("user", "hong") is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_put_skipped_when_changed_during_lookup():
+    cache = PrincipalCache(ttl=30)
+
+    generation = cache.generation
+    cache.invalidate("user", "hong")
+    cache.put("user", "hong", {"manager_name": "이전"}, generation)
+
+    assert cache.get("user", "hong") is None
+
+
+def test_store_replaces_snapshot_after_write():
+    cache = PrincipalCache(ttl=30)
+    cache.put("user", "hong", {"manager_name": "이전"}, cache.generation)
+
+    cache.store("user", "hong", {"manager_name": "변경"})
+
+    assert cache.get("user", "hong") == {"manager_name": "변경"}
+
+
+def test_clear_by_role_and_lru_eviction():
+    cache = PrincipalCache(ttl=30, max_entries=2)
+    cache.store("user", "a", {})
+    cache.store("user", "b", {})
+    cache.store("manager", "c", {})
+
+    assert cache.get("user", "a") is None
+    assert cache.get("user", "b") == {}
+
+    cache.clear("user")
+    assert cache.get("user", "b") is None
+    assert cache.get("manager", "c") == {}
+
+
+def test_zero_ttl_disables_cache():
+    cache = PrincipalCache(ttl=0)
+    cache.put("user", "hong", {}, cache.generation)
+    cache.store("user", "hong", {})
+
+    assert cache.get("user", "hong") is None
@@ -0,0 +1,80 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.query_stats import QueryMonitor, assert_max_queries, query_monitor
+from app.middleware import QueryStatsMiddleware
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queries.db'}", poolclass=NullPool)
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/queries/{count}")
+    async def run_queries(count: int):
+        async with engine.connect() as conn:
+            for i in range(count):
+                await conn.execute(text("SELECT :i"), {"i": i})
+        return {"count": count}
+
+    return TestClient(app)
+
+
+def test_server_timing_header_counts_request_queries(client):
+    response = client.get("/queries/3")
+
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="3 queries"')
+
+
+def test_repeated_queries_are_reported(client, monkeypatch):
+    monkeypatch.setattr(query_monitor, "repeat_threshold", 5)
+    warnings_before = query_monitor.warning_count
+
+    client.get("/queries/6")
+
+    assert query_monitor.warning_count == warnings_before + 1
+    report = query_monitor.reports[-1]
+    assert report["path"] == "/queries/6"
+    assert report["repeated"][0]["count"] == 6
+
+
+def test_assert_max_queries(client):
+    with assert_max_queries(2) as stats:
+        client.get("/queries/2")
+    assert stats.count == 2
+
+    with pytest.raises(AssertionError, match="쿼리 3건 실행"):
+        with assert_max_queries(2):
+            client.get("/queries/3")
+
+
+def test_failed_query_releases_start_time():
+    engine = create_engine("sqlite://")
+
+    with query_monitor.capture() as stats:
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+
+            assert conn.info["query_started"] == []
+    assert stats.count == 2
+
+
+def test_query_monitor_snapshot():
+    monitor = QueryMonitor(count_threshold=1, repeat_threshold=2)
+    token = monitor.begin()
+    stats = monitor.end(token, "req-1", "GET", "/")
+
+    assert stats.count == 0
+    snapshot = monitor.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["warning_count"] == 0
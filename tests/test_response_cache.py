@@ -0,0 +1,107 @@
+import asyncio
+
+from app.core import response_cache as response_cache_module
+from app.core.response_cache import ResponseCache, normalize_query
+
+
+def counting_compute(bodies):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return bodies[len(calls) - 1]
+
+    return compute, calls
+
+
+def test_hit_after_first_compute():
+    async def scenario():
+        cache = ResponseCache(ttl=5, stale_ttl=30)
+        compute, calls = counting_compute([b"[1]"])
+        first = await cache.get_or_compute("posts", "limit=10", compute)
+        second = await cache.get_or_compute("posts", "limit=10", compute)
+        return first, second, len(calls)
+
+    first, second, calls = asyncio.run(scenario())
+
+    assert first == (b"[1]", "MISS")
+    assert second == (b"[1]", "HIT")
+    assert calls == 1
+
+
+def test_stale_entry_served_while_refreshing(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(response_cache_module.time, "monotonic", lambda: now[0])
+
+    async def scenario():
+        cache = ResponseCache(ttl=5, stale_ttl=30)
+        compute, calls = counting_compute([b"old", b"new"])
+        await cache.get_or_compute("posts", "", compute)
+
+        now[0] += 10
+        stale = await cache.get_or_compute("posts", "", compute)
+        again = await cache.get_or_compute("posts", "", compute)
+        await asyncio.gather(*cache._background)
+        fresh = await cache.get_or_compute("posts", "", compute)
+        return stale, again, fresh, len(calls)
+
+    stale, again, fresh, calls = asyncio.run(scenario())
+
+    assert stale == (b"old", "STALE")
+    assert again == (b"old", "STALE")
+    assert fresh == (b"new", "HIT")
+    assert calls == 2
+
+
+def test_concurrent_misses_share_one_compute():
+    async def scenario():
+        cache = ResponseCache()
+        compute, calls = counting_compute([b"[]"])
+        results = await asyncio.gather(*(cache.get_or_compute("posts", "", compute) for _ in range(5)))
+        return results, len(calls), cache.stats()
+
+    results, calls, stats = asyncio.run(scenario())
+
+    assert all(body == b"[]" for body, _ in results)
+    assert calls == 1
+    assert stats["coalesced"] == 4
+
+
+def test_result_discarded_when_invalidated_during_compute():
+    async def scenario():
+        cache = ResponseCache()
+
+        async def compute():
+            cache.invalidate("posts")
+            return b"old"
+
+        body, _ = await cache.get_or_compute("posts", "", compute)
+        return body, cache.stats()["size"]
+
+    body, size = asyncio.run(scenario())
+
+    assert body == b"old"
+    assert size == 0
+
+
+def test_compute_error_propagates_to_waiters():
+    async def scenario():
+        cache = ResponseCache()
+
+        async def compute():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        return await asyncio.gather(
+            *(cache.get_or_compute("posts", "", compute) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_normalize_query_sorts_and_drops_none():
+    assert normalize_query(skip=0, limit=10, q=None) == "limit=10&skip=0"
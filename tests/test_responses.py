@@ -0,0 +1,69 @@
+import json
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from app.utils import responses
+from app.utils.responses import (
+    FastJSONResponse,
+    dumps,
+    json_adapter,
+    json_response_class,
+    typed_json_response,
+)
+
+
+class Item(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    item_id: int
+    name: str
+    note: Optional[str] = None
+
+
+def test_dumps_matches_standard_json_output(monkeypatch):
+    content = {"name": "홍길동", "items": [1, 2.5, None, True]}
+
+    fast = dumps(content)
+    monkeypatch.setattr(responses, "orjson", None)
+
+    assert fast == dumps(content)
+    assert json.loads(fast) == content
+
+
+def test_fast_json_response_renders_bytes():
+    response = FastJSONResponse({"ok": True})
+
+    assert response.body == b'{"ok":true}'
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_typed_json_response_serializes_models_in_one_pass():
+    items = [Item(item_id=1, name="가"), Item(item_id=2, name="나", note="메모")]
+
+    response = typed_json_response(List[Item], items, headers={"X-Test": "1"})
+
+    assert json.loads(response.body) == [
+        {"item_id": 1, "name": "가", "note": None},
+        {"item_id": 2, "name": "나", "note": "메모"},
+    ]
+    assert response.headers["X-Test"] == "1"
+    assert json_adapter(List[Item]) is json_adapter(List[Item])
+
+
+def test_typed_json_response_from_attributes():
+    rows = [SimpleNamespace(item_id=1, name="가", note=None, extra="제외")]
+
+    response = typed_json_response(List[Item], rows, from_attributes=True)
+
+    assert json.loads(response.body) == [{"item_id": 1, "name": "가", "note": None}]
+
+
+def test_json_response_class_selection():
+    assert json_response_class("orjson") is FastJSONResponse
+    assert json_response_class("json") is JSONResponse
+    with pytest.raises(ValueError):
+        json_response_class("ujson")
@@ -0,0 +1,85 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import date
+
+from app.db.models.term_employee import EmploymentStatus
+from app.services.term_employee_export import EXPORT_COLUMNS, TermEmployeeExportService
+
+
+def make_row(employee_id: int) -> dict:
+    row = dict.fromkeys(EXPORT_COLUMNS)
+    row.update({
+        "term_employee_id": employee_id,
+        "name": f"홍길동{employee_id}",
+        "birthdate": date(1990, 1, 1),
+        "status": EmploymentStatus.ACTIVE,
+        "notes": "쉼표, 포함",
+    })
+    return row
+
+
+async def batches(*sizes):
+    employee_id = 0
+    for size in sizes:
+        batch = []
+        for _ in range(size):
+            employee_id += 1
+            batch.append(make_row(employee_id))
+        yield batch
+
+
+async def collect(stream) -> str:
+    return "".join([chunk async for chunk in stream])
+
+
+def test_csv_export_streams_batches():
+    """CSV 헤더 + 배치별 행"""
+    body = asyncio.run(collect(TermEmployeeExportService.to_csv(batches(2, 1))))
+
+    assert body.startswith("\ufeff")
+    rows = list(csv.reader(io.StringIO(body.lstrip("\ufeff"))))
+    assert rows[0] == EXPORT_COLUMNS
+    assert len(rows) == 4
+    record = dict(zip(rows[0], rows[3]))
+    assert record["name"] == "홍길동3"
+    assert record["birthdate"] == "1990-01-01"
+    assert record["status"] == "active"
+    assert record["notes"] == "쉼표, 포함"
+
+
+def test_csv_export_without_rows_sends_header():
+    """결과가 없으면 헤더만 전송"""
+    body = asyncio.run(collect(TermEmployeeExportService.to_csv(batches())))
+    assert body == "\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n"
+
+
+def test_ndjson_export_one_object_per_line():
+    """NDJSON 한 줄에 한 명"""
+    body = asyncio.run(collect(TermEmployeeExportService.to_ndjson(batches(2, 2))))
+
+    lines = body.splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[0])["status"] == "active"
+    assert json.loads(lines[3])["term_employee_id"] == 4
+
+
+def test_csv_export_neutralizes_formulas():
+    """수식 시작 문자로 시작하는 값은 CSV에서만 ' 를 붙여 문자열로 처리"""
+    row = make_row(1)
+    row.update({"name": "=HYPERLINK(\"http://x\")", "position": "+1", "notes": "@SUM(A1)", "address": "\t-1"})
+
+    async def one_batch():
+        yield [row]
+
+    body = asyncio.run(collect(TermEmployeeExportService.to_csv(one_batch())))
+    record = dict(zip(EXPORT_COLUMNS, list(csv.reader(io.StringIO(body.lstrip("\ufeff"))))[1]))
+    line = json.loads(asyncio.run(collect(TermEmployeeExportService.to_ndjson(one_batch()))))
+
+    assert record["name"] == "'=HYPERLINK(\"http://x\")"
+    assert record["position"] == "'+1"
+    assert record["notes"] == "'@SUM(A1)"
+    assert record["address"] == "'\t-1"
+    assert record["birthdate"] == "1990-01-01"
+    assert line["name"] == "=HYPERLINK(\"http://x\")"
@@ -0,0 +1,83 @@
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.query_stats import query_monitor
+from app.db.models import TermEmployee
+from app.db.session import get_read_db
+from app.routers import term_employee
+from app.services.term_employee_search import name_index
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def client(session_factory, departments):
+    async def setup():
+        async with session_factory() as db:
+            db.add_all([
+                TermEmployee(
+                    name=name,
+                    birthdate=date(1990, 1, 1),
+                    address="서울시",
+                    notes="비고",
+                    department_id=departments[0],
+                    employment_start_date=date(2024, 1, 1),
+                    employment_end_date=date(2024, 12, day),
+                )
+                for day, name in [(1, "홍길동"), (2, "홍길순"), (3, "김철수")]
+            ])
+            await db.commit()
+
+    async def get_test_db():
+        async with session_factory() as db:
+            yield db
+
+    asyncio.run(setup())
+    app = FastAPI()
+    app.include_router(term_employee.router)
+    app.dependency_overrides[get_read_db] = get_test_db
+    app.dependency_overrides[UserService.verify_token] = lambda: "user1"
+
+    name_index.clear()
+    yield TestClient(app)
+    name_index.clear()
+
+
+def selected_detail_columns(stats) -> list:
+    """실행된 문장 중 목록에서 제외해야 할 상세 컬럼을 조회한 문장"""
+    return [
+        statement for statement in stats.statements
+        if "term_employees.address" in statement or "term_employees.notes" in statement
+    ]
+
+
+def test_list_fields_select_only_requested_columns(client):
+    """fields와 정렬 컬럼만 조회하고, 커서 값은 추가 조회 없이 만듦"""
+    params = {"fields": "name", "sort_by": "employment_end_date", "limit": 2}
+
+    with query_monitor.capture() as stats:
+        first = client.get("/term-employees", params=params)
+        second = client.get("/term-employees", params={**params, "cursor": first.json()["next_cursor"]})
+
+    assert first.status_code == 200
+    assert first.json()["items"] == [{"name": "홍길동"}, {"name": "홍길순"}]
+    assert second.json()["items"] == [{"name": "김철수"}]
+    assert not second.json()["has_more"]
+    assert stats.count == 2
+    assert selected_detail_columns(stats) == []
+
+
+def test_search_fields_select_only_requested_columns(client):
+    """검색도 요청한 필드만 조회"""
+    with query_monitor.capture() as stats:
+        response = client.get("/term-employees/search", params={"name": "홍길", "fields": "name,birthdate"})
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"name": "홍길동", "birthdate": "1990-01-01"},
+        {"name": "홍길순", "birthdate": "1990-01-01"},
+    ]
+    assert selected_detail_columns(stats) == []
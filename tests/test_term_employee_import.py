@@ -0,0 +1,125 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import delete, func, select
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.core.messages import ErrorMessages
+from app.db.models import Department, TermEmployee
+from app.services.department_cache import department_cache
+from app.services.term_employee_import import TermEmployeeImportService
+
+
+def make_upload(filename: str, content: str, encoding: str = "utf-8") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content.encode(encoding)), filename=filename)
+
+
+def test_csv_rows_mapped_from_korean_headers():
+    """한글 항목명 헤더 매핑 및 행 검증"""
+    content = (
+        "이름,생년월일,부서 ID,재직기간 시작,재직기간 종료,비고\n"
+        "홍길동,1990-01-01,1,2024-01-01,2024-12-31,\n"
+        "\n"
+        "김철수,1990-13-01,1,2024-01-01,2024-12-31,계약\n"
+    )
+    rows = list(TermEmployeeImportService.open_rows(make_upload("staff.csv", content, "cp949"), "cp949"))
+
+    assert [line_num for line_num, _ in rows] == [2, 4]
+    assert rows[0][1] == {
+        "name": "홍길동",
+        "birthdate": "1990-01-01",
+        "department_id": "1",
+        "employment_start_date": "2024-01-01",
+        "employment_end_date": "2024-12-31",
+    }
+
+    valid, errors = TermEmployeeImportService._validate_chunk(rows)
+    assert [line_num for line_num, _ in valid] == [2]
+    assert errors[0]["row"] == 4
+    assert errors[0]["field"] == "birthdate"
+
+
+def test_missing_required_columns_rejected():
+    """필수 컬럼 누락 시 400"""
+    rows = TermEmployeeImportService.open_rows(make_upload("staff.csv", "name,birthdate\n"))
+
+    with pytest.raises(BadRequestException) as exc_info:
+        list(rows)
+    assert exc_info.value.error_code == "IMPORT_MISSING_COLUMNS"
+
+
+def test_unsupported_file_rejected():
+    """CSV/XLSX 외 파일 거부"""
+    with pytest.raises(BadRequestException):
+        TermEmployeeImportService.open_rows(make_upload("staff.txt", "name\n"))
+
+
+def raw_row(line_num: int, department_id: int, birthdate: str = "1990-01-01"):
+    return line_num, {
+        "name": f"직원{line_num}",
+        "birthdate": birthdate,
+        "department_id": str(department_id),
+        "employment_start_date": "2024-01-01",
+        "employment_end_date": "2024-12-31",
+    }
+
+
+@pytest.fixture
+def run_import(session_factory, departments, monkeypatch):
+    """청크 크기 2로 import_rows 실행 후 (결과, 등록된 인원 수) 반환"""
+    monkeypatch.setattr(settings, "term_employee_import_chunk_size", 2)
+    monkeypatch.setattr(department_cache, "enabled", True)
+    department_cache.invalidate()
+
+    def run(rows, dry_run=False, before=None):
+        async def main():
+            async with session_factory() as db:
+                if before is not None:
+                    await before(db)
+                result = await TermEmployeeImportService.import_rows(db, iter(rows), dry_run=dry_run)
+                await db.commit()
+                count = await db.scalar(select(func.count()).select_from(TermEmployee))
+                return result, count
+
+        return asyncio.run(main())
+
+    yield run
+    department_cache.invalidate()
+
+
+def test_import_rows_skips_invalid_rows_in_chunk(run_import):
+    """오류 행만 건너뛰고 같은 청크의 나머지는 적재"""
+    rows = [raw_row(2, 1), raw_row(3, 1, birthdate="1990-13-01"), raw_row(4, 99), raw_row(5, 2)]
+
+    result, count = run_import(rows)
+
+    assert (result["total_rows"], result["imported"], result["failed"]) == (4, 2, 2)
+    assert [(error["row"], error["field"]) for error in result["errors"]] == [(3, "birthdate"), (4, "department_id")]
+    assert count == 2
+
+
+def test_import_rows_dry_run_does_not_insert(run_import):
+    """dry_run은 검증 결과만 보고"""
+    result, count = run_import([raw_row(2, 1), raw_row(3, 99)], dry_run=True)
+
+    assert (result["imported"], result["failed"], result["dry_run"]) == (1, 1, True)
+    assert count == 0
+
+
+def test_import_rows_rechecks_departments_deleted_behind_cache(run_import):
+    """캐시에 남은 삭제된 부서는 외래 키 오류 대신 INVALID_DEPARTMENT로 보고"""
+    async def delete_department_after_caching(db):
+        await department_cache.all(db)
+        await db.execute(delete(Department).where(Department.department_id == 2))
+        await db.commit()
+
+    rows = [raw_row(2, 1), raw_row(3, 2), raw_row(4, 1)]
+    result, count = run_import(rows, before=delete_department_after_caching)
+
+    assert (result["imported"], result["failed"]) == (2, 1)
+    assert result["errors"] == [{"row": 3, "field": "department_id", "message": ErrorMessages.INVALID_DEPARTMENT}]
+    assert count == 2
+    assert not department_cache.is_loaded
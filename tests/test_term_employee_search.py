@@ -0,0 +1,54 @@
+from app.services.term_employee_search import NGramIndex, similarity, trigrams
+from app.utils.hangul import is_chosung_query, normalize_name, to_chosung
+
+
+def make_index(names) -> NGramIndex:
+    index = NGramIndex()
+    index.loaded = True
+    for employee_id, name in names.items():
+        index.upsert(employee_id, name)
+    return index
+
+
+def test_trigrams_match_pg_trgm_padding():
+    """pg_trgm과 같은 패딩으로 트라이그램 추출"""
+    assert trigrams("cat") == {"  c", " ca", "cat", "at "}
+    assert similarity(trigrams("홍길동"), trigrams("홍길동")) == 1.0
+
+
+def test_search_ranks_by_similarity():
+    """부분 일치 및 유사도 순 정렬"""
+    index = make_index({1: "홍길동", 2: "홍길순", 3: "김철수", 4: "홍길동이"})
+
+    # 완전 일치 > 부분 일치 > 유사 이름 순
+    assert index.search("홍길동", threshold=0.3) == [1, 4, 2]
+    assert index.search("홍길동", threshold=0.5) == [1, 4]
+    # 3글자 미만 검색어는 부분 일치로 처리 (동점은 이름 순)
+    assert index.search("길", threshold=0.3) == [1, 4, 2]
+    assert index.search("홍길동", threshold=0.3, limit=1) == [1]
+
+
+def test_upsert_and_remove_update_postings():
+    """이름 변경/삭제 반영"""
+    index = make_index({1: "홍길동"})
+
+    index.upsert(1, "김철수")
+    assert index.search("홍길동", threshold=0.3) == []
+    assert index.search("김철수", threshold=0.3) == [1]
+
+    index.remove(1)
+    assert index.search("김철수", threshold=0.3) == []
+
+
+def test_normalize_name_and_chosung():
+    """공백/전각 정규화 및 초성 변환"""
+    assert normalize_name(" 홍 길동 ") == "홍길동"
+    assert normalize_name("ＨＯＮＧ Gil") == "honggil"
+    assert to_chosung("홍길동") == "ㅎㄱㄷ"
+    assert to_chosung("Kim 철수") == "kimㅊㅅ"
+
+    assert is_chosung_query("ㅎㄱㄷ")
+    assert is_chosung_query("ㅎ ㄱ")
+    # 반각 자모도 초성으로 인식
+    assert is_chosung_query("\uffbe\uffa1")  # ﾾﾡ
+    assert not is_chosung_query("홍ㄱ")
@@ -0,0 +1,89 @@
+import asyncio
+import os
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.models import Department, EmploymentStatus, TermEmployee, TermEmployeeSummary
+from app.services.term_employee_summary import TermEmployeeSummaryService
+
+
+def employee(name, department_id, employee_status=EmploymentStatus.ACTIVE):
+    return TermEmployee(
+        name=name,
+        birthdate=date(1990, 1, 1),
+        department_id=department_id,
+        employment_start_date=date(2024, 1, 1),
+        employment_end_date=date(2024, 12, 31),
+        status=employee_status,
+    )
+
+
+async def summaries(db):
+    result = await db.execute(select(TermEmployeeSummary).order_by(TermEmployeeSummary.department_id))
+    return {row.department_id: (row.active_count, row.on_leave_count) for row in result.scalars().all()}
+
+
+def test_refresh_updates_existing_rows_and_zeroes_empty_departments(session_factory, departments):
+    async def scenario():
+        async with session_factory() as db:
+            db.add_all([employee("가", 1), employee("나", 1, EmploymentStatus.ON_LEAVE), employee("다", 2)])
+            await TermEmployeeSummaryService.refresh(db, today=date(2024, 7, 1))
+            await db.commit()
+            before = await summaries(db)
+
+            await db.execute(delete(TermEmployee).where(TermEmployee.department_id == 2))
+            db.add(employee("라", 1))
+            await TermEmployeeSummaryService.refresh(db, [1, 2], today=date(2024, 7, 1))
+            await db.commit()
+            return before, await summaries(db)
+
+    before, after = asyncio.run(scenario())
+
+    assert before == {1: (1, 1), 2: (1, 0)}
+    assert after == {1: (2, 1), 2: (0, 0)}
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL 미설정")
+def test_concurrent_refresh_of_same_department_is_serialized():
+    """READ COMMITTED에서 같은 부서를 동시에 갱신해도 실패하지 않고 두 변경을 모두 반영"""
+    async def scenario():
+        engine = create_async_engine(os.environ["TEST_POSTGRES_URL"])
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with session_factory() as db:
+                db.add(Department(department_name="행정팀"))
+                await db.commit()
+                department_id = (await db.execute(select(Department.department_id))).scalar_one()
+
+            async with session_factory() as first, session_factory() as second:
+                first.add(employee("가", department_id))
+                await TermEmployeeSummaryService.refresh(first, [department_id])
+
+                # 두 번째 트랜잭션은 첫 번째가 커밋할 때까지 부서 잠금에서 대기
+                second.add(employee("나", department_id))
+                pending = asyncio.create_task(TermEmployeeSummaryService.refresh(second, [department_id]))
+                await asyncio.sleep(0.2)
+                assert not pending.done()
+
+                await first.commit()
+                await pending
+                await second.commit()
+
+            async with session_factory() as db:
+                return await summaries(db), department_id
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+    result, department_id = asyncio.run(scenario())
+
+    assert result == {department_id: (2, 0)}
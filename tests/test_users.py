@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+
+from app.core.database import InMemoryDB, db
+from app.main import app
+from app.services import AuthService
+
+client = TestClient(app)
+
+
+def make_user(store, email, provider="google", verified=True):
+    return store.create_user({
+        "id": f"{provider}_{email}",
+        "email": email,
+        "name": email.split("@")[0],
+        "verified_email": verified,
+        "provider": provider,
+        "provider_id": email,
+    })
+
+
+def test_list_users_pages_in_email_order():
+    store = InMemoryDB()
+    for email in ["c@example.com", "a@example.com", "b@example.com"]:
+        make_user(store, email)
+
+    first, has_more = store.list_users(limit=2)
+    rest, last_has_more = store.list_users(after=first[-1].email, limit=2)
+
+    assert [user.email for user in first] == ["a@example.com", "b@example.com"]
+    assert has_more
+    assert [user.email for user in rest] == ["c@example.com"]
+    assert not last_has_more
+
+
+def test_list_users_filters_by_provider_and_verified():
+    store = InMemoryDB()
+    make_user(store, "a@example.com", provider="kakao")
+    make_user(store, "b@example.com", provider="naver")
+    make_user(store, "c@example.com", provider="kakao", verified=False)
+    # 같은 이메일로 다시 가입하면 제공자 인덱스도 갱신
+    make_user(store, "b@example.com", provider="kakao")
+
+    kakao, _ = store.list_users(provider="kakao")
+    verified, _ = store.list_users(provider="kakao", verified_email=True)
+    naver, _ = store.list_users(provider="naver")
+
+    assert [user.email for user in kakao] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert [user.email for user in verified] == ["a@example.com", "b@example.com"]
+    assert naver == []
+
+
+def test_get_users_follows_cursor():
+    for index in range(3):
+        make_user(db, f"apple{index}@example.com", provider="apple")
+    tokens = AuthService.create_tokens("apple0@example.com")
+    db.add_session(tokens["access_token"], "apple0@example.com")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    first = client.get("/users/?provider=apple&limit=2&fields=email", headers=headers).json()
+    second = client.get(f"/users/?provider=apple&limit=2&cursor={first['next_cursor']}", headers=headers).json()
+
+    assert first["items"] == [{"email": "apple0@example.com"}, {"email": "apple1@example.com"}]
+    assert first["has_more"]
+    assert [user["email"] for user in second["items"]] == ["apple2@example.com"]
+    assert second["next_cursor"] is None
+
+
+def test_get_users_rejects_invalid_cursor():
+    make_user(db, "cursor@example.com", provider="naver")
+    tokens = AuthService.create_tokens("cursor@example.com")
+    db.add_session(tokens["access_token"], "cursor@example.com")
+
+    response = client.get(
+        "/users/?cursor=WzFd", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+
+    assert response.status_code == 400